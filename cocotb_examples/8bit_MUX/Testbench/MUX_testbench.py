@@ -9,9 +9,15 @@
 # Libraries
 
 import cocotb
-import random 
+import time
+import numpy as np
 from cocotb.triggers import Timer
+from cocotb.triggers import Edge, First, ReadOnly
 from cocotb.clock import Clock
+from verification_tools.coverage import covergroup, write_coverage
+from verification_tools.stimulus_pool import stimulus_pool
+from verification_tools.wave_policy import wave_policy
+from mux_reference_model import *
 
 ##########################################################################################################################################################################
 
@@ -27,6 +33,30 @@ RESET_TIME = 35 # ns
 # Test duration
 TEST_DURATION = 1000 # ns
 
+# Sweep mode: when True, the test_exhaustive_sweep test drives every (rst, sel, inpt) combination, waiting SWEEP_SETTLE_TIME for the output of each one, and
+# checks them all at once. It runs besides the random test_function, being skipped when False
+EXHAUSTIVE_SWEEP_MODE = True
+SWEEP_SETTLE_TIME = 1 # ps
+
+# Number of mismatching combinations printed when the sweep fails
+SWEEP_REPORTED_MISMATCHES = 8
+
+# Event-driven check mode: when True, the random test_function checks the output once after every change of inpt, sel or rst, in the ReadOnly phase, instead of
+# polling it every CLOCK_PERIOD
+EVENT_DRIVEN_CHECK_MODE = True
+
+# Wave policy (make WAVES=policy): allow-list of the dumped signals and window of the dump, in ns since the start of the test, WAVE_STOP None being the end of the test
+WAVE_SIGNALS = ["sel", "inpt", "rst", "outpt"]
+WAVE_START = 0
+WAVE_STOP = None
+
+# Functional coverage: every (sel, rst) combination of the checked input values, reported (and written into COVERAGE_DIR, if set) at the end of the test
+COVERAGE_AXES = [("sel", 8), ("rst", 2)]
+
+# Stimulus pools of the mux input and selector values, seeded from RANDOM_SEED
+input_pool = stimulus_pool("mux_8bit_input", 0, 2**8 - 1)
+selector_pool = stimulus_pool("mux_8bit_selector", 0, 7)
+
 ##########################################################################################################################################################################
 
 ##########################################################################################################################################################################
@@ -53,19 +83,19 @@ async def mux_stimulus_function(dut):
     clk_cycles_counter = 0
 
     # Chooses a random value for the mux input
-    dut.inpt.setimmediatevalue(cocotb.binary.BinaryValue(value=random.randint(0, 2**8 - 1), n_bits=8))
+    dut.inpt.setimmediatevalue(input_pool.next())
 
     # Chooses a random value for the selector
-    dut.sel.setimmediatevalue(cocotb.binary.BinaryValue(value=random.randint(0, 7), n_bits=3))
+    dut.sel.setimmediatevalue(selector_pool.next())
 
     # Starts the reset
-    dut.rst.setimmediatevalue(cocotb.binary.BinaryValue(value=1, n_bits=1))
+    dut.rst.setimmediatevalue(1)
 
     # Awaits for the reset time
     await Timer(RESET_TIME, units='ns')
 
     # Stops the reset
-    dut.rst.setimmediatevalue(cocotb.binary.BinaryValue(value=0, n_bits=1))
+    dut.rst.setimmediatevalue(0)
 
     # Awaits for a small time to avoid any conflict
     await Timer(1, units='ps')
@@ -74,10 +104,10 @@ async def mux_stimulus_function(dut):
     while clk_cycles_counter <= (TEST_DURATION) / CLOCK_PERIOD:
 
         # Chooses a random value for the mux input
-        dut.inpt.setimmediatevalue(cocotb.binary.BinaryValue(value=random.randint(0, 2**8 - 1), n_bits=8))
+        dut.inpt.setimmediatevalue(input_pool.next())
 
         # Chooses a random value for the selector
-        dut.sel.setimmediatevalue(cocotb.binary.BinaryValue(value=random.randint(0, 7), n_bits=3))
+        dut.sel.setimmediatevalue(selector_pool.next())
 
         # Awaits for a clock period
         await Timer(CLOCK_PERIOD, units='ns')
@@ -86,9 +116,107 @@ async def mux_stimulus_function(dut):
         clk_cycles_counter += 1
 
 
+async def mux_exhaustive_sweep(dut, coverage):
+
+    # Obtains every (rst, sel, inpt) combination, inpt changing the fastest
+    combinations = np.arange(2 ** (1 + 3 + 8))
+    input_values = combinations & 0xFF
+    selector_values = (combinations >> 8) & 0x7
+    reset_values = combinations >> 11
+
+    # Initializes the observed outputs and the last driven selector and reset, which are only driven when they change
+    observed_outputs = []
+    driven_selector = driven_reset = None
+    start_time = time.perf_counter()
+
+    # Drives every combination and samples the output after the settle time
+    for input_int, selector_int, reset_int in zip(input_values.tolist(), selector_values.tolist(), reset_values.tolist()):
+
+        dut.inpt.value = input_int
+
+        if selector_int != driven_selector:
+            dut.sel.value = driven_selector = selector_int
+
+        if reset_int != driven_reset:
+            dut.rst.value = driven_reset = reset_int
+
+        await Timer(SWEEP_SETTLE_TIME, units='ps')
+        observed_outputs.append(dut.outpt.value.binstr)
+
+    # Checks every combination at once against the expected outputs
+    expected_outputs = np.where(mux_expected_output(input_values, selector_values, reset_values), "1", "0")
+    mismatches = np.flatnonzero(np.array(observed_outputs) != expected_outputs)
+
+    # Samples the coverage of every combination at once
+    coverage.sample_array(selector_values, reset_values)
+
+    dut._log.info(f"Exhaustive sweep: {len(combinations)} combinations checked in {time.perf_counter() - start_time:.3f} s, {len(mismatches)} mismatch(es)")
+
+    # Logs the first mismatching combinations, if any
+    for index in mismatches[:SWEEP_REPORTED_MISMATCHES]:
+        dut._log.error(f"Mismatch: rst {reset_values[index]}, sel {selector_values[index]}, inpt {input_values[index]:08b}: output {observed_outputs[index]}, expected {expected_outputs[index]}")
+
+    assert len(mismatches) == 0, f"The value of the mux output is not equal to the expected value for {len(mismatches)} combination(s)"
+
+
+async def mux_event_driven_checker(dut, check_counter, coverage):
+
+    # Initializes the trigger of any input change
+    input_change = First(Edge(dut.inpt), Edge(dut.sel), Edge(dut.rst))
+
+    while True:
+
+        # Waits for a change of any input, and for the end of its time step, so every input written in it is settled
+        await input_change
+        await ReadOnly()
+
+        # Obtains the expected value for the mux output
+        input_int, selector_int, reset_int = dut.inpt.value.integer, dut.sel.value.integer, dut.rst.value.integer
+        expected_value = mux_expected_output(input_int, selector_int, reset_int)
+
+        # Checks if the value of the mux output is equal to the expected value
+        assert dut.outpt.value.integer == expected_value, f"The value of the mux output is {dut.outpt.value.binstr} and should be {expected_value} (rst {reset_int}, sel {selector_int}, inpt {input_int:08b})"
+
+        check_counter[0] += 1
+        coverage.sample(selector_int, reset_int)
+
+
+@cocotb.test(skip=not EXHAUSTIVE_SWEEP_MODE)
+async def test_exhaustive_sweep(dut):
+
+    # Starts the wave policy, which dumps the allow-listed signals inside its window when enabled
+    wave_policy(dut, WAVE_SIGNALS, "test_exhaustive_sweep", WAVE_START, WAVE_STOP).start()
+
+    # Initializes the functional coverage
+    coverage = covergroup("mux_8bit_sel_x_rst", COVERAGE_AXES)
+
+    # Runs the exhaustive sweep and reports the functional coverage
+    await mux_exhaustive_sweep(dut, coverage)
+    write_coverage([coverage], "test_exhaustive_sweep")
+
+
 @cocotb.test()
 async def test_function(dut):
 
+    # Starts the wave policy, which dumps the allow-listed signals inside its window when enabled
+    wave_policy(dut, WAVE_SIGNALS, "test_function", WAVE_START, WAVE_STOP).start()
+
+    # Initializes the functional coverage
+    coverage = covergroup("mux_8bit_sel_x_rst", COVERAGE_AXES)
+
+    # Runs the random test with the event-driven checker, which is started before the stimulus so it sees the initial values
+    if EVENT_DRIVEN_CHECK_MODE:
+
+        check_counter = [0]
+        checker = cocotb.start_soon(mux_event_driven_checker(dut, check_counter, coverage))
+        await cocotb.start_soon(mux_stimulus_function(dut))
+        checker.kill()
+
+        dut._log.info(f"Event-driven check: {check_counter[0]} input change(s) checked")
+        assert check_counter[0] > 0, "No input change was checked"
+        write_coverage([coverage], "test_function")
+        return
+
     # Initializes the stimulus function
     await cocotb.start(mux_stimulus_function(dut))
 
@@ -109,6 +237,7 @@ async def test_function(dut):
 
             # Checks if the value of the mux output is 0
             assert dut.outpt.value.integer == 0, "The value of the mux output is not 0"
+            coverage.sample(dut.sel.value.integer, 1)
 
         # Checks if the clock cycles counter is in TEST state
         if clk_cycles_counter >= RESET_TIME / CLOCK_PERIOD and clk_cycles_counter <= (RESET_TIME + TEST_DURATION) / CLOCK_PERIOD:
@@ -118,6 +247,7 @@ async def test_function(dut):
 
             # Checks if the value of the mux output is equal to the expected value
             assert dut.outpt.value.integer == expected_value, "The value of the mux output is not equal to the expected value"
+            coverage.sample(dut.sel.value.integer, 0)
 
             print(f"Input value: {dut.inpt.value.binstr}")
             print(f"Selector value: {dut.sel.value.integer}")
@@ -125,6 +255,9 @@ async def test_function(dut):
             print(f"Output value: {dut.outpt.value.integer}")
             print("\n", end="")
 
+    # Reports the functional coverage
+    write_coverage([coverage], "test_function")
+
     return
 
 
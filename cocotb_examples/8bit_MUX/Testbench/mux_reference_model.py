@@ -0,0 +1,20 @@
+##########################################################################################################################################################################
+# mux_reference_model.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the reference model of the mux_8bit module, shared by the testbench and by the offline checker of verification_tools.
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Reference model functions
+
+def mux_expected_output(input_int, selector_int, reset_int):
+# Description: this function computes the outpt value of the multiplexer, selecting the input bit with integer bit operations and forcing 0 during the reset.
+# It works on integers and on NumPy arrays alike.
+# Parameters: input_int: inpt value; selector_int: sel value; reset_int: rst value.
+# Returns: The expected outpt value.
+
+    return ((input_int >> selector_int) & 1) & (reset_int ^ 1)
+
+##########################################################################################################################################################################
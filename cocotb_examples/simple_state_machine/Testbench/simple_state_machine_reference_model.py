@@ -0,0 +1,111 @@
+##########################################################################################################################################################################
+# simple_state_machine_reference_model.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the integer-encoded reference model of the simple_state_machine module. The t_states enumeration is encoded as small integers and the
+# transitions as a flat array, so the expected output trace of a whole stimulus vector is computed at once with NumPy, before the simulation.
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import math
+import numpy as np
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constants for the t_states enumeration, in declaration order, and their names
+RESET, IDLE, STATE1, STATE2, STATE3 = range(5)
+STATE_NAMES = ("RESET", "IDLE", "STATE1", "STATE2", "STATE3")
+STATES_NUM = len(STATE_NAMES)
+
+## Constant for the flat transition array, without the reset: the next state of (state, inpt) is TRANSITIONS[state * 2 + inpt]
+TRANSITIONS = np.array([
+    RESET,  IDLE,       # RESET
+    IDLE,   STATE1,     # IDLE
+    STATE1, STATE2,     # STATE1
+    STATE2, STATE3,     # STATE2
+    STATE3, IDLE,       # STATE3
+], dtype=np.uint8)
+
+## Constant for the output of every state
+OUTPUTS = np.array([0, 1, 0, 1, 0], dtype=np.uint8)
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Reference model functions
+
+def simple_state_machine_state_trace(inputs, resets, initial_state=RESET):
+# Description: this function computes the state of the machine after every rising edge of the clock. Every cycle is a map from the previous state to the next
+# one (a constant map to RESET when the reset is asserted). The cycles are split in about sqrt(cycles) blocks, whose maps are composed and then expanded with
+# one vectorized step per block position, leaving only the chaining of the blocks to Python.
+# Parameters: inputs: inpt value sampled on every rising edge; resets: rst value on every cycle; initial_state: state before the first rising edge.
+# Returns: A uint8 array with the state after every rising edge.
+
+    inputs = np.asarray(inputs, dtype=np.uint8)
+    resets = np.asarray(resets, dtype=bool)
+    cycles = len(inputs)
+
+    # Obtains the block length and the number of blocks
+    block_length = max(1, math.isqrt(cycles))
+    blocks = -(-cycles // block_length)
+
+    # Builds the map of every cycle, with one column per previous state, padding the last block with identity maps
+    maps = np.empty((blocks * block_length, STATES_NUM), dtype=np.uint8)
+    maps[:cycles] = TRANSITIONS.reshape(STATES_NUM, 2)[:, inputs].T
+    maps[:cycles][resets] = RESET
+    maps[cycles:] = np.arange(STATES_NUM)
+
+    # Lays the maps out by block position, so every step reads a contiguous row with the maps of all the blocks
+    maps = np.ascontiguousarray(maps.reshape(blocks, block_length, STATES_NUM).transpose(1, 0, 2)).reshape(block_length, blocks * STATES_NUM)
+    block_offsets = np.arange(0, blocks * STATES_NUM, STATES_NUM, dtype=np.intp)
+
+    # Composes the maps of every block, for all the blocks at once
+    composed = np.tile(np.arange(STATES_NUM, dtype=np.intp), blocks)
+    map_offsets = np.repeat(block_offsets, STATES_NUM)
+    for position in range(block_length):
+        composed = maps[position][map_offsets + composed]
+
+    # Chains the blocks, obtaining the state before every one of them
+    block_states = []
+    state = initial_state
+    for block_map in composed.reshape(blocks, STATES_NUM).tolist():
+        block_states.append(state)
+        state = block_map[state]
+
+    # Expands the states inside every block, for all the blocks at once
+    current = np.array(block_states, dtype=np.intp)
+    states = np.empty((block_length, blocks), dtype=np.uint8)
+    for position in range(block_length):
+        current = maps[position][block_offsets + current]
+        states[position] = current
+
+    # Returns the states in cycle order
+    return states.T.ravel()[:cycles]
+
+
+def simple_state_machine_expected_outputs(inputs, resets, initial_state=RESET):
+# Description: this function computes the outpt value expected on every rising edge of the clock, before the edge updates the state. The reset is asynchronous,
+# so a cycle with rst asserted shows the RESET output.
+# Parameters: inputs: inpt value sampled on every rising edge; resets: rst value on every cycle; initial_state: state before the first rising edge.
+# Returns: A tuple with the uint8 arrays of the expected outputs and of the state shown on every rising edge.
+
+    resets = np.asarray(resets, dtype=bool)
+
+    # The state shown on a rising edge is the one after the previous edge, or RESET during the reset
+    states = np.empty(len(resets), dtype=np.uint8)
+    states[:1] = initial_state
+    states[1:] = simple_state_machine_state_trace(inputs, resets, initial_state)[:-1]
+    states[resets] = RESET
+
+    # Returns the outputs of the shown states
+    return OUTPUTS[states], states
+
+##########################################################################################################################################################################
@@ -14,6 +14,13 @@ from cocotb.triggers import Timer
 from cocotb.clock import Clock
 from cocotb.triggers import *
 from cocotb.binary import *
+import math
+import numpy as np
+from simple_state_machine_reference_model import *
+from verification_tools.cycle_dispatcher import cycle_dispatcher
+from verification_tools.coverage import covergroup, write_coverage
+from verification_tools.stimulus_pool import stimulus_pool
+from verification_tools.wave_policy import wave_policy
 
 ##########################################################################################################################################################################
 
@@ -29,29 +36,49 @@ RESET_TIME = 35 # ns
 # Test duration
 TEST_DURATION = 1000 # ns
 
+# Dispatcher mode: when True, the stimulus and the expected output trace are computed before the simulation, and a single cycle dispatcher checks and drives
+# them every rising edge
+CYCLE_DISPATCHER_MODE = True
+
+# Wave policy (make WAVES=policy): allow-list of the dumped signals and window of the dump, in ns since the start of the test, WAVE_STOP None being the end of the test
+WAVE_SIGNALS = ["clk", "rst", "inpt", "outpt"]
+WAVE_START = 0
+WAVE_STOP = None
+
+# Functional coverage: every t_states transition, as the state before a rising edge without reset and the sampled inpt, reported (and written into
+# COVERAGE_DIR, if set) at the end of the test
+COVERAGE_AXES = [("state", STATES_NUM), ("inpt", 2)]
+
+# Coverage closure test: maximum number of cycles of its stimulus, which ends as soon as every transition is taken
+CLOSURE_MAX_CYCLES = 1000
+
+# Stimulus pool of the inpt values, seeded from RANDOM_SEED
+input_pool = stimulus_pool("simple_state_machine_input", 0, 1, dtype=np.uint8)
+
+# Transition table of the machine, without the reset, and output of every state
+STATES_TRANSITION_TABLE_WITHOUTRST = {
+    "IDLE"  : {"0": "IDLE", "1": "STATE1"},
+    "RESET" : {"0": "RESET", "1": "IDLE"},
+    "STATE1": {"0": "STATE1", "1": "STATE2"},
+    "STATE2": {"0": "STATE2", "1": "STATE3"},
+    "STATE3": {"0": "STATE3", "1": "IDLE"}
+}
+
+OUTPUT_TABLE_BASED_ON_THE_STATES = {
+    "RESET" : "0",
+    "IDLE"  : "1",
+    "STATE1": "0",
+    "STATE2": "1",
+    "STATE3": "0"
+}
+
 ##########################################################################################################################################################################
 
 ##########################################################################################################################################################################
 # Testbench function
 
 # Function to replicate the machine state expected behaviour
-async def simple_state_machine_validation_behaviour(dut):
-
-    states_transition_table_withoutrst = {
-        "IDLE"  : {"0": "IDLE", "1": "STATE1"},
-        "RESET" : {"0": "RESET", "1": "IDLE"},
-        "STATE1": {"0": "STATE1", "1": "STATE2"},
-        "STATE2": {"0": "STATE2", "1": "STATE3"},
-        "STATE3": {"0": "STATE3", "1": "IDLE"}
-    }
-
-    output_table_based_on_the_states = {
-        "RESET" : "0",
-        "IDLE"  : "1",
-        "STATE1": "0",
-        "STATE2": "1",
-        "STATE3": "0"
-    }
+async def simple_state_machine_validation_behaviour(dut, coverage):
 
     # Initializes the clock cycles counter
     clk_cycles_counter = 0
@@ -78,9 +105,12 @@ async def simple_state_machine_validation_behaviour(dut):
         # If the system detects a rising edge of clock and its not reset
         elif transition is RisingEdge(dut.clk) and dut.rst.value.integer == 0:
 
+            # Samples the transition taken by the machine
+            coverage.sample(STATE_NAMES.index(machine_analogous_state), dut.inpt.value.integer)
+
             # Obtain the next state and the current output based on the estabilished tables
-            machine_analogous_state = states_transition_table_withoutrst[machine_analogous_state][dut.inpt.value.binstr]
-            machine_analogous_output = output_table_based_on_the_states[machine_analogous_state]
+            machine_analogous_state = STATES_TRANSITION_TABLE_WITHOUTRST[machine_analogous_state][dut.inpt.value.binstr]
+            machine_analogous_output = OUTPUT_TABLE_BASED_ON_THE_STATES[machine_analogous_state]
 
             # Increments the clock_cycles counter
             clk_cycles_counter += 1
@@ -118,21 +148,172 @@ async def simple_state_machine_stimulus_function(dut):
         await RisingEdge(dut.clk)
 
         # Randomly generates the input value
-        dut.inpt.value = BinaryValue(value=random.randint(0, 1), n_bits=1)
+        dut.inpt.value = BinaryValue(value=input_pool.next(), n_bits=1)
 
         # Increments the clock_cycles counter
         clk_cycles_counter += 1
 
 
+# Function to generate the whole stimulus of the test, in the dispatcher mode: the reset is asserted on the cycles within RESET_TIME and inpt is random afterwards
+def simple_state_machine_generate_stimulus():
+
+    # Initializes the cycles of the test and the reset mask
+    cycles = int(TEST_DURATION / CLOCK_PERIOD) + 1
+    resets = np.arange(cycles) < math.ceil(RESET_TIME / CLOCK_PERIOD)
+
+    # Randomly generates the input values from the stimulus pool, holding inpt at 0 during the reset
+    inputs = input_pool.take(cycles)
+    inputs[resets] = 0
+
+    return inputs, resets
+
+
+# Function to find the first input of a shortest path from a state to a state with a transition not taken yet, searching breadth first
+def simple_state_machine_path_input(state, taken, next_states):
+
+    # Initializes the first input of the path to every visited state
+    first_inputs = {state: None}
+    frontier = [state]
+
+    while frontier:
+
+        # Visits the states one transition away from the frontier
+        next_frontier = []
+        for source in frontier:
+            for inpt, target in enumerate(next_states[source]):
+
+                if target in first_inputs:
+                    continue
+
+                first_inputs[target] = inpt if source == state else first_inputs[source]
+                if not taken[target].all():
+                    return first_inputs[target]
+
+                next_frontier.append(target)
+
+        frontier = next_frontier
+
+    # Every reachable state has all its transitions taken
+    return None
+
+
+# Function to generate the stimulus of the coverage closure test: after the reset, inpt takes a transition not taken yet from the current state or, if both
+# were taken, the first step of a shortest path to a state with one. When no reachable state has one (RESET is only reachable through rst), the reset is
+# asserted for a cycle. The stimulus ends as soon as every transition of the coverage is taken
+def simple_state_machine_closure_stimulus(coverage):
+
+    # Initializes the transitions already taken, the reset cycles and the state after them
+    taken = coverage.counts > 0
+    next_states = TRANSITIONS.reshape(STATES_NUM, 2).tolist()
+    reset_cycles = math.ceil(RESET_TIME / CLOCK_PERIOD)
+    inputs, resets = [0] * reset_cycles, [True] * reset_cycles
+    state = RESET
+
+    while not taken.all() and len(inputs) < CLOSURE_MAX_CYCLES:
+
+        # Chooses a transition not taken yet from the current state, or the path to the nearest one
+        choices = [inpt for inpt in (0, 1) if not taken[state, inpt]]
+        if not choices:
+            path_input = simple_state_machine_path_input(state, taken, next_states)
+            choices = [path_input] if path_input is not None else []
+
+        # Asserts the reset if no transition not taken yet is reachable
+        if not choices:
+            inputs.append(0)
+            resets.append(True)
+            state = RESET
+            continue
+
+        # Takes the transition
+        inpt = random.choice(choices)
+        taken[state, inpt] = True
+        inputs.append(inpt)
+        resets.append(False)
+        state = next_states[state][inpt]
+
+    # Adds a last cycle, which checks the output of the last transition
+    inputs.append(0)
+    resets.append(False)
+
+    return np.array(inputs, dtype=np.uint8), np.array(resets)
+
+
+# Function to run the test with a single cycle dispatcher, checking the system against the output trace precomputed by the reference model
+async def simple_state_machine_dispatched_test(dut, coverage, inputs, resets):
+
+    # Computes the expected output trace of the stimulus
+    expected_outputs, expected_states = simple_state_machine_expected_outputs(inputs, resets)
+
+    # Samples the transitions of the whole trace at once, from the state shown on every rising edge without reset
+    coverage.sample_array(expected_states[~resets], inputs[~resets])
+
+    # Converts the vectors into lists, indexed every cycle
+    inputs, resets = inputs.tolist(), resets.tolist()
+    expected_outputs, expected_states = expected_outputs.tolist(), expected_states.tolist()
+
+    # Initializes the dispatcher and the event for the end of the verification
+    dispatcher = cycle_dispatcher(dut.clk)
+    verification_finished = Event()
+
+    # Verifies the output of the system on every rising edge, dispatcher cycle 1 being the first edge
+    def check_cycle(cycle):
+
+        clk_cycles_counter = cycle - 1
+        output_value = dut.outpt.value
+
+        # Verifies if the output of the system is equal to the precomputed output, logging the values regarding the system's behaviour only on a mismatch
+        if not output_value.is_resolvable or output_value.integer != expected_outputs[clk_cycles_counter]:
+            dut._log.error(f"Cycle {clk_cycles_counter}: Input value is {dut.inpt.value.binstr}, output value is {output_value.binstr}, machine analogous state is {STATE_NAMES[expected_states[clk_cycles_counter]]}, machine analogous output is {expected_outputs[clk_cycles_counter]}")
+            assert False, f"Output value is {output_value.binstr} and should be {expected_outputs[clk_cycles_counter]}"
+
+        if cycle == len(expected_outputs):
+            verification_finished.set()
+
+    # Drives the stimulus of the next cycle, right after the rising edge that sampled the current one
+    def drive_cycle(cycle):
+
+        if cycle < len(inputs):
+            dut.inpt.value = inputs[cycle]
+            if resets[cycle] != resets[cycle - 1]:
+                dut.rst.value = resets[cycle]
+
+    dispatcher.register(cycle_dispatcher.CHECK, check_cycle)
+    dispatcher.register(cycle_dispatcher.DRIVE, drive_cycle)
+
+    # Drives the stimulus of the first cycle
+    dut.rst.setimmediatevalue(resets[0])
+    dut.inpt.setimmediatevalue(inputs[0])
+
+    # Initializes the stimulus clock and the dispatcher
+    cocotb.start_soon(Clock(dut.clk, CLOCK_PERIOD, units='ns').start())
+    dispatcher.start()
+
+    # Waits for the end of the verification
+    await verification_finished.wait()
+    dispatcher.stop()
+
+
 @cocotb.test()
 async def test_function(dut):
 
-    # Initializes the stimulus function and validation behaviour functions
-    cocotb.start_soon(simple_state_machine_stimulus_function(dut))
-    cocotb.start_soon(simple_state_machine_validation_behaviour(dut))
+    # Starts the wave policy, which dumps the allow-listed signals inside its window when enabled
+    wave_policy(dut, WAVE_SIGNALS, "test_function", WAVE_START, WAVE_STOP).start()
+
+    # Initializes the functional coverage
+    coverage = covergroup("simple_state_machine_transitions", COVERAGE_AXES)
+
+    # Runs the test in the dispatcher mode
+    if CYCLE_DISPATCHER_MODE:
+        await simple_state_machine_dispatched_test(dut, coverage, *simple_state_machine_generate_stimulus())
+        write_coverage([coverage], "test_function")
+        return
+
+    # Initializes the stimulus function and validation behaviour functions, keeping their tasks to kill them at the end of the test
+    stimulus_task = cocotb.start_soon(simple_state_machine_stimulus_function(dut))
+    validation_task = cocotb.start_soon(simple_state_machine_validation_behaviour(dut, coverage))
 
     # Initializes the stimulus clock
-    cocotb.start_soon(Clock(dut.clk, CLOCK_PERIOD, units='ns').start())
+    clock_task = cocotb.start_soon(Clock(dut.clk, CLOCK_PERIOD, units='ns').start())
 
     # Initializes the clock counter
     clk_cycles_counter = 0
@@ -156,7 +337,14 @@ async def test_function(dut):
         # Increments the clock_cycles counter
         clk_cycles_counter += 1
 
-    
+    # Stops the stimulus, the validation and the clock, and yields once so the triggers fired on the last rising edge are handled before the next test starts
+    for task in (stimulus_task, validation_task, clock_task):
+        task.kill()
+    await NullTrigger()
+
+    # Reports the functional coverage
+    write_coverage([coverage], "test_function")
+
 
 
     
@@ -164,3 +352,16 @@ async def test_function(dut):
     
 
 
+@cocotb.test()
+async def test_coverage_closure(dut):
+
+    # Starts the wave policy, which dumps the allow-listed signals inside its window when enabled
+    wave_policy(dut, WAVE_SIGNALS, "test_coverage_closure", WAVE_START, WAVE_STOP).start()
+
+    # Runs the test in the dispatcher mode, with the stimulus steered by the coverage, which ends when every transition is taken
+    coverage = covergroup("simple_state_machine_transitions", COVERAGE_AXES)
+    await simple_state_machine_dispatched_test(dut, coverage, *simple_state_machine_closure_stimulus(coverage))
+
+    # Reports the functional coverage
+    assert coverage.closed, f"Only {coverage.covered} of the {coverage.bins} transitions were taken in {CLOSURE_MAX_CYCLES} cycles"
+    write_coverage([coverage], "test_coverage_closure")
@@ -0,0 +1,192 @@
+##########################################################################################################################################################################
+# crc16citt_equivalence_check.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains an offline verifier for the crc16citt VHDL function. It parses the hand-written XOR network from crc16citt_module.vhd, derives its
+# GF(2) matrix and checks it, without the simulator, against the software CRC16-CITT for all the 2^24 (data, crc) combinations.
+# It runs outside the simulator: python3 crc16citt_equivalence_check.py [--vhdl PATH]
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import argparse
+import os
+import re
+import sys
+import time
+import numpy as np
+from fastcrc import crc16
+from crc16citt_reference_model import *
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant for the default path of the crc16citt module, as copied into the container
+VHDL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "FPGA_Development", "crc16citt_module.vhd")
+
+## Constants for the widths of the function's inputs and output. The input vector is packed as data | (crc << DATA_WIDTH)
+DATA_WIDTH = 8
+CRC_WIDTH = 16
+INPUT_WIDTH = DATA_WIDTH + CRC_WIDTH
+
+## Constant for the number of crc values evaluated per vectorized chunk
+CRC_CHUNK = 4096
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Verifier functions
+
+def parse_crc16citt_matrix(vhdl_path):
+# Description: this function parses the crc16citt function of the VHDL file and derives the GF(2) matrix of its XOR network.
+# Parameters: vhdl_path: path to the crc16citt_module.vhd file.
+# Returns: A CRC_WIDTH x INPUT_WIDTH uint8 matrix, where row i has a 1 in every input bit XORed into crc_out(i).
+
+    # Obtains the body of the crc16citt function
+    with open(vhdl_path, encoding="utf-8", errors="replace") as vhdl_file:
+        vhdl = vhdl_file.read()
+
+    function = re.search(r"function\s+crc16citt\b.*?end\s+function", vhdl, re.IGNORECASE | re.DOTALL)
+    assert function is not None, "The crc16citt function was not found in %s" % vhdl_path
+
+    # Initializes the matrix
+    matrix = np.zeros((CRC_WIDTH, INPUT_WIDTH), dtype=np.uint8)
+    assigned_bits = set()
+
+    # Fills one row per crc_out assignment, XOR-ing every term (a term repeated twice cancels out)
+    for output_bit, expression in re.findall(r"crc_out\s*\(\s*(\d+)\s*\)\s*:=\s*([^;]*);", function.group(0), re.IGNORECASE):
+
+        output_bit = int(output_bit)
+        assigned_bits.add(output_bit)
+
+        for signal, input_bit in re.findall(r"\b(crc|data)\s*\(\s*(\d+)\s*\)", expression, re.IGNORECASE):
+            column = int(input_bit) + (DATA_WIDTH if signal.lower() == "crc" else 0)
+            matrix[output_bit, column] ^= 1
+
+    assert assigned_bits == set(range(CRC_WIDTH)), "crc_out bits %s are not assigned" % sorted(set(range(CRC_WIDTH)) - assigned_bits)
+
+    # Returns the matrix
+    return matrix
+
+
+def reference_crc16citt_matrix():
+# Description: this function derives the GF(2) matrix of the software CRC16-CITT step, by applying it to every unit input vector.
+# Parameters: None
+# Returns: A CRC_WIDTH x INPUT_WIDTH uint8 matrix.
+
+    # Initializes the matrix
+    matrix = np.zeros((CRC_WIDTH, INPUT_WIDTH), dtype=np.uint8)
+
+    # The step is linear, so column j is its output for the input vector with only bit j set
+    for column in range(INPUT_WIDTH):
+
+        vector = 1 << column
+        output = crc16citt_update(vector & 0xFF, vector >> DATA_WIDTH)
+
+        for output_bit in range(CRC_WIDTH):
+            matrix[output_bit, column] = (output >> output_bit) & 1
+
+    # Returns the matrix
+    return matrix
+
+
+def check_table_against_fastcrc():
+# Description: this function checks the reference model table against fastcrc, anchoring the software CRC to the library the testbench used before.
+# Parameters: None
+# Returns: The list of mismatching table indexes.
+
+    # The table entry of a byte is the CRC of that byte alone, starting from 0
+    return [byte for byte in range(256) if crc16.xmodem(bytes((byte,)), initial=0) != CRC16CITT_TABLE[byte]]
+
+
+def check_exhaustively(matrix):
+# Description: this function evaluates the XOR network for all the 2^24 (data, crc) combinations and compares it with the software CRC, in vectorized chunks.
+# Parameters: matrix: the GF(2) matrix of the XOR network.
+# Returns: The first mismatching (data, crc, network output, software output) tuple, or None if every combination matches.
+
+    # Packs every matrix column into a 16 bits word
+    columns = [np.uint32(sum(int(matrix[output_bit, column]) << output_bit for output_bit in range(CRC_WIDTH))) for column in range(INPUT_WIDTH)]
+
+    # Initializes the data values, shared by every chunk
+    data = np.tile(np.arange(256, dtype=np.uint32), CRC_CHUNK)
+
+    for first_crc in range(0, 1 << CRC_WIDTH, CRC_CHUNK):
+
+        # Builds the chunk of (data, crc) combinations and its packed input vectors
+        crc = np.repeat(np.arange(first_crc, first_crc + CRC_CHUNK, dtype=np.uint32), 256)
+        vector = data | (crc << DATA_WIDTH)
+
+        # Evaluates the XOR network: the output is the XOR of the columns of every set input bit
+        network_output = np.zeros_like(vector)
+        for column in range(INPUT_WIDTH):
+            network_output ^= ((vector >> column) & 1) * columns[column]
+
+        # Evaluates the software CRC through the reference model table
+        software_output = ((crc << 8) & 0xFFFF) ^ CRC16CITT_TABLE_ARRAY[(crc >> 8) ^ data]
+
+        # Returns the first mismatch, if any
+        mismatches = np.flatnonzero(network_output != software_output)
+        if mismatches.size:
+            index = mismatches[0]
+            return int(data[index]), int(crc[index]), int(network_output[index]), int(software_output[index])
+
+    # Every combination matches
+    return None
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Main
+
+def main():
+
+    # Parses the verifier arguments
+    parser = argparse.ArgumentParser(description="Exhaustive equivalence check of the crc16citt VHDL function")
+    parser.add_argument("--vhdl", default=VHDL_PATH, help="path to crc16citt_module.vhd")
+    args = parser.parse_args()
+
+    passed = True
+
+    # Derives and prints the matrix of the VHDL XOR network, one row per output bit, input bits as crc(15..0) data(7..0)
+    matrix = parse_crc16citt_matrix(args.vhdl)
+    print("GF(2) matrix of %s:" % args.vhdl)
+    for output_bit in reversed(range(CRC_WIDTH)):
+        row = "".join(str(bit) for bit in matrix[output_bit, ::-1])
+        print("    crc_out(%2i) = %s %s" % (output_bit, row[:CRC_WIDTH], row[CRC_WIDTH:]))
+
+    # Checks the reference model table against fastcrc
+    table_mismatches = check_table_against_fastcrc()
+    print("Reference table vs fastcrc: %s" % ("OK" if not table_mismatches else "MISMATCH at bytes %s" % table_mismatches))
+    passed &= not table_mismatches
+
+    # Compares the matrices, which alone proves the equivalence since both functions are linear
+    matrix_mismatches = np.argwhere(matrix != reference_crc16citt_matrix())
+    print("VHDL matrix vs software matrix: %s" % ("OK" if not matrix_mismatches.size else "MISMATCH at crc_out bits %s" % sorted(set(matrix_mismatches[:, 0].tolist()))))
+    passed &= not matrix_mismatches.size
+
+    # Checks every (data, crc) combination
+    start_time = time.perf_counter()
+    mismatch = check_exhaustively(matrix)
+    elapsed_time = time.perf_counter() - start_time
+
+    if mismatch is None:
+        print("Exhaustive check of %i (data, crc) combinations: OK (%.2f s)" % (1 << INPUT_WIDTH, elapsed_time))
+    else:
+        print("Exhaustive check: MISMATCH for data 0x%02X, crc 0x%04X: VHDL 0x%04X, software 0x%04X" % mismatch)
+        passed = False
+
+    # Returns the verifier result as the exit code
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+##########################################################################################################################################################################
@@ -0,0 +1,399 @@
+##########################################################################################################################################################################
+# crc16citt_multilane_testbench.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the pyuvm testbench of the multi-lane wrapper of the crc16citt module (crc16citt_multilane, generated by crc16citt_multilane_wrapper.py),
+# which verifies LANES copies of the module in a single simulation, amortizing the simulator start-up, the elaboration and the pyuvm build over the lanes. Every
+# lane has its own agent (sequencer, driver and monitor), scoreboard and coverage, off the same clock, while a single bus component samples and drives the
+# concatenated ports of every lane from one handler per phase of the cycle dispatcher, so the Python wakeups per clock edge do not grow with the lanes.
+# It runs from the Testbench directory: make TOPLEVEL=crc16citt_multilane MODULE=crc16citt_multilane_testbench [LANES=N] [LANE_CRC_INITS=FFFF,1D0F]
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import os
+import cocotb
+import pyuvm
+from pyuvm import *
+from crc16citt_multilane_wrapper import lane_crc_inits
+from crc16citt_testbench import (BATCH_ANALYSIS_MODE, BATCH_FLUSH_INTERVAL, BATCH_SIZE, COVERAGE_MODE, DRIVER_STREAMING_MODE, RST_TIME, WAVE_SIGNALS, WAVE_START,
+                                 WAVE_STOP, crc16citt_coverage, crc16citt_output_transaction, crc16citt_packet_sequence, crc16citt_scoreboard, crc16citt_sequence,
+                                 crc16citt_sequencer)
+from verification_tools.batch_analysis_port import batch_analysis_port
+from verification_tools.component_profiler import profiled_component, write_profile
+from verification_tools.coverage import write_coverage
+from verification_tools.cycle_dispatcher import cycle_dispatcher
+from verification_tools.testcase_names import bind_test_classes
+from verification_tools.wave_policy import wave_policy
+from cocotb.clock import Clock
+from cocotb.triggers import Combine, Event, ReadOnly, Timer
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant for the testbench's DUT
+DUT = cocotb.top
+
+## Constant for the clock period, in ns
+CLOCK_PERIOD = 10
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# PyUVM Relevant Classes
+
+# UVM Component owning the concatenated ports of the lanes: it samples them for the lane monitors and drives the values set by the lane drivers, with a single
+# access per signal and clock edge
+class crc16citt_multilane_bus(profiled_component, uvm_component):
+
+    # Bus's build phase
+    def build_phase(self):
+
+        # Initializes the lane monitors and drivers, set by the environment, and the values driven into the concatenated inputs
+        self.monitors = []
+        self.drivers = []
+        self.data_value = 0
+        self.enable_value = 0
+        self.driven_values = (None, None)
+        self.reset_released = Event()
+
+        # Initializes the mask of the lanes whose last enabled cycle was not sampled yet
+        self.pending_lanes = 0
+
+
+    # Bus's start_of_simulation_phase
+    def start_of_simulation_phase(self):
+
+        # Prints that the simulation is starting
+        self.logger.info("[BUS]: The bus operation is starting, resetting the %i lane(s) and disabling them..." % len(self.drivers))
+
+        # Drives the enable signals to 0 and the shared reset signal to 1
+        DUT.CRC16_en_i.setimmediatevalue(0)
+        DUT.rst_sync_i.setimmediatevalue(1)
+
+
+    # Bus's run_phase operation
+    async def run_phase(self):
+
+        # Registers the sampling and driving handlers of every lane
+        self.dispatcher.register(cycle_dispatcher.SAMPLE, self.profile_callback("sample_cycle", self.__sample_cycle))
+        self.dispatcher.register(cycle_dispatcher.DRIVE, self.profile_callback("drive_cycle", self.__drive_cycle))
+
+        # Awaits for the reset time and deasserts the reset signal, releasing the lane drivers
+        await Timer(RST_TIME, 'ns')
+        DUT.rst_sync_i.setimmediatevalue(0)
+        self.reset_released.set()
+
+
+    # Bus's extract phase, before the one of the lane monitors
+    def extract_phase(self):
+
+        # Hands the outputs of the last enabled cycles, settled at the end of the test, to the monitors of their lanes, as no rising edge samples them
+        data = DUT.CRC16_data_i.value.integer
+        crcs = DUT.CRC16_out_o.value.integer
+
+        for lane, monitor in enumerate(self.monitors):
+            if self.pending_lanes >> lane & 1:
+                monitor.write_sample((data >> (8 * lane)) & 0xFF, (crcs >> (16 * lane)) & 0xFFFF, 0)
+
+        self.pending_lanes = 0
+
+
+    # Sets the input data of a lane and enables it, written by the next commit
+    def drive(self, lane, data):
+
+        self.data_value = self.data_value & ~(0xFF << (8 * lane)) | data << (8 * lane)
+        self.enable_value |= 1 << lane
+
+
+    # Disables a lane, written by the next commit
+    def disable(self, lane):
+
+        self.enable_value &= ~(1 << lane)
+
+
+    # Writes the values set by the lane drivers into the DUT, only the signals that changed
+    def commit(self):
+
+        driven_data, driven_enable = self.driven_values
+
+        if self.data_value != driven_data:
+            DUT.CRC16_data_i.value = self.data_value
+        if self.enable_value != driven_enable:
+            DUT.CRC16_en_i.value = self.enable_value
+
+        self.driven_values = (self.data_value, self.enable_value)
+
+
+    # Samples the signals from the DUT on a rising edge of the clock, handing the values of every enabled lane to its monitor
+    def __sample_cycle(self, cycle):
+
+        # If the DUT is resetted or every lane is disabled, the signals are not valid
+        if DUT.rst_sync_i.value.integer:
+            return
+
+        enables = DUT.CRC16_en_i.value.integer
+        if not enables:
+            return
+
+        # Obtains the concatenated data and outputs once, sliced for the enabled lanes
+        data = DUT.CRC16_data_i.value.integer
+        crcs = DUT.CRC16_out_o.value.integer
+
+        for lane, monitor in enumerate(self.monitors):
+            if enables >> lane & 1:
+                monitor.write_sample((data >> (8 * lane)) & 0xFF, (crcs >> (16 * lane)) & 0xFFFF)
+
+        self.pending_lanes |= enables
+
+
+    # Drives the next values of every lane on a rising edge of the clock, then writes them into the DUT
+    def __drive_cycle(self, cycle):
+
+        for driver in self.drivers:
+            driver.drive_cycle(cycle)
+
+        self.commit()
+
+
+# UVM Driver of a lane, setting its payload bytes into the bus every rising edge
+class crc16citt_lane_driver(profiled_component, uvm_driver):
+
+    # Driver's build phase
+    def build_phase(self):
+
+        # Initializes the input data and the payload being driven, the lane and the bus being set by the environment
+        self.input_data = 0
+        self.payload = b""
+        self.payload_index = 0
+        self.enable_value = 0
+        self.payload_captured = Event()
+
+
+    # Driver's run_phase operation
+    async def run_phase(self):
+
+        # Waits for the bus to release the reset
+        await self.bus.reset_released.wait()
+
+        # Main driver loop, receiving the sequence items, whose payloads are driven by drive_cycle, called by the bus every rising edge
+        while True:
+
+            # Waits for the next sequence item
+            seq_item = await self.seq_item_port.get_next_item()
+            self.payload = seq_item.payload
+            self.payload_index = 0
+
+            # In streaming mode, the first byte is driven right away, in the time step of the rising edge that captured the previous payload
+            if DRIVER_STREAMING_MODE:
+                self.__drive_byte()
+                self.bus.commit()
+
+            # Waits for the rising edge that captures the last byte of the payload
+            await self.payload_captured.wait()
+            self.payload_captured.clear()
+
+            # Prints the driven payload and finishs the item
+            self.logger.info("[DRIVER]: Lane %i: %i byte(s) of data input driven, the last one is: %i" % (self.lane, len(seq_item.payload), self.input_data))
+            self.seq_item_port.item_done()
+
+
+    # Sets the next byte of the payload, or disables the lane, on a rising edge of the clock
+    def drive_cycle(self, cycle):
+
+        # If the last byte of the payload was driven on the previous rising edge, it was captured on this one
+        if self.enable_value and self.payload_index == len(self.payload):
+            self.payload_captured.set()
+
+        # Sets the next byte of the payload, except after an enabled cycle in single cycle mode
+        if self.payload_index < len(self.payload) and (DRIVER_STREAMING_MODE or not self.enable_value):
+            self.__drive_byte()
+
+        # Otherwise disables the lane, which is reenabled in this time step if the next item is already available
+        elif self.enable_value:
+            self.bus.disable(self.lane)
+            self.enable_value = 0
+
+
+    # Sets the next byte of the payload into the bus and enables the lane
+    def __drive_byte(self):
+
+        self.input_data = self.payload[self.payload_index]
+        self.payload_index += 1
+        self.bus.drive(self.lane, self.input_data)
+        self.enable_value = 1
+
+
+# UVM Monitor of a lane, emitting the values sampled by the bus
+class crc16citt_lane_monitor(profiled_component, uvm_monitor):
+
+    # Monitor's build phase
+    def build_phase(self):
+
+        # Initializes the analysis port, batching the transactions of the batched subscribers in the batch mode
+        if BATCH_ANALYSIS_MODE:
+            self.analysis_port = batch_analysis_port("analysis_port", self, BATCH_SIZE, BATCH_FLUSH_INTERVAL or None)
+        else:
+            self.analysis_port = uvm_analysis_port("analysis_port", self)
+
+
+    # Monitor's extract phase
+    def extract_phase(self):
+
+        # Delivers the transactions still buffered by the batched analysis port, before the check phase of its subscribers
+        if BATCH_ANALYSIS_MODE:
+            self.analysis_port.flush()
+
+
+    # Writes a new transaction, with the input and output values of the lane, to the analysis port, enabled unless it is the output of the last byte
+    def write_sample(self, data, crc, enable=1):
+
+        self.analysis_port.write(crc16citt_output_transaction(0, enable, data, crc))
+
+
+# UVM Agent of a lane: its sequencer and driver, when active, and its monitor
+class crc16citt_lane_agent(profiled_component, uvm_agent):
+
+    # Builds the lane's entities
+    def build_phase(self):
+
+        # Obtains the active mode of the agent
+        super().build_phase()
+
+        # Creates the sequencer and the driver, if active, and the monitor
+        if self.active():
+            self.sequencer = crc16citt_sequencer.create("crc16citt_sequencer", self)
+            self.driver = crc16citt_lane_driver.create("crc16citt_lane_driver", self)
+
+        self.monitor = crc16citt_lane_monitor.create("crc16citt_lane_monitor", self)
+
+    # Connects the lane's sequencer and driver
+    def connect_phase(self):
+
+        if self.active():
+            self.driver.seq_item_port.connect(self.sequencer.seq_item_export)
+
+
+# UVM Env with an agent, a scoreboard and a coverage subscriber per lane, and the bus shared by them
+class crc16citt_multilane_environment(profiled_component, uvm_env):
+
+    # Builds the test environment
+    def build_phase(self):
+
+        # Obtains the number of lanes from the DUT and their g_crc_init values, as given to the wrapper generator
+        self.lanes = len(DUT.CRC16_en_i)
+        self.crc_inits = lane_crc_inits(self.lanes, os.getenv("LANE_CRC_INITS", ""))
+
+        assert int(os.getenv("LANES", self.lanes)) == self.lanes, "The DUT has %i lane(s) and LANES is %s, the wrapper is outdated" % (self.lanes, os.getenv("LANES"))
+        self.logger.info("[ENVIRONMENT]: %i lane(s), with the g_crc_init values %s" % (self.lanes, " ".join("0x%04X" % crc_init for crc_init in self.crc_inits)))
+
+        # Creates the bus, the agents and the scoreboards of every lane
+        self.bus = crc16citt_multilane_bus.create("crc16citt_multilane_bus", self)
+        self.agents = [crc16citt_lane_agent.create("crc16citt_lane_agent_%i" % lane, self) for lane in range(self.lanes)]
+        self.scoreboards = [crc16citt_scoreboard.create("crc16citt_scoreboard_%i" % lane, self) for lane in range(self.lanes)]
+
+        for scoreboard, crc_init in zip(self.scoreboards, self.crc_inits):
+            scoreboard.crc_init = crc_init
+
+        # Creates the functional coverage subscribers, with a covergroup per lane
+        self.coverages = []
+        if COVERAGE_MODE:
+            self.coverages = [crc16citt_coverage.create("crc16citt_coverage_%i" % lane, self) for lane in range(self.lanes)]
+
+            for lane, coverage in enumerate(self.coverages):
+                coverage.covergroup_name = "crc16citt_data_x_reset_lane_%i" % lane
+
+        # Creates the cycle dispatcher of the bus
+        self.dispatcher = cycle_dispatcher(DUT.clk_i)
+
+    # Connects the environment's modules
+    def connect_phase(self):
+
+        # Connects the monitor of every lane to its scoreboard and coverage subscriber
+        for lane, agent in enumerate(self.agents):
+            agent.monitor.analysis_port.connect(self.scoreboards[lane].analysis_export)
+
+            if COVERAGE_MODE:
+                agent.monitor.analysis_port.connect(self.coverages[lane].analysis_export)
+
+        # Connects the monitors and the active drivers of the lanes to the bus, and the bus to the cycle dispatcher
+        self.bus.monitors = [agent.monitor for agent in self.agents]
+        self.bus.drivers = [agent.driver for agent in self.agents if agent.active()]
+        self.bus.dispatcher = self.dispatcher
+
+        for lane, agent in enumerate(self.agents):
+            if agent.active():
+                agent.driver.lane = lane
+                agent.driver.bus = self.bus
+
+    # Starts the cycle dispatcher
+    async def run_phase(self):
+
+        self.dispatcher.start()
+
+
+# UVM CRC16-CITT multi-lane testbench, driving a sequence of single bytes into every lane
+@pyuvm.test()
+class crc16citt_multilane_test(profiled_component, uvm_test):
+
+    # Initialization of the test
+    def build_phase(self):
+
+        # Creates the environment
+        self.env = crc16citt_multilane_environment.create("crc16citt_multilane_environment", self)
+
+
+    def end_of_elaboration_phase(self):
+
+        # Creates the sequence of every lane
+        self.sequences = [crc16citt_sequence.create("crc16citt_sequence_%i" % lane) for lane in range(self.env.lanes)]
+
+
+    # Run phase
+    async def run_phase(self):
+
+        self.raise_objection()
+
+        # Starts the wave policy, which dumps the allow-listed signals inside its window when enabled, into a file named after the test
+        wave_policy(cocotb.top, WAVE_SIGNALS, type(self).__name__, WAVE_START, WAVE_STOP).start()
+
+        # Starts the clock and runs the sequences of every lane at once
+        cocotb.start_soon(Clock(cocotb.top.clk_i, CLOCK_PERIOD, 'ns').start())
+        await Combine(*[cocotb.start_soon(sequence.start(agent.sequencer)) for sequence, agent in zip(self.sequences, self.env.agents)])
+
+        # Waits for the DUT to settle, so the bus samples the CRC of the last byte of every lane at the end of the test
+        await ReadOnly()
+        self.drop_objection()
+
+
+    # Report phase
+    def report_phase(self):
+
+        # Reports the functional coverage of every lane, into a file named after the test
+        if COVERAGE_MODE:
+            write_coverage([coverage.covergroup for coverage in self.env.coverages], type(self).__name__, self.logger.info)
+
+        # Reports the profile of the components, into files named after the test, when PROFILE_DIR is set
+        write_profile(self, type(self).__name__, self.logger.info)
+
+
+# UVM CRC16-CITT multi-lane testbench, driving whole packets into every lane
+@pyuvm.test()
+class crc16citt_multilane_packet_test(crc16citt_multilane_test):
+
+    def end_of_elaboration_phase(self):
+
+        # Creates the packet sequence of every lane
+        self.sequences = [crc16citt_packet_sequence.create("crc16citt_packet_sequence_%i" % lane) for lane in range(self.env.lanes)]
+
+
+# Binds the tests requested by TESTCASE under their class names, the names of results.xml
+bind_test_classes(globals())
+
+##########################################################################################################################################################################
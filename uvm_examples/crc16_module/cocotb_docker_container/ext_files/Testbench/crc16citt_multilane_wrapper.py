@@ -0,0 +1,197 @@
+##########################################################################################################################################################################
+# crc16citt_multilane_wrapper.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the generator of the multi-lane wrapper of the crc16citt module, crc16citt_multilane, which instantiates LANES copies of the module
+# sharing the clock and the reset, every one with its own g_crc_init. The data, enable and output ports of the lanes are concatenated into single vectors (lane i
+# at the bits 8*i+7 downto 8*i of CRC16_data_i, i of CRC16_en_i and 16*i+15 downto 16*i of CRC16_out_o), so the testbench samples and drives every lane with a
+# single access per signal and clock edge. The Makefile generates it into SIM_BUILD before the analysis when TOPLEVEL=crc16citt_multilane, rewriting it only
+# when it changes so the analysis is not rerun.
+# It runs outside the simulator: python3 crc16citt_multilane_wrapper.py --lanes N [--crc-inits FFFF,0000,...] [--output PATH] [--fast-generics]
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import argparse
+import os
+import sys
+from crc16citt_reference_model import CRC16CITT_INIT
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constants for the default number of lanes and for the entity name of the wrapper
+DEFAULT_LANES = 4
+MULTILANE_ENTITY = "crc16citt_multilane"
+
+## Constant for the default path of the wrapper
+MULTILANE_VHDL_PATH = os.path.join("sim_build", MULTILANE_ENTITY + ".vhd")
+
+## Constant for the template of the wrapper, in the style of crc16citt_module.vhd
+MULTILANE_VHDL_TEMPLATE = """---------------------------------------------------------------------------------------------------------
+-- {entity}.vhd
+-- Author: Luiz H. A. Santos
+-- Date: 2026-10-18
+-- Description: arquivo gerado por crc16citt_multilane_wrapper.py, não editar. Instancia {lanes} cópias do módulo
+-- CRC16CITT com clock e reset compartilhados. Os dados, enables e saídas das vias são concatenados nos vetores
+-- das portas: a via i ocupa os bits 8*i+7 downto 8*i, i e 16*i+15 downto 16*i.
+---------------------------------------------------------------------------------------------------------
+
+---------------------------------------------------------------------------------------------------------
+-- Libraries
+
+library ieee;
+use ieee.std_logic_1164.all;
+
+---------------------------------------------------------------------------------------------------------
+
+---------------------------------------------------------------------------------------------------------
+-- Entidade do wrapper de {lanes} vias do módulo CRC16CITT
+
+entity {entity} is
+    generic(
+
+        -- CRC16 inicial de cada via, a via i nos bits 16*i+15 downto 16*i
+        g_crc_inits: std_logic_vector(16*{lanes} - 1 downto 0) := x"{crc_inits}"
+
+    );
+    port (
+
+        ---- Sinais de Entrada --
+        -- Clock e reset síncrono do sistema, compartilhados pelas vias
+        clk_i        : in std_logic;
+        rst_sync_i   : in std_logic;
+
+        -- Dados de entrada para cálculo do CRC16 de cada via
+        CRC16_data_i : in std_logic_vector(8*{lanes} - 1 downto 0);
+
+        -- Sinais de enable do CRC16 de cada via
+        CRC16_en_i   : in std_logic_vector({lanes} - 1 downto 0);
+
+        ---- Sinais de Saída do CRC16 --
+        -- CRC16 calculado de cada via
+        CRC16_out_o  : out std_logic_vector(16*{lanes} - 1 downto 0)
+    );
+end entity {entity};
+
+---------------------------------------------------------------------------------------------------------
+
+architecture rtl of {entity} is
+begin
+
+    ---- Instanciação das vias --
+    g_lanes : for i in 0 to {lanes} - 1 generate
+
+        u_crc16citt_module : entity work.crc16citt_module
+            generic map (
+                g_crc_init => g_crc_inits(16*i + 15 downto 16*i)
+            )
+            port map (
+                clk_i        => clk_i,
+                rst_sync_i   => rst_sync_i,
+                CRC16_data_i => CRC16_data_i(8*i + 7 downto 8*i),
+                CRC16_en_i   => CRC16_en_i(i),
+                CRC16_out_o  => CRC16_out_o(16*i + 15 downto 16*i)
+            );
+
+    end generate g_lanes;
+
+end architecture rtl;
+"""
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Generator functions
+
+def lane_crc_inits(lanes, crc_inits=""):
+# Description: this function obtains the g_crc_init of every lane from a comma separated list of hexadecimal values, repeated over the lanes.
+# Parameters: lanes: number of lanes; crc_inits: the list, as "FFFF,1D0F", default (empty) being CRC16CITT_INIT for every lane.
+# Returns: A list with the g_crc_init of every lane.
+
+    values = [int(value.strip().lower().replace('x"', "").strip('"'), 16) for value in crc_inits.split(",") if value.strip()] or [CRC16CITT_INIT]
+
+    assert lanes > 0, "The wrapper needs at least one lane"
+    assert all(0 <= value <= 0xFFFF for value in values), "The g_crc_init values must have 16 bits: %s" % crc_inits
+
+    return [values[lane % len(values)] for lane in range(lanes)]
+
+
+def packed_crc_inits(crc_inits):
+# Description: this function packs the g_crc_init of every lane as the g_crc_inits generic of the wrapper.
+# Parameters: crc_inits: list with the g_crc_init of every lane.
+# Returns: The packed value, lane i at the bits 16*i+15 downto 16*i.
+
+    return sum(value << (16 * lane) for lane, value in enumerate(crc_inits))
+
+
+def multilane_wrapper_vhdl(crc_inits):
+# Description: this function generates the VHDL of the wrapper.
+# Parameters: crc_inits: list with the g_crc_init of every lane, whose length is the number of lanes.
+# Returns: The VHDL text.
+
+    lanes = len(crc_inits)
+
+    return MULTILANE_VHDL_TEMPLATE.format(entity=MULTILANE_ENTITY, lanes=lanes, crc_inits="%0*X" % (4 * lanes, packed_crc_inits(crc_inits)))
+
+
+def write_multilane_wrapper(crc_inits, output=MULTILANE_VHDL_PATH):
+# Description: this function writes the VHDL of the wrapper, only if it changed, so the file timestamp is kept. The file is replaced atomically, so the jobs
+# sharing a SIM_BUILD never read it half written.
+# Parameters: crc_inits: list with the g_crc_init of every lane; output: path to the VHDL file.
+# Returns: The path to the VHDL file.
+
+    vhdl = multilane_wrapper_vhdl(crc_inits)
+
+    if os.path.exists(output):
+        with open(output) as vhdl_file:
+            if vhdl_file.read() == vhdl:
+                return output
+
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    temporary_output = "%s.%i.tmp" % (output, os.getpid())
+    with open(temporary_output, "w") as vhdl_file:
+        vhdl_file.write(vhdl)
+    os.replace(temporary_output, output)
+
+    return output
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Main
+
+def main():
+
+    # Parses the generator arguments, defaulting to the variables exported by the Makefile
+    parser = argparse.ArgumentParser(description="Generates the multi-lane wrapper of the crc16citt module")
+    parser.add_argument("--lanes", type=int, default=int(os.getenv("LANES", DEFAULT_LANES)), help="number of lanes")
+    parser.add_argument("--crc-inits", default=os.getenv("LANE_CRC_INITS", ""), help="comma separated g_crc_init of the lanes, in hexadecimal, repeated over them")
+    parser.add_argument("--output", default=MULTILANE_VHDL_PATH, help="VHDL file of the wrapper")
+    parser.add_argument("--fast-generics", action="store_true", help="prints the generics of the fast mode model instead of writing the wrapper")
+    args = parser.parse_args()
+
+    crc_inits = lane_crc_inits(args.lanes, args.crc_inits)
+
+    # Prints the generics of the fast mode model, which mirrors the generated wrapper
+    if args.fast_generics:
+        print("-g lanes=%i -g g_crc_inits=0x%X" % (args.lanes, packed_crc_inits(crc_inits)))
+        return 0
+
+    # Writes the wrapper, printing its path for the Makefile
+    print(write_multilane_wrapper(crc_inits, args.output))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+##########################################################################################################################################################################
@@ -0,0 +1,172 @@
+##########################################################################################################################################################################
+# crc16citt_reference_model.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the table-driven reference model of the crc16citt module. It mirrors the crc16citt VHDL function (polynomial 0x1021, MSB first) and the
+# g_crc_init generic, and advances the CRC over whole byte sequences in one call, so the predictor does not pay a per-byte FFI call.
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import binascii
+import numpy as np
+from array import array
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant for the CRC16-CITT polynomial implemented by the crc16citt VHDL function
+CRC16CITT_POLYNOMIAL = 0x1021
+
+## Constant for the default value of the g_crc_init generic
+CRC16CITT_INIT = 0xFFFF
+
+## Precomputed CRC16-CITT table, indexed by (crc >> 8) ^ data
+CRC16CITT_TABLE = (
+    0x0000, 0x1021, 0x2042, 0x3063, 0x4084, 0x50A5, 0x60C6, 0x70E7,
+    0x8108, 0x9129, 0xA14A, 0xB16B, 0xC18C, 0xD1AD, 0xE1CE, 0xF1EF,
+    0x1231, 0x0210, 0x3273, 0x2252, 0x52B5, 0x4294, 0x72F7, 0x62D6,
+    0x9339, 0x8318, 0xB37B, 0xA35A, 0xD3BD, 0xC39C, 0xF3FF, 0xE3DE,
+    0x2462, 0x3443, 0x0420, 0x1401, 0x64E6, 0x74C7, 0x44A4, 0x5485,
+    0xA56A, 0xB54B, 0x8528, 0x9509, 0xE5EE, 0xF5CF, 0xC5AC, 0xD58D,
+    0x3653, 0x2672, 0x1611, 0x0630, 0x76D7, 0x66F6, 0x5695, 0x46B4,
+    0xB75B, 0xA77A, 0x9719, 0x8738, 0xF7DF, 0xE7FE, 0xD79D, 0xC7BC,
+    0x48C4, 0x58E5, 0x6886, 0x78A7, 0x0840, 0x1861, 0x2802, 0x3823,
+    0xC9CC, 0xD9ED, 0xE98E, 0xF9AF, 0x8948, 0x9969, 0xA90A, 0xB92B,
+    0x5AF5, 0x4AD4, 0x7AB7, 0x6A96, 0x1A71, 0x0A50, 0x3A33, 0x2A12,
+    0xDBFD, 0xCBDC, 0xFBBF, 0xEB9E, 0x9B79, 0x8B58, 0xBB3B, 0xAB1A,
+    0x6CA6, 0x7C87, 0x4CE4, 0x5CC5, 0x2C22, 0x3C03, 0x0C60, 0x1C41,
+    0xEDAE, 0xFD8F, 0xCDEC, 0xDDCD, 0xAD2A, 0xBD0B, 0x8D68, 0x9D49,
+    0x7E97, 0x6EB6, 0x5ED5, 0x4EF4, 0x3E13, 0x2E32, 0x1E51, 0x0E70,
+    0xFF9F, 0xEFBE, 0xDFDD, 0xCFFC, 0xBF1B, 0xAF3A, 0x9F59, 0x8F78,
+    0x9188, 0x81A9, 0xB1CA, 0xA1EB, 0xD10C, 0xC12D, 0xF14E, 0xE16F,
+    0x1080, 0x00A1, 0x30C2, 0x20E3, 0x5004, 0x4025, 0x7046, 0x6067,
+    0x83B9, 0x9398, 0xA3FB, 0xB3DA, 0xC33D, 0xD31C, 0xE37F, 0xF35E,
+    0x02B1, 0x1290, 0x22F3, 0x32D2, 0x4235, 0x5214, 0x6277, 0x7256,
+    0xB5EA, 0xA5CB, 0x95A8, 0x8589, 0xF56E, 0xE54F, 0xD52C, 0xC50D,
+    0x34E2, 0x24C3, 0x14A0, 0x0481, 0x7466, 0x6447, 0x5424, 0x4405,
+    0xA7DB, 0xB7FA, 0x8799, 0x97B8, 0xE75F, 0xF77E, 0xC71D, 0xD73C,
+    0x26D3, 0x36F2, 0x0691, 0x16B0, 0x6657, 0x7676, 0x4615, 0x5634,
+    0xD94C, 0xC96D, 0xF90E, 0xE92F, 0x99C8, 0x89E9, 0xB98A, 0xA9AB,
+    0x5844, 0x4865, 0x7806, 0x6827, 0x18C0, 0x08E1, 0x3882, 0x28A3,
+    0xCB7D, 0xDB5C, 0xEB3F, 0xFB1E, 0x8BF9, 0x9BD8, 0xABBB, 0xBB9A,
+    0x4A75, 0x5A54, 0x6A37, 0x7A16, 0x0AF1, 0x1AD0, 0x2AB3, 0x3A92,
+    0xFD2E, 0xED0F, 0xDD6C, 0xCD4D, 0xBDAA, 0xAD8B, 0x9DE8, 0x8DC9,
+    0x7C26, 0x6C07, 0x5C64, 0x4C45, 0x3CA2, 0x2C83, 0x1CE0, 0x0CC1,
+    0xEF1F, 0xFF3E, 0xCF5D, 0xDF7C, 0xAF9B, 0xBFBA, 0x8FD9, 0x9FF8,
+    0x6E17, 0x7E36, 0x4E55, 0x5E74, 0x2E93, 0x3EB2, 0x0ED1, 0x1EF0,
+)
+
+## Precomputed CRC16-CITT table as a NumPy array, for the vectorized functions
+CRC16CITT_TABLE_ARRAY = np.array(CRC16CITT_TABLE, dtype=np.uint16)
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Reference model functions
+
+def generate_crc16citt_table(polynomial=CRC16CITT_POLYNOMIAL):
+# Description: this function generates the 256-entry CRC table for the given polynomial, bit by bit, as the crc16citt VHDL function would do.
+# Parameters: polynomial: the CRC16 polynomial, default is 0x1021.
+# Returns: A tuple with the 256 CRC values, indexed by (crc >> 8) ^ data.
+
+    # Initializes the table
+    table = []
+
+    # Shifts every possible byte through the polynomial division
+    for byte in range(256):
+
+        crc = byte << 8
+
+        for _ in range(8):
+            crc = ((crc << 1) ^ polynomial) if crc & 0x8000 else (crc << 1)
+
+        table.append(crc & 0xFFFF)
+
+    # Returns the generated table
+    return tuple(table)
+
+
+def crc16citt_update(data, crc=CRC16CITT_INIT):
+# Description: this function advances the CRC16-CITT by a single byte, exactly as one enabled clock cycle of the crc16citt_module.
+# Parameters: data: the input byte, in int value.
+#             crc: the current CRC int value, default is the g_crc_init value.
+# Returns: The updated CRC int value.
+
+    # Returns the updated CRC, using the precomputed table
+    return ((crc << 8) & 0xFFFF) ^ CRC16CITT_TABLE[(crc >> 8) ^ data]
+
+
+def crc16citt_advance(data, crc=CRC16CITT_INIT):
+# Description: this function advances the CRC16-CITT over a whole byte sequence in one call.
+# Parameters: data: the input bytes, as a bytes, bytearray or memoryview object.
+#             crc: the current CRC int value, default is the g_crc_init value.
+# Returns: The CRC int value after the last byte of the sequence.
+
+    # binascii.crc_hqx implements the same MSB-first 0x1021 CRC as the table, in C, so there is no per-byte Python work
+    return binascii.crc_hqx(data, crc)
+
+
+def crc16citt_trace(data, crc=CRC16CITT_INIT):
+# Description: this function calculates the CRC16-CITT after every byte of a sequence, i.e. the CRC16_out_o value the module presents after each enabled cycle.
+# Parameters: data: the input bytes, as a bytes, bytearray or memoryview object.
+#             crc: the current CRC int value, default is the g_crc_init value.
+# Returns: An unsigned 16 bits array with one CRC value per input byte.
+
+    # Initializes the trace and local references to the table and to the append method
+    trace = []
+    append = trace.append
+    table = CRC16CITT_TABLE
+
+    # Advances the CRC byte by byte, storing each intermediate value
+    for byte in memoryview(data).cast('B'):
+
+        crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ byte]
+        append(crc)
+
+    # Returns the CRC trace
+    return array('H', trace)
+
+
+def crc16citt_expected_outputs(data, observed_crc, crc=CRC16CITT_INIT):
+# Description: this function calculates, in one vectorized pass, the CRC16_out_o value expected at every enabled cycle of a trace. The value expected at a cycle is
+# the observed value of the previous enabled cycle advanced by its input byte, so, together with the first value, it checks the whole CRC chain.
+# Parameters: data: NumPy array with the CRC16_data_i value of every enabled cycle.
+#             observed_crc: NumPy array with the CRC16_out_o value sampled at every enabled cycle, before its byte is applied.
+#             crc: the CRC int value expected at the first enabled cycle, default is the g_crc_init value.
+# Returns: A NumPy uint16 array with the expected CRC16_out_o value of every enabled cycle.
+
+    # Converts the trace to the table's data type
+    data = np.asarray(data, dtype=np.uint16)
+    observed_crc = np.asarray(observed_crc, dtype=np.uint16)
+
+    # Initializes the expected values, starting from the given CRC
+    expected_crc = np.empty_like(observed_crc)
+    expected_crc[:1] = crc
+
+    # Advances every observed value by its byte, at once
+    expected_crc[1:] = (observed_crc[:-1] << 8) ^ CRC16CITT_TABLE_ARRAY[(observed_crc[:-1] >> 8) ^ data[:-1]]
+
+    # Returns the expected values
+    return expected_crc
+
+
+def crc16citt_first_mismatch(expected_crc, observed_crc):
+# Description: this function finds the first cycle in which the observed CRC differs from the expected one.
+# Parameters: expected_crc: NumPy array with the expected CRC16_out_o values.
+#             observed_crc: NumPy array with the observed CRC16_out_o values.
+# Returns: The index of the first mismatch, or -1 if the traces are equal.
+
+    # Obtains every mismatching index
+    mismatches = np.flatnonzero(expected_crc != observed_crc)
+
+    # Returns the first one, if any
+    return int(mismatches[0]) if mismatches.size else -1
+
+##########################################################################################################################################################################
@@ -0,0 +1,112 @@
+##########################################################################################################################################################################
+# crc16citt_reference_model_benchmark.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains a micro-benchmark comparing the per-byte fastcrc path previously used by the crc16citt predictor with the table-driven reference model.
+# It runs outside the simulator: python3 crc16citt_reference_model_benchmark.py [--num-bytes N] [--repeat R]
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import argparse
+import os
+import timeit
+from fastcrc import crc16
+from crc16citt_reference_model import *
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constants for the default benchmark size
+NUM_BYTES = 1000000
+REPEAT = 5
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Benchmarked paths
+
+def fastcrc_per_byte(data, crc=CRC16CITT_INIT):
+# Description: this function reproduces the predictor's original path, one int.to_bytes and one fastcrc call per observed byte.
+# Parameters: data: the input bytes.
+#             crc: the initial CRC int value.
+# Returns: The final CRC int value.
+
+    for byte in data:
+        crc = crc16.xmodem(int.to_bytes(byte, byteorder='big'), initial=crc)
+
+    return crc
+
+
+def table_per_byte(data, crc=CRC16CITT_INIT):
+# Description: this function advances the CRC one byte at a time through the reference model table.
+# Parameters: data: the input bytes.
+#             crc: the initial CRC int value.
+# Returns: The final CRC int value.
+
+    for byte in data:
+        crc = crc16citt_update(byte, crc)
+
+    return crc
+
+
+def table_trace(data, crc=CRC16CITT_INIT):
+# Description: this function calculates the whole per-cycle CRC trace of the sequence.
+# Parameters: data: the input bytes.
+#             crc: the initial CRC int value.
+# Returns: The final CRC int value.
+
+    return crc16citt_trace(data, crc)[-1]
+
+
+def table_advance(data, crc=CRC16CITT_INIT):
+# Description: this function advances the CRC over the whole sequence in a single call.
+# Parameters: data: the input bytes.
+#             crc: the initial CRC int value.
+# Returns: The final CRC int value.
+
+    return crc16citt_advance(data, crc)
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Main
+
+def main():
+
+    # Parses the benchmark arguments
+    parser = argparse.ArgumentParser(description="CRC16-CITT reference model micro-benchmark")
+    parser.add_argument("--num-bytes", type=int, default=NUM_BYTES, help="number of random bytes per run")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="number of runs per path, the best one is reported")
+    args = parser.parse_args()
+
+    # Generates the random input data
+    data = os.urandom(args.num_bytes)
+
+    # Checks that every path agrees before timing them
+    reference = fastcrc_per_byte(data)
+    for path in (table_per_byte, table_trace, table_advance):
+        assert path(data) == reference, "%s disagrees with fastcrc" % path.__name__
+
+    # Times every path, printing the best run and the speedup over the original path
+    print("Benchmarking %i bytes, best of %i runs" % (args.num_bytes, args.repeat))
+    baseline = None
+    for path in (fastcrc_per_byte, table_per_byte, table_trace, table_advance):
+
+        best = min(timeit.repeat(lambda: path(data), number=1, repeat=args.repeat))
+        baseline = best if baseline is None else baseline
+
+        print("%-18s %10.3f ms %10.1f Mbyte/s %8.1fx" % (path.__name__, best * 1e3, args.num_bytes / best / 1e6, baseline / best))
+
+
+if __name__ == "__main__":
+    main()
+
+##########################################################################################################################################################################
@@ -12,13 +12,23 @@
 
 import cocotb
 import random
+import numpy as np
 from pyuvm import *
 import pyuvm
-from fastcrc import crc16
+from crc16citt_reference_model import *
+from verification_tools.batch_analysis_port import batch_analysis_port, batch_subscriber
+from verification_tools.component_profiler import profiled_component, write_profile
+from verification_tools.coverage import covergroup, write_coverage
+from verification_tools.cycle_dispatcher import cycle_dispatcher
+from verification_tools.stimulus_pool import stimulus_pool
+from verification_tools.testcase_names import bind_test_classes
+from verification_tools.wave_policy import wave_policy
+from verification_tools.worker_subscriber import worker_subscriber
 from cocotb.triggers import Timer
 from cocotb.clock import Clock
 from cocotb.triggers import *
 from cocotb.binary import *
+from collections import namedtuple
 
 ##########################################################################################################################################################################
 
@@ -36,6 +46,61 @@ RST_TIME = 35
 ## Constant for the testbench's DUT
 DUT = cocotb.top
 
+## Constants for the packet sequence: number of packets and CCSDS space packet length limits (6 bytes primary header plus 1 to 65536 bytes of data field)
+PACKET_NUM = 10
+CCSDS_PACKET_MIN_LENGTH = 7
+CCSDS_PACKET_MAX_LENGTH = 65542
+
+## Constant for the packet length distribution, as a list of ((minimum length, maximum length), weight) ranges, up to the longest CCSDS space packet
+PACKET_LENGTH_DISTRIBUTION = [
+    ((CCSDS_PACKET_MIN_LENGTH, 64), 60),
+    ((65, 1024), 30),
+    ((1025, 4096), 9),
+    ((4097, CCSDS_PACKET_MAX_LENGTH), 1),
+]
+
+## Constants for the scoreboard: when SCOREBOARD_MODE is True, the trace is stored and checked at once in the check_phase, or every SCOREBOARD_CHECK_INTERVAL
+## items for an early failure (0 disables the intermediate checks)
+SCOREBOARD_MODE = True
+SCOREBOARD_CHECK_INTERVAL = 0
+SCOREBOARD_INITIAL_CAPACITY = 65536
+SCOREBOARD_CONTEXT_ITEMS = 3
+
+## Constants for the predictor, used when SCOREBOARD_MODE is False: when PREDICTOR_WORKER_MODE is True, the reference model and the comparison run on a worker
+## thread, overlapping with the simulation, and PREDICTOR_FAIL_FAST fails the test on the first transaction written after a mismatch, instead of in the check_phase
+PREDICTOR_WORKER_MODE = True
+PREDICTOR_FAIL_FAST = True
+
+## Constants for the batched analysis port: when BATCH_ANALYSIS_MODE is True, the monitor buffers its transactions and delivers them to the scoreboard as lists of
+## BATCH_SIZE items, every BATCH_FLUSH_INTERVAL ns (0 disables the periodic deliveries) and at the end of the test, while the per-item subscribers (the predictor
+## and the coverage, read live by the closure sequence) still receive every transaction on write
+BATCH_ANALYSIS_MODE = True
+BATCH_SIZE = 4096
+BATCH_FLUSH_INTERVAL = 0
+
+## Constant for the driver mode: when True, CRC16_en_i stays asserted and a new byte is driven every rising edge while items are queued
+DRIVER_STREAMING_MODE = True
+
+## Constant for the dispatcher mode: when True, the monitor and the driver are handlers of a single cycle dispatcher, instead of coroutines awaiting every rising edge
+CYCLE_DISPATCHER_MODE = True
+
+## Constants for the wave policy (make WAVES=policy): allow-list of the dumped signals and window of the dump, in ns since the start of the test, WAVE_STOP None being the end of the test
+WAVE_SIGNALS = ["clk_i", "rst_sync_i", "CRC16_en_i", "CRC16_data_i", "CRC16_out_o"]
+WAVE_START = 0
+WAVE_STOP = None
+
+## Constant for the live checking mode: when False, the monitor and the predictor are not created, so the simulation only drives the design, and it is checked
+## afterwards from its waveforms by the offline checker (make check_waves)
+LIVE_CHECK_MODE = True
+
+## Constants for the functional coverage, sampled from the monitor: every input byte crossed with the reset state of the CRC register (the byte being the first
+## one after rst_sync_i), reported (and written into COVERAGE_DIR, if set) at the end of the test
+COVERAGE_MODE = True
+COVERAGE_AXES = [("data", 256), ("crc_reset", 2)]
+
+## Constant for the coverage closure test: maximum number of iterations of its sequence, which stops as soon as every bin is covered
+CLOSURE_MAX_ITEMS = 4096
+
 
 ##########################################################################################################################################################################
 
@@ -43,6 +108,10 @@ DUT = cocotb.top
 ##########################################################################################################################################################################
 # Important global variables
 
+## Stimulus pools of the input bytes (single bytes and packet payloads) and of the packet lengths of every distribution, seeded from RANDOM_SEED
+input_data_pool = stimulus_pool("crc16citt_input_data", 0, 255, dtype=np.uint8)
+packet_length_pools = {}
+
 
 ##########################################################################################################################################################################
 
@@ -55,18 +124,32 @@ def generate_random_input_data():
 # Parameters: None
 # Returns: A random byte of data as an integer.
 
-    # Returns the random byte of data
-    return random.randint(0, 255)
+    # Returns the random byte of data, from the stimulus pool
+    return input_data_pool.next()
+
+
+def generate_random_packet_length(length_distribution=PACKET_LENGTH_DISTRIBUTION):
+# Description: this function draws a random packet length from a weighted distribution of length ranges.
+# Parameters: length_distribution: a list of ((minimum length, maximum length), weight) ranges, default is PACKET_LENGTH_DISTRIBUTION.
+# Returns: A random packet length as an integer.
 
+    # Obtains the stimulus pool of the distribution, which chooses one of the ranges based on its weight, then a uniform length inside it
+    distribution = tuple((tuple(length_range), weight) for length_range, weight in length_distribution)
+    if distribution not in packet_length_pools:
+        packet_length_pools[distribution] = stimulus_pool("crc16citt_packet_length_%i" % len(packet_length_pools), ranges=length_distribution)
 
-def calculate_crc(data, previous_crc=0xFFFF):
+    # Returns the random packet length
+    return packet_length_pools[distribution].next()
+
+
+def calculate_crc(data, previous_crc=CRC16CITT_INIT):
 # Description: this function calculates the CRC16-CITT of the given data.
 # Parameters: data: the data to calculate the CRC for, in int value.
 #             previous_crc: the previous CRC int value, default is 0xFFFF.
-# Returns: None.
+# Returns: The calculated CRC int value.
 
-    # Returns the calculated CRC
-    return crc16.xmodem(int.to_bytes(data, byteorder='big'), initial=previous_crc)
+    # Returns the calculated CRC, using the table-driven reference model
+    return crc16citt_update(data, previous_crc)
 
 ##########################################################################################################################################################################
 
@@ -75,7 +158,7 @@ def calculate_crc(data, previous_crc=0xFFFF):
 # PyUVM Relevant Classes
 
 # UVM Sequencer for the CRC16-CITT module
-class crc16citt_sequencer(uvm_sequencer):
+class crc16citt_sequencer(profiled_component, uvm_sequencer):
     pass
 
 
@@ -88,24 +171,45 @@ class crc16citt_input_seq_item(uvm_sequence_item):
 
         self.input_data = 0
 
+        # Drives a reset cycle before the payload
+        self.reset = False
+
     # Randomize the input data value
     def randomize(self):
 
         self.input_data = generate_random_input_data()
 
+    # Bytes to be driven into the DUT
+    @property
+    def payload(self):
 
-# UVM Sequence Item for the Monitor&Scoreboard communication
-class crc16citt_output_seq_item(uvm_sequence_item):
+        return bytes((self.input_data,))
 
-    # Initialization of the sequence item 
-    def __init__(self, name, dut_values=None):
+
+# UVM Sequence Item carrying a whole packet for the Sequencer&Driver communication
+class crc16citt_packet_seq_item(uvm_sequence_item):
+
+    # Initialization of the sequence item
+    def __init__(self, name, length_distribution=PACKET_LENGTH_DISTRIBUTION):
         super().__init__(name)
 
-        # Initialization of the input and output data dictionary
-        self.dut_values = dut_values if dut_values is not None else {
-            "input_values": {"rst_sync_i": 0, "CRC16_en_i": 0, "CRC16_data_i": 0},
-            "output_values": {"CRC16_data_o": 0}
-        }
+        self.length_distribution = length_distribution
+        self.payload = b""
+
+        # Drives a reset cycle before the payload
+        self.reset = False
+
+    # Randomize the packet length and its payload
+    def randomize(self):
+
+        self.payload = input_data_pool.take(generate_random_packet_length(self.length_distribution)).tobytes()
+
+
+# Immutable transaction for the Monitor&Scoreboard communication, holding the sampled DUT values as plain ints. It is written on every enabled cycle, on the
+# first reset cycle after them, whose CRC16_out_o is the CRC of the last byte before the reset, and at the end of the test, with CRC16_en_i 0, for the CRC of the
+# last byte of the test
+class crc16citt_output_transaction(namedtuple("crc16citt_output_transaction", "rst_sync_i CRC16_en_i CRC16_data_i CRC16_out_o")):
+    __slots__ = ()
 
 
 # UVM Sequence to be ran by the sequencer
@@ -126,8 +230,68 @@ class crc16citt_sequence(uvm_sequence):
             await self.finish_item(seq_item)
 
 
+# UVM Sequence of whole packets to be ran by the sequencer
+class crc16citt_packet_sequence(uvm_sequence):
+
+    # Initialization of the sequence
+    def __init__(self, name, packet_num=PACKET_NUM, length_distribution=PACKET_LENGTH_DISTRIBUTION):
+        super().__init__(name)
+
+        self.packet_num = packet_num
+        self.length_distribution = length_distribution
+
+    # Implementation of the sequence's main logic behaviour
+    async def body(self):
+
+        # Repeat packet_num times
+        for _ in range(self.packet_num):
+
+            # Initialize the packet seq item
+            seq_item = crc16citt_packet_seq_item("crc16citt_packet_seq_item", self.length_distribution)
+
+            # Starts the transaction, randomizes the packet and finishes the item
+            await self.start_item(seq_item)
+            seq_item.randomize()
+            await self.finish_item(seq_item)
+
+
+# UVM Sequence steered by the functional coverage: every item is an input byte crossed with a reset state not covered yet, the reset state being covered by
+# driving a reset cycle before the byte, until every bin is covered
+class crc16citt_closure_sequence(uvm_sequence):
+
+    # Implementation of the sequence's main logic behaviour
+    async def body(self):
+
+        # Obtains the covergroup sampled by the monitor, set by the test, and initializes the bins sent and not yet sampled. The first byte follows the
+        # initial reset
+        covergroup = self.coverage.covergroup
+        sent_bins = set()
+        after_reset = True
+
+        for _ in range(CLOSURE_MAX_ITEMS):
+
+            # Stops as soon as every bin is covered
+            holes = covergroup.holes()
+            if not holes:
+                break
+
+            # If every uncovered bin was already sent, waits for the monitor to sample them
+            candidates = [hole for hole in holes if hole not in sent_bins]
+            if not candidates:
+                await RisingEdge(DUT.clk_i)
+                continue
+
+            # Starts the transaction, chooses one of the uncovered bins, resetting the CRC register before its byte if needed, and finishes the item
+            seq_item = crc16citt_input_seq_item("crc16citt_input_seq_item")
+            await self.start_item(seq_item)
+            seq_item.input_data, seq_item.reset = random.choice(candidates)
+            sent_bins.add((seq_item.input_data, int(seq_item.reset or after_reset)))
+            after_reset = False
+            await self.finish_item(seq_item)
+
+
 # UVM Driver for the counter
-class crc16citt_driver(uvm_driver):
+class crc16citt_driver(profiled_component, uvm_driver):
 
     # Driver's build phase
     def build_phase(self):
@@ -157,119 +321,273 @@ class crc16citt_driver(uvm_driver):
         # Deasserts the reset signal
         DUT.rst_sync_i.setimmediatevalue(BinaryValue(value=0, n_bits=1))
 
+        # Main driver loop, from the cycle dispatcher or in streaming or single cycle mode
+        if CYCLE_DISPATCHER_MODE:
+            await self.__drive_dispatched()
+        elif DRIVER_STREAMING_MODE:
+            await self.__drive_streaming()
+        else:
+            await self.__drive_single()
+
+
+    # Drives a new byte every rising edge, keeping the enable signal asserted while the sequencer has items
+    async def __drive_streaming(self):
+
+        # Waits for the first sequence item
+        seq_item = await self.seq_item_port.get_next_item()
+
+        # Main driver loop, receiving the sequence items and driving their payloads back to back
+        while True:
+
+            # Resets the CRC register before the payload, if requested
+            if seq_item.reset:
+                await self.__drive_reset_cycle()
+
+            # Streams every byte of the item's payload, one per rising edge
+            for self.input_data in seq_item.payload:
+
+                # Sets the input data to the DUT and enables it
+                DUT.CRC16_data_i.value = self.input_data
+                DUT.CRC16_en_i.value = BinaryValue(value=1, n_bits=1)
+
+                # Waits for the rising edge that captures the input data
+                await RisingEdge(DUT.clk_i)
+
+            # Prints the driven payload and finishs the item
+            self.logger.info("[DRIVER]: %i byte(s) of data input driven, the last one is: %i" % (len(seq_item.payload), self.input_data))
+            self.seq_item_port.item_done()
+
+            # Requests the next item, which a running sequence delivers within the same time step
+            next_item = cocotb.start_soon(self.seq_item_port.get_next_item())
+            await First(next_item, NextTimeStep())
+
+            # If the sequencer ran dry, deasserts the enable signal before the next rising edge
+            if not next_item.done():
+                DUT.CRC16_en_i.value = BinaryValue(value=0, n_bits=1)
+
+            # Waits for the next sequence item
+            seq_item = await next_item
+
+
+    # Receives the sequence items, whose payloads are driven by __drive_cycle, called by the cycle dispatcher every rising edge
+    async def __drive_dispatched(self):
+
+        # Initializes the payload being driven and registers the driver's handler
+        self.payload = b""
+        self.payload_index = 0
+        self.enable_value = 0
+        self.reset_value = 0
+        self.payload_captured = Event()
+        self.dispatcher.register(cycle_dispatcher.DRIVE, self.profile_callback("drive_cycle", self.__drive_cycle))
+
+        # Main driver loop, receiving the sequence items
+        while True:
+
+            # Waits for the next sequence item and hands its payload to the handler
+            seq_item = await self.seq_item_port.get_next_item()
+            self.payload = seq_item.payload
+            self.payload_index = 0
+
+            # Resets the CRC register before the payload, if requested, or, in streaming mode, drives the first byte right away, in the time step of the rising
+            # edge that captured the previous payload
+            if seq_item.reset:
+                self.__drive_reset()
+            elif DRIVER_STREAMING_MODE:
+                self.__drive_byte()
+
+            # Waits for the rising edge that captures the last byte of the payload
+            await self.payload_captured.wait()
+            self.payload_captured.clear()
+
+            # Prints the driven payload and finishs the item
+            self.logger.info("[DRIVER]: %i byte(s) of data input driven, the last one is: %i" % (len(seq_item.payload), self.input_data))
+            self.seq_item_port.item_done()
+
+
+    # Drives the next byte of the payload, or disables the DUT, on a rising edge of the clock
+    def __drive_cycle(self, cycle):
+
+        # Releases the reset driven before the payload, captured on this rising edge, so the first byte is driven below
+        if self.reset_value:
+            DUT.rst_sync_i.value = 0
+            self.reset_value = 0
+
+        # If the last byte of the payload was driven on the previous rising edge, it was captured on this one
+        if self.enable_value and self.payload_index == len(self.payload):
+            self.payload_captured.set()
+
+        # Drives the next byte of the payload, except after an enabled cycle in single cycle mode
+        if self.payload_index < len(self.payload) and (DRIVER_STREAMING_MODE or not self.enable_value):
+            self.__drive_byte()
+
+        # Otherwise disables the DUT, which is reenabled in this time step if the next item is already available
+        elif self.enable_value:
+            DUT.CRC16_en_i.value = 0
+            self.enable_value = 0
+
+
+    # Sets the next byte of the payload to the DUT and enables it
+    def __drive_byte(self):
+
+        self.input_data = self.payload[self.payload_index]
+        self.payload_index += 1
+        DUT.CRC16_data_i.value = self.input_data
+
+        # Drives the enable signal only when it changes
+        if not self.enable_value:
+            DUT.CRC16_en_i.value = 1
+            self.enable_value = 1
+
+
+    # Asserts the reset signal and disables the DUT, the reset being released by __drive_cycle on the rising edge that captures it
+    def __drive_reset(self):
+
+        DUT.rst_sync_i.value = 1
+        self.reset_value = 1
+
+        if self.enable_value:
+            DUT.CRC16_en_i.value = 0
+            self.enable_value = 0
+
+
+    # Drives a reset cycle, disabling the DUT and asserting the reset signal until the rising edge that captures it
+    async def __drive_reset_cycle(self):
+
+        DUT.CRC16_en_i.value = 0
+        DUT.rst_sync_i.value = 1
+        await RisingEdge(DUT.clk_i)
+        DUT.rst_sync_i.value = 0
+
+
+    # Drives one byte per item, spending an enabled and a disabled clock cycle on each of them
+    async def __drive_single(self):
+
         # Main driver loop, receiving the sequence items and driving the input data
         while True:
 
             # Waits for the next sequence item
             seq_item = await self.seq_item_port.get_next_item()
-            self.input_data = seq_item.input_data
 
-            # Sets the input data to the DUT and enables it
-            DUT.CRC16_data_i.value = BinaryValue(value=self.input_data, n_bits=8)
-            DUT.CRC16_en_i.value = BinaryValue(value=1, n_bits=1)
+            # Resets the CRC register before the payload, if requested
+            if seq_item.reset:
+                await self.__drive_reset_cycle()
 
-            # Waits for the next clock rising edge
-            await RisingEdge(DUT.clk_i)
+            # Drives every byte of the item's payload
+            for self.input_data in seq_item.payload:
 
-            # Deasserts the enable signal
-            DUT.CRC16_en_i.value = BinaryValue(value=0, n_bits=1)
+                # Sets the input data to the DUT and enables it
+                DUT.CRC16_data_i.value = self.input_data
+                DUT.CRC16_en_i.value = BinaryValue(value=1, n_bits=1)
 
-            # Waits for the next clock rising edge
-            await RisingEdge(DUT.clk_i)
+                # Waits for the next clock rising edge
+                await RisingEdge(DUT.clk_i)
+
+                # Deasserts the enable signal
+                DUT.CRC16_en_i.value = BinaryValue(value=0, n_bits=1)
+
+                # Waits for the next clock rising edge
+                await RisingEdge(DUT.clk_i)
 
-            # Prints the input data value
-            self.logger.info("[DRIVER]: The data input is: %i" % self.input_data)
+            # Prints the driven payload
+            self.logger.info("[DRIVER]: %i byte(s) of data input driven, the last one is: %i" % (len(seq_item.payload), self.input_data))
 
             # Finishs the item
             self.seq_item_port.item_done()
 
 
 # UVM Monitor for the crc16citt_module
-class crc16citt_monitor(uvm_monitor):
+class crc16citt_monitor(profiled_component, uvm_monitor):
 
     # Monitor's build phase
     def build_phase(self):
 
-        # Initializes the dictionary containing the input values and the output values
-        self.dut_values = {
-            "input_values": {"rst_sync_i": 0, "CRC16_en_i": 0, "CRC16_data_i": 0},
-            "output_values": {"CRC16_data_o": 0}
-        }
+        # Initializes the analysis port, batching the transactions of the batched subscribers in the batch mode
+        if BATCH_ANALYSIS_MODE:
+            self.analysis_port = batch_analysis_port("analysis_port", self, BATCH_SIZE, BATCH_FLUSH_INTERVAL or None)
+        else:
+            self.analysis_port = uvm_analysis_port("analysis_port", self)
+
+        # Initializes the flag of an enabled cycle whose output was not sampled yet
+        self.output_pending = False
 
-        # Initializes the analysis port
-        self.analysis_port = uvm_analysis_port("analysis_port", self)
+
+    # Monitor's extract phase
+    def extract_phase(self):
+
+        # Writes the output of the last enabled cycle, settled at the end of the test, as no rising edge samples it
+        if self.output_pending:
+            self.analysis_port.write(crc16citt_output_transaction(DUT.rst_sync_i.value.integer, 0, DUT.CRC16_data_i.value.integer, DUT.CRC16_out_o.value.integer))
+            self.output_pending = False
+
+        # Delivers the transactions still buffered by the batched analysis port, before the check phase of its subscribers
+        if BATCH_ANALYSIS_MODE:
+            self.analysis_port.flush()
 
 
     # Monitor's run_phase operation        
     async def run_phase(self):
 
+        # In the dispatcher mode, the signals are sampled by a handler of every rising edge
+        if CYCLE_DISPATCHER_MODE:
+            self.dispatcher.register(cycle_dispatcher.SAMPLE, self.profile_callback("sample_cycle", self.__sample_cycle))
+            return
+
         # Waits for the clock signal to start
         await RisingEdge(DUT.clk_i)
 
         # Obtains all the signals from the DUT, emitting them to the analysis port
         while True:
 
-            # If the DUT is not resetted, the signals are not valid
-            if DUT.rst_sync_i.value != BinaryValue(value=1, n_bits=1) and DUT.CRC16_en_i.value == BinaryValue(value=1, n_bits=1):
+            # Samples the signals of this rising edge, as the dispatcher handler does
+            self.__sample_cycle(None)
 
-                # Obtains the input values from the DUT
-                self.dut_values["input_values"]["rst_sync_i"] = DUT.rst_sync_i.value.integer
-                self.dut_values["input_values"]["CRC16_en_i"] = DUT.CRC16_en_i.value.integer
-                self.dut_values["input_values"]["CRC16_data_i"] = DUT.CRC16_data_i.value.integer
+            # Waits for the next clock rising edge
+            await RisingEdge(DUT.clk_i)
 
-                # Obtains the output values from the DUT
-                self.dut_values["output_values"]["CRC16_data_o"] = DUT.CRC16_out_o.value.integer
 
-                # Initializes the output sequence item
-                output_seq_item = crc16citt_output_seq_item("crc16citt_output_seq_item", self.dut_values)
+    # Samples the signals from the DUT on a rising edge of the clock, emitting them to the analysis port
+    def __sample_cycle(self, cycle):
 
-                # Writes the output sequence item to the analysis port
-                self.analysis_port.write(output_seq_item)
+        # Obtains the control signals from the DUT
+        rst_sync_i = DUT.rst_sync_i.value.integer
+        CRC16_en_i = DUT.CRC16_en_i.value.integer
 
-                # Waits for the next clock rising edge
-                await RisingEdge(DUT.clk_i)
-
-            else:
+        # If the DUT is enabled and not resetted, writes a new transaction, with the input and output values from the DUT, to the analysis port
+        if rst_sync_i == 0 and CRC16_en_i == 1:
+            self.analysis_port.write(crc16citt_output_transaction(rst_sync_i, CRC16_en_i, DUT.CRC16_data_i.value.integer, DUT.CRC16_out_o.value.integer))
+            self.output_pending = True
 
-                # Waits for the next clock rising edge
-                await RisingEdge(DUT.clk_i)
+        # On the first reset cycle after an enabled one, writes the output of the last byte, as the CRC register restarts on this rising edge
+        elif rst_sync_i == 1 and self.output_pending:
+            self.analysis_port.write(crc16citt_output_transaction(rst_sync_i, CRC16_en_i, DUT.CRC16_data_i.value.integer, DUT.CRC16_out_o.value.integer))
+            self.output_pending = False
 
 
 # UVM Predictor for the crc16citt_module
-class crc16citt_predictor(uvm_subscriber):
+class crc16citt_predictor(profiled_component, uvm_subscriber):
 
     # Initialization of the predictor
     def __init__(self, name, parent=None):
         super().__init__(name, parent)
 
-        # Initializes the expected and observed output values
-        self.expected_dut_values = {
-            "input_values": {"rst_sync_i": 0, "CRC16_en_i": 0, "CRC16_data_i": 0},
-            "output_values": {"CRC16_data_o": 0}
-        }
-        self.observed_dut_values = {
-            "input_values": {"rst_sync_i": 0, "CRC16_en_i": 0, "CRC16_data_i": 0},
-            "output_values": {"CRC16_data_o": 0}
-        }
+        # Initializes the observed transaction and the expected output value
+        self.observed_transaction = None
+        self.expected_crc = CRC16CITT_INIT
 
 
-    # Method to predict the output values based on the input values
+    # Method to predict the output value based on the observed transaction
     def __predict_output(self):
 
         # Calculates the CRC16-CITT of the input data
-        input_data = self.observed_dut_values["input_values"]["CRC16_data_i"]
-        previous_crc = self.observed_dut_values["output_values"]["CRC16_data_o"]
-        calculated_crc = calculate_crc(input_data, previous_crc)
-
-        # Updates the expected output value
-        self.expected_dut_values["output_values"]["CRC16_data_o"] = calculated_crc
+        previous_crc = self.observed_transaction.CRC16_out_o
+        calculated_crc = calculate_crc(self.observed_transaction.CRC16_data_i, previous_crc)
 
         # Prints the expected output value and the observed output value
-        self.logger.info("[PREDICTOR]: The previous observed output is: %s" % self.observed_dut_values["output_values"]["CRC16_data_o"])
-        self.logger.info("[PREDICTOR]: The expected output is: %s" % self.expected_dut_values["output_values"]["CRC16_data_o"])
+        self.logger.info("[PREDICTOR]: The previous observed output is: %s" % previous_crc)
+        self.logger.info("[PREDICTOR]: The expected output is: %s" % calculated_crc)
         
         # Returns the expected output value
-        return self.expected_dut_values
+        return calculated_crc
     
 
     # Build phase of the predictor
@@ -279,21 +597,178 @@ class crc16citt_predictor(uvm_subscriber):
         self.logger.info("[PREDICTOR]: The predictor is being built...")
 
         # Initializes the expected output value
-        self.expected_dut_values["output_values"]["CRC16_data_o"] = 0xFFFF
+        self.expected_crc = CRC16CITT_INIT
 
     
     # Write method for the analysis export
     def write(self, item):
 
-        # Gets the input and output values from the item
-        self.observed_dut_values = item.dut_values
+        # Gets the transaction with the input and output values
+        self.observed_transaction = item
+
+        # Updates the expected value based on the observed values, the CRC register restarting after a reset
+        self.expected_crc = CRC16CITT_INIT if item.rst_sync_i else self.__predict_output()
+
+
+# UVM Predictor for the crc16citt_module, checking every observed output against the previous one advanced by its input byte, on a worker thread
+class crc16citt_worker_predictor(profiled_component, worker_subscriber):
+
+    # Initialization of the predictor
+    def __init__(self, name, parent=None):
+        super().__init__(name, parent, PREDICTOR_FAIL_FAST)
+
+        # Initializes the expected output value, updated by the worker thread only
+        self.expected_crc = CRC16CITT_INIT
+
+
+    # Check method, ran by the worker thread for every transaction
+    def check(self, item):
+
+        # Compares the observed output with the expected one and predicts the next one, the CRC register restarting after a reset
+        observed_crc, expected_crc = item.CRC16_out_o, self.expected_crc
+        self.expected_crc = CRC16CITT_INIT if item.rst_sync_i else calculate_crc(item.CRC16_data_i, observed_crc)
+
+        if observed_crc != expected_crc:
+            return "data input 0x%02X, observed output 0x%04X, expected output 0x%04X" % (item.CRC16_data_i, observed_crc, expected_crc)
+
+
+# UVM Scoreboard for the crc16citt_module, storing the observed trace and checking it in vectorized passes
+class crc16citt_scoreboard(profiled_component, batch_subscriber):
+
+    # Initialization of the scoreboard
+    def __init__(self, name, parent=None):
+        super().__init__(name, parent)
+
+        # Initializes the g_crc_init of the DUT, set per lane by the multi-lane environment
+        self.crc_init = CRC16CITT_INIT
+
+        # Initializes the preallocated trace arrays and its counters
+        self.reset = np.empty(SCOREBOARD_INITIAL_CAPACITY, dtype=np.uint8)
+        self.data = np.empty(SCOREBOARD_INITIAL_CAPACITY, dtype=np.uint8)
+        self.observed_crc = np.empty(SCOREBOARD_INITIAL_CAPACITY, dtype=np.uint16)
+        self.item_num = 0
+        self.checked_num = 0
+
+
+    # Method to check the items stored since the last check, failing on the first mismatch
+    def __check_trace(self):
+
+        # Nothing to check
+        if self.checked_num == self.item_num:
+            return
+
+        # The first item is checked against the g_crc_init value, the next ones against the last checked item
+        start = max(self.checked_num - 1, 0)
+        initial_crc = self.crc_init if self.checked_num == 0 else self.observed_crc[start]
+
+        # Calculates the expected outputs and looks for the first mismatch
+        expected_crc = crc16citt_expected_outputs(self.data[start:self.item_num], self.observed_crc[start:self.item_num], initial_crc)
+
+        # The items following a reset are checked against the g_crc_init value, as the CRC register restarted
+        expected_crc[1:][self.reset[start:self.item_num - 1] == 1] = self.crc_init
+
+        mismatch = crc16citt_first_mismatch(expected_crc, self.observed_crc[start:self.item_num])
+
+        # Prints the items around the first mismatch and fails the test
+        if mismatch != -1:
+
+            mismatch += start
+            self.logger.error("[SCOREBOARD]: Mismatch at item %i of %i, context:" % (mismatch, self.item_num))
+
+            for index in range(max(mismatch - SCOREBOARD_CONTEXT_ITEMS, start), min(mismatch + SCOREBOARD_CONTEXT_ITEMS + 1, self.item_num)):
+                self.logger.error("[SCOREBOARD]: %s item %i: data input 0x%02X, observed output 0x%04X, expected output 0x%04X" % (
+                    "->" if index == mismatch else "  ", index, self.data[index], self.observed_crc[index], expected_crc[index - start]))
+
+            assert False, "The observed CRC16 at item %i is 0x%04X and should be 0x%04X" % (mismatch, self.observed_crc[mismatch], expected_crc[mismatch - start])
+
+        # Updates the number of checked items
+        self.checked_num = self.item_num
+
+
+    # Method to double the trace arrays until they fit a number of items
+    def __reserve(self, item_num):
+
+        while item_num > self.data.size:
+            self.reset = np.concatenate((self.reset, np.empty_like(self.reset)))
+            self.data = np.concatenate((self.data, np.empty_like(self.data)))
+            self.observed_crc = np.concatenate((self.observed_crc, np.empty_like(self.observed_crc)))
+
+
+    # Write method for the analysis export
+    def write(self, item):
+
+        # Doubles the trace arrays if they are full
+        self.__reserve(self.item_num + 1)
+
+        # Stores the reset, the input data and the observed output
+        self.reset[self.item_num] = item.rst_sync_i
+        self.data[self.item_num] = item.CRC16_data_i
+        self.observed_crc[self.item_num] = item.CRC16_out_o
+        self.item_num += 1
+
+        # Checks the trace every SCOREBOARD_CHECK_INTERVAL items, if enabled
+        if SCOREBOARD_CHECK_INTERVAL and self.item_num - self.checked_num >= SCOREBOARD_CHECK_INTERVAL:
+            self.__check_trace()
+
+
+    # Batched write method for the analysis export, storing a whole batch of transactions at once
+    def write_batch(self, items):
+
+        # Converts the batch into an array with a column per field of the transactions
+        batch = np.array(items, dtype=np.uint32)
+        end = self.item_num + len(batch)
+        self.__reserve(end)
+
+        # Stores the resets, the input data and the observed outputs
+        self.reset[self.item_num:end] = batch[:, 0]
+        self.data[self.item_num:end] = batch[:, 2]
+        self.observed_crc[self.item_num:end] = batch[:, 3]
+        self.item_num = end
+
+        # Checks the trace every SCOREBOARD_CHECK_INTERVAL items, if enabled
+        if SCOREBOARD_CHECK_INTERVAL and self.item_num - self.checked_num >= SCOREBOARD_CHECK_INTERVAL:
+            self.__check_trace()
+
+
+    # Check phase of the scoreboard
+    def check_phase(self):
+
+        # Checks the remaining items of the trace
+        self.__check_trace()
+
+        # Prints the number of checked items
+        self.logger.info("[SCOREBOARD]: %i items checked, no mismatches found" % self.item_num)
+
 
-        # Updates the expected values based on the observed values
-        self.expected_dut_values = self.__predict_output()
+# UVM Subscriber sampling the functional coverage of the crc16citt_module
+class crc16citt_coverage(profiled_component, uvm_subscriber):
+
+    # Name of the covergroup, set per lane by the multi-lane environment
+    covergroup_name = "crc16citt_data_x_reset"
+
+    # Coverage's build phase
+    def build_phase(self):
+
+        # Initializes the covergroup, the first byte following the initial reset
+        self.covergroup = covergroup(self.covergroup_name, COVERAGE_AXES)
+        self.after_reset = True
+
+
+    # Write method for the analysis export
+    def write(self, item):
+
+        # A reset restarts the CRC register, so the next byte is sampled in the reset state
+        if item.rst_sync_i:
+            self.after_reset = True
+
+        # Samples the input byte of every enabled cycle
+        elif item.CRC16_en_i:
+            self.covergroup.sample(item.CRC16_data_i, int(self.after_reset))
+            self.after_reset = False
 
 
 # UVM Env for the sequencer, driver and monitor
-class crc16citt_environment(uvm_env):
+class crc16citt_environment(profiled_component, uvm_env):
 
     # Builds the test environment
     def build_phase(self):
@@ -301,20 +776,53 @@ class crc16citt_environment(uvm_env):
         # Creates all relevant entities
         self.sequencer = crc16citt_sequencer.create("crc16citt_sequencer", self)
         self.driver    = crc16citt_driver.create("crc16citt_driver", self)
-        self.monitor   = crc16citt_monitor.create("crc16citt_monitor", self)
-        self.predictor = crc16citt_predictor.create("crc16citt_predictor", self)
+
+        # Creates the monitor and the deferred scoreboard or the per-item (worker) predictor, unless the checking is left to the offline checker
+        if LIVE_CHECK_MODE:
+            self.monitor = crc16citt_monitor.create("crc16citt_monitor", self)
+
+            if SCOREBOARD_MODE:
+                self.predictor = crc16citt_scoreboard.create("crc16citt_scoreboard", self)
+            elif PREDICTOR_WORKER_MODE:
+                self.predictor = crc16citt_worker_predictor.create("crc16citt_worker_predictor", self)
+            else:
+                self.predictor = crc16citt_predictor.create("crc16citt_predictor", self)
+
+            # Creates the functional coverage subscriber
+            if COVERAGE_MODE:
+                self.coverage = crc16citt_coverage.create("crc16citt_coverage", self)
+
+        # Creates the cycle dispatcher shared by the monitor and the driver
+        if CYCLE_DISPATCHER_MODE:
+            self.dispatcher = cycle_dispatcher(DUT.clk_i)
 
     # Connects the environment's modules
     def connect_phase(self):
 
         # Connects the sequencer, driver, monitor and predictor
         self.driver.seq_item_port.connect(self.sequencer.seq_item_export)
-        self.monitor.analysis_port.connect(self.predictor.analysis_export)
+        if LIVE_CHECK_MODE:
+            self.monitor.analysis_port.connect(self.predictor.analysis_export)
+
+            if COVERAGE_MODE:
+                self.monitor.analysis_port.connect(self.coverage.analysis_export)
+
+        # Connects the monitor and the driver to the cycle dispatcher
+        if CYCLE_DISPATCHER_MODE:
+            self.driver.dispatcher = self.dispatcher
+            if LIVE_CHECK_MODE:
+                self.monitor.dispatcher = self.dispatcher
+
+    # Starts the cycle dispatcher
+    async def run_phase(self):
+
+        if CYCLE_DISPATCHER_MODE:
+            self.dispatcher.start()
 
 
 # UVM CRC16-CITT module testbench
 @pyuvm.test()
-class counter_test(uvm_test):
+class counter_test(profiled_component, uvm_test):
 
     # Initialization of the test
     def build_phase(self):
@@ -333,33 +841,73 @@ class counter_test(uvm_test):
     async def run_phase(self):
 
         self.raise_objection()
+
+        # Starts the wave policy, which dumps the allow-listed signals inside its window when enabled, into a file named after the test
+        wave_policy(cocotb.top, WAVE_SIGNALS, type(self).__name__, WAVE_START, WAVE_STOP).start()
+
         cocotb.start_soon(Clock(cocotb.top.clk_i, 10, 'ns').start())
         await self.sequence.start(self.env.sequencer)
+
+        # Waits for the DUT to settle, so the monitor samples the CRC of the last byte at the end of the test
+        await ReadOnly()
         self.drop_objection()
 
-    
 
-    
+    # Report phase
+    def report_phase(self):
 
+        # Reports the functional coverage, into a file named after the test
+        if LIVE_CHECK_MODE and COVERAGE_MODE:
+            write_coverage([self.env.coverage.covergroup], type(self).__name__, self.logger.info)
 
+        # Reports the profile of the components, into files named after the test, when PROFILE_DIR is set
+        write_profile(self, type(self).__name__, self.logger.info)
 
 
-    
+# UVM CRC16-CITT module testbench, driving whole packets instead of single bytes
+@pyuvm.test()
+class crc16citt_packet_test(counter_test):
 
+    def end_of_elaboration_phase(self):
 
+        # Creates the packet sequence
+        self.sequence = crc16citt_packet_sequence.create("crc16citt_packet_sequence")
 
 
+# UVM CRC16-CITT module testbench, driving input bytes until every one of them is covered
+@pyuvm.test()
+class crc16citt_closure_test(counter_test):
 
-        
+    def end_of_elaboration_phase(self):
 
+        # Skips the test without the monitor or the functional coverage, which steer the closure sequence
+        self.closure_enabled = LIVE_CHECK_MODE and COVERAGE_MODE
+        if not self.closure_enabled:
+            self.logger.warning("Skipping the coverage closure test, which needs LIVE_CHECK_MODE and COVERAGE_MODE")
+            return
 
+        # Creates the closure sequence, steered by the coverage subscriber
+        self.sequence = crc16citt_closure_sequence.create("crc16citt_closure_sequence")
+        self.sequence.coverage = self.env.coverage
 
 
-    
+    # Run phase, skipped with the test
+    async def run_phase(self):
 
+        if self.closure_enabled:
+            await super().run_phase()
 
-    
 
-    
+    # Check phase
+    def check_phase(self):
+
+        if not self.closure_enabled:
+            return
+
+        # Fails the test if the sequence ran out of items before every bin was covered
+        covergroup = self.env.coverage.covergroup
+        assert covergroup.closed, "Only %i of the %i bins were covered in %i items" % (covergroup.covered, covergroup.bins, CLOSURE_MAX_ITEMS)
 
 
+# Binds the tests requested by TESTCASE under their class names, the names of results.xml
+bind_test_classes(globals())
@@ -0,0 +1,17 @@
+rem Deletando os códigos dos módulos colocados previamente...
+del /Q ".\ext_files\FPGA_Development\*"
+
+rem Movendo os arquivos atualizados para a pasta FPGA_Developments...
+copy "..\crc16citt_module.vhd" ".\ext_files\FPGA_Development\"
+
+rem Iniciando o worker de simulação, caso ainda não esteja rodando (a imagem só é buildada se não existir)
+docker-compose up -d worker_service
+
+rem Gerando um identificador de job único, para os resultados de execuções anteriores não serem sobrescritos
+for /f %%i in ('powershell -NoProfile -Command "Get-Date -Format yyyyMMdd_HHmmss"') do set JOB_ID=crc16citt_%%i_%RANDOM%
+
+rem Submetendo o teste ao worker e aguardando o resultado (argumentos extras, como --seed ou --testcase, são repassados)
+docker exec crc16_module_cocotb_worker python3 -m verification_tools.sim_worker submit --job-dir /cocotb/jobs --testbench crc16citt --job-id %JOB_ID% --waves %*
+
+rem Executa o arquivo de simulação
+gtkwave.exe .\jobs\results\%JOB_ID%\simulation.ghw
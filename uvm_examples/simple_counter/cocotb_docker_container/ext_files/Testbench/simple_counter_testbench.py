@@ -11,7 +11,6 @@
 # Libraries
 
 import cocotb
-import random
 from pyuvm import *
 import pyuvm
 from fastcrc import crc16
@@ -19,6 +18,12 @@ from cocotb.triggers import Timer
 from cocotb.clock import Clock
 from cocotb.triggers import *
 from cocotb.binary import *
+from collections import namedtuple
+from verification_tools.coverage import covergroup, write_coverage
+from verification_tools.cycle_dispatcher import cycle_dispatcher
+from verification_tools.stimulus_pool import stimulus_pool
+from verification_tools.testcase_names import bind_test_classes
+from verification_tools.wave_policy import wave_policy
 
 ##########################################################################################################################################################################
 
@@ -33,6 +38,21 @@ MAX_CLK_CYCLES = 1000000000
 ## Constant for the RST TIME of the testbench
 RST_TIME = 30
 
+## Constant for the dispatcher mode: when True, the monitor and the driver are handlers of a single cycle dispatcher, instead of coroutines awaiting every rising edge
+CYCLE_DISPATCHER_MODE = True
+
+## Constants for the wave policy (make WAVES=policy): allow-list of the dumped signals and window of the dump, in ns since the start of the test, WAVE_STOP None being the end of the test
+WAVE_SIGNALS = ["clk", "reset", "enable", "count"]
+WAVE_START = 0
+WAVE_STOP = None
+
+## Constants for the functional coverage: every (count, enable) pair sampled on a rising edge, the (15, 1) bin being the wraparound of the count, reported
+## (and written into COVERAGE_DIR, if set) at the end of the test
+COVERAGE_MODE = True
+COVERAGE_AXES = [("count", 16), ("enable", 2)]
+
+## Constant for the coverage closure test: maximum number of items of its sequence, which stops as soon as every bin is covered
+CLOSURE_MAX_ITEMS = 256
 
 ##########################################################################################################################################################################
 
@@ -43,6 +63,9 @@ RST_TIME = 30
 test_is_running = True
 num_tests = 0
 
+## Stimulus pool of the enable values, seeded from RANDOM_SEED
+enable_pool = stimulus_pool("counter_enable", 0, 1)
+
 ##########################################################################################################################################################################
 
 
@@ -73,7 +96,12 @@ class counter_seq_item(uvm_sequence_item):
     # Randomize the transaction
     def randomize(self):
 
-        self.enable_value = random.randint(0, 1)
+        self.enable_value = enable_pool.next()
+
+
+# Immutable transaction for the Monitor&Coverage communication, holding the values sampled on a rising edge as plain ints
+class counter_transaction(namedtuple("counter_transaction", "enable count")):
+    __slots__ = ()
 
 
 # UVM Sequence to be ran by the sequencer
@@ -94,6 +122,37 @@ class counter_sequence(uvm_sequence):
             await self.finish_item(seq_item)
 
 
+# UVM Sequence steered by the functional coverage: on every item, holds the count if it was not sampled disabled yet, and increments it otherwise, until every
+# (count, enable) bin, the wraparound included, is covered
+class counter_closure_sequence(uvm_sequence):
+
+    # Reinterpretation of the body
+    async def body(self):
+
+        # Obtains the coverage subscriber, set by the test, and initializes the enable of the previous item, driven but not sampled yet
+        coverage = self.coverage
+        previous_enable = 0
+
+        for _ in range(CLOSURE_MAX_ITEMS):
+
+            # Stops as soon as every bin is covered
+            if coverage.covergroup.closed:
+                break
+
+            # Initialize the seq item and starts it
+            seq_item = counter_seq_item("seq_item")
+            await self.start_item(seq_item)
+
+            # Predicts the count sampled with the item, from the last sampled transaction and the previous item, and enables the counter if it was already
+            # sampled disabled
+            last_transaction = coverage.last_transaction
+            count = (last_transaction.count + last_transaction.enable + previous_enable) % 16 if last_transaction else 0
+            seq_item.enable_value = previous_enable = int(coverage.covergroup.hit(count, 0))
+
+            # Finishs the item
+            await self.finish_item(seq_item)
+
+
 # UVM Driver for the counter
 class counter_driver(uvm_driver):
 
@@ -117,11 +176,25 @@ class counter_driver(uvm_driver):
     # Driver's run_phase operation
     async def run_phase(self):
 
+        # In the dispatcher mode, the enable signal is driven by a handler of every rising edge
+        if CYCLE_DISPATCHER_MODE:
+            self.seq_item = None
+            self.item_driven = Event()
+            self.dispatcher.register(cycle_dispatcher.DRIVE, self.__drive_cycle)
+
         # Waits for receiving a transaction from the sequencer
         while True:
 
             seq_item = await self.seq_item_port.get_next_item()
 
+            # In the dispatcher mode, hands the item to the handler and waits for it to be driven
+            if CYCLE_DISPATCHER_MODE:
+                self.seq_item = seq_item
+                await self.item_driven.wait()
+                self.item_driven.clear()
+                self.seq_item_port.item_done()
+                continue
+
             # Waits for a cycle of clock
             await RisingEdge(cocotb.top.clk)
 
@@ -135,16 +208,68 @@ class counter_driver(uvm_driver):
             self.seq_item_port.item_done()
 
 
+    # Drives the enable signal of the pending item, if any, on a rising edge of the clock
+    def __drive_cycle(self, cycle):
+
+        if self.seq_item is not None:
+
+            # Sets the enable signal based on the transaction item and prints it
+            cocotb.top.enable.value = BinaryValue(value = self.seq_item.enable_value, n_bits = 1)
+            self.logger.info("The enable signal has been randomly changed into: %i..." % self.seq_item.enable_value)
+
+            # Signals that the item was driven
+            self.seq_item = None
+            self.item_driven.set()
+
+
 # UVM Monitor for the counter
 class counter_monitor(uvm_monitor):
 
+    # Monitor's build phase
+    def build_phase(self):
+
+        # Initializes the analysis port
+        self.analysis_port = uvm_analysis_port("analysis_port", self)
+
+
     async def run_phase(self):
 
+        # In the dispatcher mode, the output signals are printed by a handler of every rising edge
+        if CYCLE_DISPATCHER_MODE:
+            self.dispatcher.register(cycle_dispatcher.SAMPLE, self.__sample_cycle)
+            return
+
         # Prints all the output signals from the counter, every clock cycle
         while True:
 
             await RisingEdge(cocotb.top.clk)
-            self.logger.info("The counter_value is: %i" % cocotb.top.count.value.integer)
+            self.__sample_cycle(None)
+
+
+    # Prints the output signals from the counter on a rising edge of the clock, emitting them to the analysis port
+    def __sample_cycle(self, cycle):
+
+        count = cocotb.top.count.value.integer
+        self.logger.info("The counter_value is: %i" % count)
+        self.analysis_port.write(counter_transaction(cocotb.top.enable.value.integer, count))
+
+
+# UVM Subscriber sampling the functional coverage of the counter
+class counter_coverage(uvm_subscriber):
+
+    # Coverage's build phase
+    def build_phase(self):
+
+        # Initializes the covergroup and the last sampled transaction, read by the closure sequence
+        self.covergroup = covergroup("contador_count_x_enable", COVERAGE_AXES)
+        self.last_transaction = None
+
+
+    # Write method for the analysis export
+    def write(self, item):
+
+        self.covergroup.sample(item.count, item.enable)
+        self.last_transaction = item
 
 
 # UVM Env for the sequencer, driver and monitor
@@ -158,12 +283,36 @@ class counter_environment(uvm_env):
         self.driver    = counter_driver.create("counter_driver", self)
         self.monitor   = counter_monitor.create("counter_monitor", self)
 
+        # Creates the functional coverage subscriber
+        if COVERAGE_MODE:
+            self.coverage = counter_coverage.create("counter_coverage", self)
+
+        # Creates the cycle dispatcher shared by the monitor and the driver
+        if CYCLE_DISPATCHER_MODE:
+            self.dispatcher = cycle_dispatcher(cocotb.top.clk)
+
 
     # Connects the environment's modules
     def connect_phase(self):
         
         self.driver.seq_item_port.connect(self.sequencer.seq_item_export)
 
+        # Connects the monitor to the functional coverage subscriber
+        if COVERAGE_MODE:
+            self.monitor.analysis_port.connect(self.coverage.analysis_export)
+
+        # Connects the monitor and the driver to the cycle dispatcher
+        if CYCLE_DISPATCHER_MODE:
+            self.monitor.dispatcher = self.dispatcher
+            self.driver.dispatcher = self.dispatcher
+
+
+    # Starts the cycle dispatcher
+    async def run_phase(self):
+
+        if CYCLE_DISPATCHER_MODE:
+            self.dispatcher.start()
+
 
 # UVM Counter test
 @pyuvm.test()
@@ -185,6 +334,10 @@ class counter_test(uvm_test):
     async def run_phase(self):
 
         self.raise_objection()
+
+        # Starts the wave policy, which dumps the allow-listed signals inside its window when enabled, into a file named after the test
+        wave_policy(cocotb.top, WAVE_SIGNALS, type(self).__name__, WAVE_START, WAVE_STOP).start()
+
         cocotb.start_soon(Clock(cocotb.top.clk, 10, 'ns').start())
         await self.sequence.start(self.env.sequencer)
         self.drop_objection()
@@ -215,3 +368,47 @@ class counter_test(uvm_test):
     
 
 
+    # Report phase
+    def report_phase(self):
+
+        # Reports the functional coverage, into a file named after the test
+        if COVERAGE_MODE:
+            write_coverage([self.env.coverage.covergroup], type(self).__name__, self.logger.info)
+
+
+# UVM Counter test, toggling the enable signal until every (count, enable) bin is covered
+@pyuvm.test()
+class counter_closure_test(counter_test):
+
+    def end_of_elaboration_phase(self):
+
+        # Skips the test without the functional coverage, which steers the closure sequence
+        if not COVERAGE_MODE:
+            self.logger.warning("Skipping the coverage closure test, which needs COVERAGE_MODE")
+            return
+
+        # Creates the closure sequence, steered by the coverage subscriber
+        self.sequence = counter_closure_sequence.create("counter_closure_sequence")
+        self.sequence.coverage = self.env.coverage
+
+
+    # Run phase, skipped with the test
+    async def run_phase(self):
+
+        if COVERAGE_MODE:
+            await super().run_phase()
+
+
+    # Check phase
+    def check_phase(self):
+
+        if not COVERAGE_MODE:
+            return
+
+        # Fails the test if the sequence ran out of items before every (count, enable) bin was covered
+        covergroup = self.env.coverage.covergroup
+        assert covergroup.closed, "Only %i of the %i (count, enable) bins were covered in %i items" % (covergroup.covered, covergroup.bins, CLOSURE_MAX_ITEMS)
+
+
+# Binds the tests requested by TESTCASE under their class names, the names of results.xml
+bind_test_classes(globals())
@@ -0,0 +1,7 @@
+##########################################################################################################################################################################
+# verification_tools/__init__.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this package contains the verification tools shared by the cocotb and pyuvm testbenches of this repository. Add the repository root to the PYTHONPATH
+# (the testbench Makefiles do it through VERIFICATION_TOOLS_DIR) to import them.
+##########################################################################################################################################################################
@@ -0,0 +1,140 @@
+##########################################################################################################################################################################
+# batch_analysis_port.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the batching analysis port of the pyuvm testbenches. It is a uvm_analysis_port whose subscribers choose their delivery: the per-item
+# ones (any uvm_subscriber) receive every transaction on write, as usual, and the batched ones (batch_subscriber) receive lists of transactions, collected in a
+# bounded buffer and delivered when it holds batch_size transactions, every flush_interval ns of simulation time (if set) and on flush, which the monitor calls at
+# the end of the test (extract_phase). A stream of millions of transactions then costs a list append per transaction, instead of a pyuvm export call for every
+# transaction and subscriber.
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import cocotb
+from cocotb.triggers import Timer
+from pyuvm import error_classes, uvm_analysis_port, uvm_subscriber
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant for the default number of transactions of every batch
+BATCH_SIZE = 4096
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Batch analysis port classes
+
+class batch_analysis_port(uvm_analysis_port):
+# Description: this class contains the batching analysis port, delivering every transaction to the per-item subscribers and lists of them to the batched ones.
+
+    def __init__(self, name, parent, batch_size=BATCH_SIZE, flush_interval=None):
+    # Description: this function initializes the port and its buffer.
+    # Parameters: name, parent: as in uvm_analysis_port; batch_size: number of transactions delivered at once; flush_interval: simulation time between the
+    # deliveries of the buffer, in ns, None delivering it only when full and on flush.
+    # Returns: None.
+
+        super().__init__(name, parent)
+
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.item_subscribers = []
+        self.batch_subscribers = []
+        self.buffer = []
+        self.flush_task = None
+
+
+    def connect(self, export):
+    # Description: this function connects a subscriber, batched if its export delivers batches (write_batch) and per-item otherwise.
+    # Parameters: export: the analysis export of the subscriber.
+    # Returns: None.
+
+        super().connect(export)
+
+        if hasattr(export, "write_batch"):
+            self.batch_subscribers.append(export)
+        else:
+            self.item_subscribers.append(export)
+
+
+    def write(self, datum):
+    # Description: this function writes a transaction: it is delivered to the per-item subscribers and buffered for the batched ones.
+    # Parameters: datum: the transaction.
+    # Returns: None.
+
+        for export in self.item_subscribers:
+            export.write(datum)
+
+        if not self.batch_subscribers:
+            return
+
+        # Buffers the transaction, delivering the buffer when full
+        self.buffer.append(datum)
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+        # Starts the periodic delivery on the first transaction
+        elif self.flush_interval and self.flush_task is None:
+            self.flush_task = cocotb.start_soon(self.__flush_periodically())
+
+
+    def flush(self):
+    # Description: this function delivers the buffered transactions to the batched subscribers, as a single list.
+    # Parameters: None.
+    # Returns: None.
+
+        if not self.buffer:
+            return
+
+        batch, self.buffer = self.buffer, []
+        for export in self.batch_subscribers:
+            export.write_batch(batch)
+
+
+    async def __flush_periodically(self):
+    # Description: this function delivers the buffer every flush_interval ns.
+    # Parameters: None.
+    # Returns: None.
+
+        while True:
+            await Timer(self.flush_interval, units="ns")
+            self.flush()
+
+
+class batch_subscriber(uvm_subscriber):
+# Description: this class contains a batched subscriber. Its export delivers the batches of a batch_analysis_port to write_batch, and single transactions (from
+# any other analysis port) to write, which defaults to a batch of one.
+
+    def __init__(self, name, parent):
+    # Description: this function initializes the subscriber, its analysis export delivering batches to write_batch.
+    # Parameters: name, parent: as in uvm_subscriber.
+    # Returns: None.
+
+        super().__init__(name, parent)
+
+        self.analysis_export.write_batch = self.write_batch
+
+
+    def write(self, tt):
+    # Description: this function receives a single transaction, as a batch of one.
+    # Parameters: tt: the transaction.
+    # Returns: None.
+
+        self.write_batch([tt])
+
+
+    def write_batch(self, items):
+    # Description: this function receives a batch of transactions. It must be overridden, as the write of uvm_subscriber.
+    # Parameters: items: list of transactions, in order.
+    # Returns: None.
+
+        raise error_classes.UVMFatalError("You must override the write_batch() method in batch_subscriber %s" % self.get_full_name())
+
+##########################################################################################################################################################################
@@ -0,0 +1,212 @@
+##########################################################################################################################################################################
+# benchmark.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the throughput benchmark suite of the repository. It runs every testbench, and the synthetic stress test of its toplevel with
+# several numbers of cycles, under every simulator, with a fixed seed, and reports the simulated cycles per wall-clock second, the Python wakeups (simulator
+# callbacks) per cycle, the peak RSS of the simulation process and the size of the waveform files, saving them as JSON to be compared across cocotb, pyuvm and
+# testbench changes. The counters are measured inside the simulation by benchmark_probe.py, loaded next to the testbench module.
+# It runs from the repository root: python3 -m verification_tools.benchmark [--simulators ghdl nvc] [--testbenches ...] [--stress-cycles 100000 ...]
+# [--waves off|full|policy] [--output benchmark_results.json] [--ledger FILE | --no-ledger]
+# Every benchmark is also recorded into the run ledger (run_ledger.py), as the test benchmark:<variant>, so its throughput regressions are flagged.
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from importlib import metadata
+from verification_tools.regression_runner import CLOCK_PERIODS, DEFAULT_SIMULATORS, SIMULATORS, TESTBENCHES, run_job
+from verification_tools.run_ledger import DEFAULT_LEDGER, record_runs, regression_report, throughput_regressions
+from verification_tools.sim_worker import WAVE_EXTENSIONS
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant for the probe module, loaded next to the testbench module
+PROBE_MODULE = "verification_tools.benchmark_probe"
+
+## Constant mapping every testbench to its cocotb module. The cycles are the simulated time over the clock period of the testbench (CLOCK_PERIODS), so the
+## exhaustive sweep of the MUX, advancing in ps, reports few cycles: its stress test measures the throughput
+BENCHMARK_TESTBENCHES = {
+    "mux_8bit": "MUX_testbench",
+    "simple_state_machine": "simple_state_machine_testbench",
+    "simple_counter": "simple_counter_testbench",
+    "crc16citt": "crc16citt_testbench",
+    "crc16citt_multilane": "crc16citt_multilane_testbench",
+}
+
+## Constants for the default numbers of cycles of the stress tests and for the fixed seed of the benchmark
+STRESS_CYCLES = (100000, 1000000, 10000000)
+BENCHMARK_SEED = 1
+
+## Constant for the waveform modes, as the WAVES variable of the Makefiles
+WAVE_MODES = ("off", "full", "policy")
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Benchmark functions
+
+def run_benchmark(testbench, simulator, cycles, seed, work_dir, waves="off"):
+# Description: this function runs a benchmark: the tests of a testbench or, if cycles is given, the stress test of its toplevel, with the probe.
+# Parameters: testbench: key of BENCHMARK_TESTBENCHES; simulator: one of SIMULATORS; cycles: number of cycles of the stress test, None running the tests of the
+# testbench; seed: random seed; work_dir: root of the job directories; waves: one of WAVE_MODES.
+# Returns: A dictionary with the results of the benchmark.
+
+    module, clock_period = BENCHMARK_TESTBENCHES[testbench], CLOCK_PERIODS[testbench]
+    variant = "stress_%i" % cycles if cycles else "tests"
+
+    # Initializes the job directory, removing the files of a previous run
+    job_dir = os.path.abspath(os.path.join(work_dir, testbench, simulator, variant))
+    probe_file = os.path.join(job_dir, "probe.json")
+    os.makedirs(job_dir, exist_ok=True)
+
+    for name in os.listdir(job_dir):
+        if name == "probe.json" or name.endswith(WAVE_EXTENSIONS):
+            os.remove(os.path.join(job_dir, name))
+
+    # Runs the job with the probe module, the waveforms of the wave policy being written into the job directory
+    environment = {"BENCHMARK_PROBE_FILE": probe_file, "WAVES": waves, "WAVE_DIR": job_dir}
+    if cycles:
+        environment["STRESS_CYCLES"] = str(cycles)
+
+    job = run_job(testbench, simulator, seed, work_dir, waves == "full", testcase="benchmark_stress" if cycles else None, job_dir=job_dir,
+                  environment=environment, make_variables={"MODULE": "%s,%s" % (module, PROBE_MODULE)})
+
+    # Reads the counters of the tests run
+    tests = []
+    if os.path.exists(probe_file):
+        with open(probe_file) as probe:
+            tests = [test for test in json.load(probe) if not test["skipped"]]
+
+    wall_time = sum(test["wall_time"] for test in tests)
+    sim_time = sum(test["sim_time_ns"] for test in tests)
+    cycles_num = sim_time / clock_period
+
+    return {"testbench": testbench, "simulator": simulator, "variant": variant, "seed": seed, "returncode": job["returncode"], "job_wall_time": job["wall_time"],
+            "wall_time": wall_time, "sim_time_ns": sim_time, "cycles": cycles_num, "cycles_per_second": cycles_num / wall_time if wall_time else None,
+            "wakeups_per_cycle": sum(test["simulator_wakeups"] for test in tests) / cycles_num if cycles_num else None,
+            "scheduler_wakeups_per_cycle": sum(test["wakeups"] for test in tests) / cycles_num if cycles_num else None,
+            "peak_rss_mb": max((test["peak_rss_kb"] for test in tests), default=0) / 1024, "wave_bytes": wave_bytes(job_dir),
+            "job_dir": job_dir, "tests": tests}
+
+
+def wave_bytes(job_dir):
+# Description: this function obtains the size of the waveform files of a job.
+# Parameters: job_dir: the job directory.
+# Returns: The size, in bytes.
+
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(job_dir) for name in names if name.endswith(WAVE_EXTENSIONS))
+
+
+def benchmark_environment(seed, waves):
+# Description: this function obtains the versions and the host of the benchmark, stored along its results.
+# Parameters: seed: random seed; waves: the waveform mode.
+# Returns: A dictionary with the environment of the benchmark.
+
+    versions = {}
+    for package in ("cocotb", "pyuvm", "numpy"):
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+
+    return {"date": time.strftime("%Y-%m-%dT%H:%M:%S"), "host": platform.node(), "python": platform.python_version(), "cpu_count": os.cpu_count(),
+            "seed": seed, "waves": waves, "versions": versions}
+
+
+def record_benchmarks(results, ledger):
+# Description: this function records the benchmarks into the run ledger and prints the throughput regressions it flags.
+# Parameters: results: list of dictionaries returned by run_benchmark; ledger: path to the SQLite ledger file.
+# Returns: The number of throughput regressions.
+
+    # Records every benchmark as a run of the test benchmark:<variant>
+    runs = [{"testbench": result["testbench"], "simulator": result["simulator"], "seed": result["seed"], "test": "benchmark:" + result["variant"],
+             "wall_time": result["wall_time"], "sim_time_ns": result["sim_time_ns"], "cycles_per_second": result["cycles_per_second"],
+             "passed": result["returncode"] == 0} for result in results]
+    record_runs(ledger, runs, "benchmark")
+
+    # Prints the regressions against the previous runs
+    regressions = throughput_regressions(ledger)
+    print("%i run(s) recorded into %s, %i throughput regression(s)%s" % (len(runs), ledger, len(regressions), ":" if regressions else ""))
+    for line in regression_report(regressions):
+        print("    " + line)
+
+    return len(regressions)
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Main
+
+def main():
+
+    # Parses the benchmark arguments
+    parser = argparse.ArgumentParser(description="Measures the simulation throughput of the testbenches and of the synthetic stress tests")
+    parser.add_argument("--simulators", nargs="+", choices=SIMULATORS, default=list(DEFAULT_SIMULATORS), help="simulators to run")
+    parser.add_argument("--testbenches", nargs="+", choices=sorted(BENCHMARK_TESTBENCHES), default=sorted(BENCHMARK_TESTBENCHES), help="testbenches to run")
+    parser.add_argument("--stress-cycles", type=int, nargs="*", default=list(STRESS_CYCLES), help="cycles of the stress tests, none to skip them")
+    parser.add_argument("--no-tests", action="store_true", help="runs only the stress tests, not the tests of the testbenches")
+    parser.add_argument("--seed", type=int, default=BENCHMARK_SEED, help="random seed, fixed so the runs are comparable")
+    parser.add_argument("--waves", choices=WAVE_MODES, default="off", help="waveform mode of the runs")
+    parser.add_argument("--jobs", type=int, default=1, help="number of parallel benchmarks, default is 1 so they do not disturb each other")
+    parser.add_argument("--work-dir", default="benchmark_build", help="root of the job directories")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON results file")
+    parser.add_argument("--ledger", default=DEFAULT_LEDGER, help="SQLite run ledger recording every benchmark")
+    parser.add_argument("--no-ledger", action="store_true", help="does not record the benchmarks into the ledger")
+    args = parser.parse_args()
+
+    assert set(args.testbenches) <= set(TESTBENCHES), "The testbenches %s are not in the regression runner" % (set(args.testbenches) - set(TESTBENCHES))
+
+    # Runs every benchmark, printing it as it finishes
+    variants = ([] if args.no_tests else [None]) + args.stress_cycles
+    benchmarks = [(testbench, simulator, cycles) for testbench in args.testbenches for simulator in args.simulators for cycles in variants]
+    results = []
+
+    print("%-22s %-6s %-16s %14s %12s %10s %10s %12s" % ("testbench", "sim", "variant", "cycles/s", "wakeups/cyc", "RSS (MB)", "wall (s)", "waves (B)"))
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+
+        futures = [pool.submit(run_benchmark, testbench, simulator, cycles, args.seed, args.work_dir, args.waves) for testbench, simulator, cycles in benchmarks]
+
+        for future in futures:
+            result = future.result()
+            results.append(result)
+
+            print("%-22s %-6s %-16s %14s %12s %10.1f %10.2f %12i%s" % (result["testbench"], result["simulator"], result["variant"],
+                                                                       "%.0f" % result["cycles_per_second"] if result["cycles_per_second"] else "-",
+                                                                       "%.2f" % result["wakeups_per_cycle"] if result["wakeups_per_cycle"] else "-",
+                                                                       result["peak_rss_mb"], result["job_wall_time"], result["wave_bytes"],
+                                                                       "" if result["returncode"] == 0 else "  FAILED, see %s" % result["job_dir"]))
+
+    # Writes the results
+    with open(args.output, "w") as output:
+        json.dump({"environment": benchmark_environment(args.seed, args.waves), "results": results}, output, indent=2)
+
+    failed = sum(result["returncode"] != 0 for result in results)
+    print("\n%i benchmark(s), %i failed. Results: %s" % (len(results), failed, args.output))
+
+    if not args.no_ledger:
+        record_benchmarks(results, args.ledger)
+
+    # Returns 1 if any benchmark failed
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+##########################################################################################################################################################################
@@ -0,0 +1,176 @@
+##########################################################################################################################################################################
+# benchmark_probe.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the probe of the benchmark suite, a cocotb test module loaded next to the testbench one (MODULE=testbench,verification_tools.
+# benchmark_probe, as benchmark.py does). On import, it counts the wakeups of the cocotb scheduler (every trigger fired, and the ones fired by the simulator,
+# i.e. its callbacks into Python) and, at the end of every test, writes the simulated time, the wall time, the wakeups and the peak RSS of the simulation
+# process into BENCHMARK_PROBE_FILE, as JSON.
+# It also contains benchmark_stress, a synthetic test of every toplevel driving random inputs for STRESS_CYCLES clock cycles, without any checking, so the
+# throughput of the simulator and of cocotb is measured apart from the testbench. It is skipped unless requested with TESTCASE=benchmark_stress.
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import json
+import os
+import resource
+import cocotb
+from cocotb.clock import Clock
+from cocotb.regression import RegressionManager
+from cocotb.scheduler import Scheduler
+from cocotb.triggers import GPITrigger, RisingEdge, Timer
+from verification_tools.stimulus_pool import stimulus_pool
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant for the clock period of the stress test, and of the toplevels without a clock, in ns
+STRESS_CLOCK_PERIOD = 10
+
+## Constant for the default number of cycles of the stress test
+STRESS_CYCLES = 100000
+
+## Constant for the number of reset cycles of the stress test
+STRESS_RESET_CYCLES = 2
+
+## Constant for the widest input drawn as a single value of its stimulus pool, the wider ones being concatenated from words of this width
+STRESS_WORD_WIDTH = 32
+
+## Constant mapping every toplevel to its clock (None for the combinational ones), its active high reset and its (input, width) pairs, a None width being the
+## one of the port (as the concatenated ports of the multi-lane wrappers)
+STRESS_TOPLEVELS = {
+    "crc16citt_module": ("clk_i", "rst_sync_i", [("CRC16_data_i", 8), ("CRC16_en_i", 1)]),
+    "crc16citt_multilane": ("clk_i", "rst_sync_i", [("CRC16_data_i", None), ("CRC16_en_i", None)]),
+    "contador": ("clk", "reset", [("enable", 1)]),
+    "simple_state_machine": ("clk", "rst", [("inpt", 1)]),
+    "mux_8bit": (None, "rst", [("sel", 3), ("inpt", 8)]),
+}
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Important global variables
+
+## Wakeups of the scheduler (every trigger fired, and the ones fired by the simulator), and the results of the tests run
+wakeups = 0
+simulator_wakeups = 0
+test_results = []
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Probe functions
+
+scheduler_react = Scheduler._react
+record_result = RegressionManager._record_result
+
+
+def counted_react(self, trigger):
+# Description: this function counts a wakeup of the scheduler, before handling it.
+# Parameters: self: the scheduler; trigger: the trigger fired.
+# Returns: None.
+
+    global wakeups, simulator_wakeups
+
+    wakeups += 1
+    if isinstance(trigger, GPITrigger):
+        simulator_wakeups += 1
+
+    return scheduler_react(self, trigger)
+
+
+def recorded_result(self, test, outcome, wall_time_s, sim_time_ns):
+# Description: this function records the counters of a test, since the previous one, and writes the results of every test run into BENCHMARK_PROBE_FILE.
+# Parameters: the ones of RegressionManager._record_result.
+# Returns: None.
+
+    previous = test_results[-1] if test_results else {"total_wakeups": 0, "total_simulator_wakeups": 0}
+
+    test_results.append({"test": test.__qualname__, "skipped": outcome is None, "wall_time": wall_time_s, "sim_time_ns": sim_time_ns,
+                         "wakeups": wakeups - previous["total_wakeups"], "simulator_wakeups": simulator_wakeups - previous["total_simulator_wakeups"],
+                         "total_wakeups": wakeups, "total_simulator_wakeups": simulator_wakeups,
+                         "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss})
+
+    # Rewrites the file after every test, so the tests run before a crash of the simulator are kept
+    if os.getenv("BENCHMARK_PROBE_FILE"):
+        with open(os.environ["BENCHMARK_PROBE_FILE"], "w") as probe_file:
+            json.dump(test_results, probe_file, indent=2)
+
+    return record_result(self, test, outcome, wall_time_s, sim_time_ns)
+
+
+## The scheduler is created after the test modules are imported, so its class is patched
+Scheduler._react = counted_react
+RegressionManager._record_result = recorded_result
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Stress test
+
+def stress_draw(name, width):
+# Description: this function obtains the function drawing the random values of an input of the stress test.
+# Parameters: name: input name, naming its stimulus pool; width: input width.
+# Returns: A function returning the next value, as a Python integer.
+
+    # The inputs up to STRESS_WORD_WIDTH bits are single values of their pools
+    if width <= STRESS_WORD_WIDTH:
+        return stimulus_pool("stress_%s" % name, 0, (1 << width) - 1).next
+
+    # The wider ones are concatenated from words
+    pool = stimulus_pool("stress_%s" % name, 0, (1 << STRESS_WORD_WIDTH) - 1)
+    words, mask = -(-width // STRESS_WORD_WIDTH), (1 << width) - 1
+
+    return lambda: int.from_bytes(pool.take(words).astype("<u4").tobytes(), "little") & mask
+
+
+@cocotb.test(skip=True)
+async def benchmark_stress(dut):
+# Description: this function drives random inputs into the toplevel for STRESS_CYCLES clock cycles (or periods, for the combinational ones), after a reset.
+# Parameters: dut: the toplevel.
+# Returns: None.
+
+    toplevel = os.getenv("TOPLEVEL", "").split(".")[-1]
+    assert toplevel in STRESS_TOPLEVELS, "There is no stress test for the toplevel %s" % toplevel
+
+    clock, reset, inputs = STRESS_TOPLEVELS[toplevel]
+    cycles = int(os.getenv("STRESS_CYCLES", STRESS_CYCLES))
+
+    # Initializes the handles of the inputs and the functions drawing their values from the stimulus pools
+    handles = [getattr(dut, name) for name, _ in inputs]
+    draws = [stress_draw(name, width or len(handle)) for (name, width), handle in zip(inputs, handles)]
+
+    # Starts the clock, if any
+    if clock is not None:
+        clock = getattr(dut, clock)
+        cocotb.start_soon(Clock(clock, STRESS_CLOCK_PERIOD, units="ns").start())
+
+    # Resets the toplevel, with its inputs at 0
+    for handle in handles:
+        handle.value = 0
+
+    getattr(dut, reset).value = 1
+    for _ in range(STRESS_RESET_CYCLES):
+        await (RisingEdge(clock) if clock is not None else Timer(STRESS_CLOCK_PERIOD, units="ns"))
+    getattr(dut, reset).value = 0
+
+    # Drives the random inputs every cycle
+    for _ in range(cycles):
+
+        for handle, draw in zip(handles, draws):
+            handle.value = draw()
+
+        await (RisingEdge(clock) if clock is not None else Timer(STRESS_CLOCK_PERIOD, units="ns"))
+
+    dut._log.info("[BENCHMARK]: %i stress cycles driven" % cycles)
+
+##########################################################################################################################################################################
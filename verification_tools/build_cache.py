@@ -0,0 +1,87 @@
+##########################################################################################################################################################################
+# build_cache.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the key of the HDL build cache used by the simulator Makefiles in verification_tools/makefiles. The key is a hash of the contents of
+# the VHDL sources, in analysis order, of the simulator version and of every flag that changes the analysed library or the elaboration snapshot, so an
+# unchanged design reuses its build and a Python-only testbench change skips the HDL compilation entirely.
+# It is called by the Makefiles: python3 build_cache.py --tool "<simulator version>" --flags "<flags>" SOURCES...
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import argparse
+import hashlib
+import sys
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant for the number of hexadecimal digits of the key, which names the build directory
+KEY_LENGTH = 16
+
+## Constant for the size of the blocks read from the sources
+READ_BLOCK_SIZE = 1 << 20
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Build cache functions
+
+def build_cache_key(sources, tool="", flags=""):
+# Description: this function computes the build cache key of a design.
+# Parameters: sources: VHDL source paths, in analysis order; tool: simulator version string; flags: analysis and elaboration flags, as a string.
+# Returns: The key, as KEY_LENGTH hexadecimal digits.
+
+    digest = hashlib.sha256()
+
+    # Hashes the simulator version and the flags, with their whitespace normalized
+    for text in (tool, flags):
+        digest.update(" ".join(text.split()).encode())
+        digest.update(b"\0")
+
+    # Hashes every source path and contents, so a reordered or renamed source also changes the key
+    for source in sources:
+
+        digest.update(source.encode())
+        digest.update(b"\0")
+
+        with open(source, "rb") as source_file:
+            for block in iter(lambda: source_file.read(READ_BLOCK_SIZE), b""):
+                digest.update(block)
+
+        digest.update(b"\0")
+
+    # Returns the key
+    return digest.hexdigest()[:KEY_LENGTH]
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Main
+
+def main():
+
+    # Parses the arguments
+    parser = argparse.ArgumentParser(description="Prints the build cache key of a design")
+    parser.add_argument("--tool", default="", help="simulator version string")
+    parser.add_argument("--flags", default="", help="analysis and elaboration flags")
+    parser.add_argument("sources", nargs="*", help="VHDL sources, in analysis order")
+    args = parser.parse_args()
+
+    # Prints the key
+    print(build_cache_key(args.sources, args.tool, args.flags))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+##########################################################################################################################################################################
@@ -0,0 +1,372 @@
+##########################################################################################################################################################################
+# component_profiler.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the per-component profiler of the pyuvm testbenches. A component deriving from profiled_component (placed before its uvm_component
+# class) records, for every phase and every callback wrapped with profile_callback (as the cycle dispatcher handlers), the calls, the wall time (inclusive and
+# self), the trigger awaits of its coroutines, the items processed (analysis port writes, driven and requested sequence items, received transactions) and the
+# simulated time against the wall time. At the end of a test, write_profile writes into PROFILE_DIR a JSON summary and the collapsed stacks of the self times,
+# in microseconds, accepted by flamegraph.pl and speedscope.
+# The profiler is enabled by setting PROFILE_DIR (as the regression runner does with --profile). When it is not set, the components are not instrumented at
+# all, so it costs nothing and can stay in the testbenches.
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import inspect
+import json
+import os
+import time
+from cocotb.utils import get_sim_time
+from pyuvm import uvm_analysis_port, uvm_driver, uvm_sequencer, uvm_test
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant for the profiler mode, enabled when PROFILE_DIR is set
+PROFILE_MODE = bool(os.getenv("PROFILE_DIR"))
+
+## Constant for the instrumented phases of the components
+PROFILED_PHASES = ("build_phase", "connect_phase", "end_of_elaboration_phase", "start_of_simulation_phase", "run_phase", "extract_phase", "check_phase",
+                   "report_phase", "final_phase")
+
+## Constant for the number of entries, with the most self time, reported at the end of the test
+REPORTED_ENTRIES = 8
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Important global variables
+
+## Stack of the entries being executed, as lists of the record, the wall time of its children and its start time, and self time of every collapsed stack
+profile_stack = []
+profile_stacks = {}
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Profile record class
+
+class profile_record:
+# Description: this class contains the counters of a phase or callback of a component.
+
+    __slots__ = ("frame", "calls", "awaits", "items", "wall_time", "self_time", "wall_start", "wall_end", "sim_start", "sim_end")
+
+    def __init__(self, frame):
+    # Description: this function initializes the counters.
+    # Parameters: frame: name of the entry in the collapsed stacks, as component:phase.
+    # Returns: None.
+
+        self.frame = frame
+        self.calls = self.awaits = self.items = 0
+        self.wall_time = self.self_time = 0.0
+        self.wall_start = self.wall_end = self.sim_start = self.sim_end = None
+
+
+    def summary(self):
+    # Description: this function obtains the counters, with the wall and simulated time spanned from the start of the first call to the end of the last one.
+    # Parameters: None.
+    # Returns: A dictionary with the counters.
+
+        # An entry still being executed (as the report phase writing the profile) spans up to its start
+        wall_span = (self.wall_end or self.wall_start) - self.wall_start if self.wall_start is not None else 0.0
+        sim_span = (self.sim_end or self.sim_start) - self.sim_start if self.sim_start is not None else 0.0
+
+        return {"calls": self.calls, "awaits": self.awaits, "items": self.items, "wall_time": self.wall_time, "self_time": self.self_time,
+                "wall_span": wall_span, "sim_span_ns": sim_span, "sim_ns_per_wall_s": sim_span / wall_span if wall_span else None}
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Profiling functions
+
+def profile_enter(record):
+# Description: this function starts an entry of a record, on top of the entries being executed.
+# Parameters: record: the record.
+# Returns: None.
+
+    start = time.perf_counter()
+
+    if record.wall_start is None:
+        record.wall_start, record.sim_start = start, simulation_time()
+
+    record.calls += 1
+    profile_stack.append([record, 0.0, start])
+
+
+def profile_leave():
+# Description: this function ends the entry on top of the stack, adding its wall time to its record and to its parent, and its self time to its collapsed stack.
+# Parameters: None.
+# Returns: None.
+
+    end = time.perf_counter()
+    stack = tuple(entry[0].frame for entry in profile_stack)
+    record, children_time, start = profile_stack.pop()
+
+    elapsed = end - start
+    record.wall_time += elapsed
+    record.self_time += elapsed - children_time
+    record.wall_end, record.sim_end = end, simulation_time()
+    profile_stacks[stack] = profile_stacks.get(stack, 0.0) + elapsed - children_time
+
+    if profile_stack:
+        profile_stack[-1][1] += elapsed
+
+
+def profile_items(count=1):
+# Description: this function counts items processed by the entry being executed.
+# Parameters: count: number of items.
+# Returns: None.
+
+    if profile_stack:
+        profile_stack[-1][0].items += count
+
+
+def simulation_time():
+# Description: this function obtains the simulation time, outside a simulation being 0.
+# Parameters: None.
+# Returns: The simulation time, in ns.
+
+    try:
+        return get_sim_time("ns")
+    except Exception:
+        return 0.0
+
+
+def profiled_function(record, function, items=None):
+# Description: this function wraps a function into an entry of a record.
+# Parameters: record: the record; function: the function; items: function obtaining the items processed from the arguments, None counting no item.
+# Returns: The wrapped function.
+
+    def wrapper(*args, **kwargs):
+
+        profile_enter(record)
+        try:
+            if items is not None:
+                record.items += items(*args, **kwargs)
+            return function(*args, **kwargs)
+        finally:
+            profile_leave()
+
+    return wrapper
+
+
+class profiled_coroutine:
+# Description: this class contains a coroutine wrapped into a record: every step of the coroutine, until it awaits a trigger, is an entry of the record.
+
+    def __init__(self, record, coroutine):
+        self.record = record
+        self.coroutine = coroutine
+
+
+    def __await__(self):
+    # Description: this function steps the coroutine, forwarding its triggers to the scheduler and the results back to it.
+    # Parameters: None.
+    # Returns: The return value of the coroutine.
+
+        coroutine, record = self.coroutine, self.record
+        value, exception = None, None
+
+        while True:
+
+            # Steps the coroutine until it awaits a trigger or ends
+            profile_enter(record)
+            try:
+                trigger = coroutine.send(value) if exception is None else coroutine.throw(exception)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                profile_leave()
+
+            # Awaits the trigger, passing its result or exception to the coroutine
+            record.awaits += 1
+            try:
+                value, exception = (yield trigger), None
+            except GeneratorExit:
+                coroutine.close()
+                raise
+            except BaseException as error:
+                value, exception = None, error
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Profiled component class
+
+class profiled_component:
+# Description: this class contains the profiling mixin of the components. When PROFILE_MODE is enabled, the phases, the write methods and the item handshakes
+# of the component are replaced, on the instance, by wrappers recording them; otherwise, the component is left untouched.
+
+    def __init__(self, *args, **kwargs):
+    # Description: this function initializes the component and instruments it, if the profiler is enabled.
+    # Parameters: args, kwargs: as in the component class.
+    # Returns: None.
+
+        super().__init__(*args, **kwargs)
+
+        self.profile_records = {}
+        if not PROFILE_MODE:
+            return
+
+        # A new test starts new collapsed stacks
+        if isinstance(self, uvm_test):
+            profile_stack.clear()
+            profile_stacks.clear()
+
+        # Wraps the phases, the coroutines ones stepped by profiled_coroutine
+        for phase in PROFILED_PHASES:
+
+            method = getattr(self, phase)
+            if inspect.iscoroutinefunction(method):
+                setattr(self, phase, self.__profiled_phase(self.profile_record(phase), method))
+            else:
+                setattr(self, phase, profiled_function(self.profile_record(phase), method))
+
+        # Wraps the write methods of the subscribers, counting their transactions, and points their analysis export to the wrappers
+        if hasattr(self, "analysis_export"):
+
+            self.write = profiled_function(self.profile_record("write"), self.write, lambda item: 1)
+            if hasattr(self.analysis_export, "write_fn"):
+                self.analysis_export.write_fn = self.write
+
+            if hasattr(self, "write_batch"):
+                self.write_batch = profiled_function(self.profile_record("write_batch"), self.write_batch, len)
+                self.analysis_export.write_batch = self.write_batch
+
+        # Counts the items finished by the drivers and handed by the sequencers
+        if isinstance(self, uvm_driver):
+            self.seq_item_port.item_done = self.__counted(self.seq_item_port.item_done)
+
+        if isinstance(self, uvm_sequencer):
+            put_req = self.seq_item_export.put_req
+
+            async def counted_put_req(item):
+                profile_items()
+                return await put_req(item)
+
+            self.seq_item_export.put_req = counted_put_req
+
+        # Counts the transactions written by the analysis ports, built in the build phase, from the connect phase on
+        connect_phase = self.connect_phase
+
+        def instrumented_connect_phase():
+            for child in self.children:
+                if isinstance(child, uvm_analysis_port):
+                    child.write = self.__counted(child.write)
+            connect_phase()
+
+        self.connect_phase = instrumented_connect_phase
+
+
+    def profile_record(self, name):
+    # Description: this function obtains the record of a phase or callback of the component, created on the first call.
+    # Parameters: name: phase or callback name.
+    # Returns: The record.
+
+        if name not in self.profile_records:
+            self.profile_records[name] = profile_record("%s:%s" % (self.get_full_name(), name))
+
+        return self.profile_records[name]
+
+
+    def profile_callback(self, name, callback):
+    # Description: this function wraps a callback of the component (as a cycle dispatcher handler) into a record, if the profiler is enabled.
+    # Parameters: name: callback name; callback: the function.
+    # Returns: The wrapped function, or the function itself if the profiler is disabled.
+
+        if not PROFILE_MODE:
+            return callback
+
+        return profiled_function(self.profile_record(name), callback)
+
+
+    @staticmethod
+    def __profiled_phase(record, method):
+    # Description: this function wraps a coroutine phase into a record.
+    # Parameters: record: the record; method: the phase method.
+    # Returns: The wrapped coroutine function.
+
+        async def wrapper():
+            return await profiled_coroutine(record, method())
+
+        return wrapper
+
+
+    @staticmethod
+    def __counted(function):
+    # Description: this function wraps a function counting an item processed by the entry being executed on every call.
+    # Parameters: function: the function.
+    # Returns: The wrapped function.
+
+        def wrapper(*args, **kwargs):
+            profile_items()
+            return function(*args, **kwargs)
+
+        return wrapper
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Profile report functions
+
+def component_records(component):
+# Description: this function obtains the records of a component and of its children, recursively.
+# Parameters: component: the top component.
+# Returns: A list of tuples with the component full name, the phase or callback name and the record.
+
+    records = [(component.get_full_name(), name, record) for name, record in getattr(component, "profile_records", {}).items()]
+
+    for child in component.children:
+        records += component_records(child)
+
+    return records
+
+
+def write_profile(test, test_name, logger=print):
+# Description: this function reports the entries of a test with the most self time and writes its JSON summary and collapsed stacks into PROFILE_DIR.
+# Parameters: test: the test component; test_name: name of the test, naming the files; logger: function printing every line of the report.
+# Returns: A tuple with the paths to the JSON summary and to the collapsed stacks, or None if the profiler is disabled.
+
+    if not PROFILE_MODE:
+        return None
+
+    records = component_records(test)
+
+    # Reports the entries with the most self time
+    for component, name, record in sorted(records, key=lambda entry: -entry[2].self_time)[:REPORTED_ENTRIES]:
+        logger("[PROFILE]: %s %s: %.3f ms self, %.3f ms total, %i calls, %i awaits, %i items" % (component, name, 1e3 * record.self_time,
+                                                                                                1e3 * record.wall_time, record.calls, record.awaits, record.items))
+
+    # Builds the summary, by component and phase
+    summary = {"test": test_name, "sim_time_ns": simulation_time(), "components": {}}
+    for component, name, record in records:
+        summary["components"].setdefault(component, {})[name] = record.summary()
+
+    # Writes the summary and the collapsed stacks, rooted at the test name, in microseconds
+    os.makedirs(os.environ["PROFILE_DIR"], exist_ok=True)
+    json_path = os.path.join(os.environ["PROFILE_DIR"], test_name + ".json")
+    stacks_path = os.path.join(os.environ["PROFILE_DIR"], test_name + ".folded")
+
+    with open(json_path, "w") as json_file:
+        json.dump(summary, json_file, indent=2)
+
+    with open(stacks_path, "w") as stacks_file:
+        for stack, self_time in sorted(profile_stacks.items()):
+            if round(self_time * 1e6):
+                stacks_file.write("%s;%s %i\n" % (test_name, ";".join(stack), round(self_time * 1e6)))
+
+    logger("[PROFILE]: Profile written into %s and %s" % (json_path, stacks_path))
+
+    return json_path, stacks_path
+
+##########################################################################################################################################################################
@@ -0,0 +1,265 @@
+##########################################################################################################################################################################
+# coverage.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the functional coverage of the testbenches. A covergroup is a NumPy array of hit counters, one per bin, with one dimension per axis
+# (a cross of several axes is a single covergroup), so sampling a bin is an O(1) increment and the covered bins are kept as a running count. The pyuvm
+# testbenches sample it from subscribers connected to the analysis port of their monitor, and the cocotb ones from their checkers.
+# At the end of a test, the covergroups are written into COVERAGE_DIR (when set, as the regression runner does for every job) as a compressed .npz file of
+# counters, and the files of parallel runs are merged by adding their counters:
+# python3 -m verification_tools.coverage FILES_OR_DIRECTORIES... [--output MERGED_FILE] [--holes N]
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import argparse
+import os
+import sys
+import numpy as np
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant for the suffix of the axes names stored along the counters of every covergroup
+AXES_SUFFIX = ".axes"
+
+## Constant for the number of uncovered bins (holes) listed by the report of every covergroup
+REPORTED_HOLES = 8
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Covergroup class
+
+class covergroup:
+# Description: this class contains a covergroup: a hit counter for every bin of the cross of its axes, indexed by the bin of every axis.
+
+    def __init__(self, name, axes):
+    # Description: this function initializes the counters of the covergroup.
+    # Parameters: name: covergroup name, unique in the testbench; axes: list of tuples with the name and the number of bins of every axis.
+    # Returns: None.
+
+        self.name = name
+        self.axes = [axis for axis, _ in axes]
+        self.counts = np.zeros([bins for _, bins in axes], dtype=np.uint32)
+        self.covered = 0
+
+
+    @property
+    def bins(self):
+    # Description: this function obtains the number of bins of the covergroup.
+    # Parameters: None.
+    # Returns: The number of bins.
+
+        return self.counts.size
+
+
+    @property
+    def closed(self):
+    # Description: this function checks if every bin of the covergroup was hit.
+    # Parameters: None.
+    # Returns: True if the coverage is closed.
+
+        return self.covered == self.counts.size
+
+
+    def sample(self, *index):
+    # Description: this function samples a bin of the covergroup.
+    # Parameters: index: bin of every axis.
+    # Returns: None.
+
+        counts = self.counts
+        if not counts[index]:
+            self.covered += 1
+        counts[index] += 1
+
+
+    def sample_array(self, *indexes):
+    # Description: this function samples a whole trace of bins at once.
+    # Parameters: indexes: array with the bins of every axis, one element per sample.
+    # Returns: None.
+
+        np.add.at(self.counts, tuple(np.asarray(index, dtype=np.intp) for index in indexes), 1)
+        self.covered = int(np.count_nonzero(self.counts))
+
+
+    def hit(self, *index):
+    # Description: this function checks if a bin was hit.
+    # Parameters: index: bin of every axis.
+    # Returns: True if the bin was hit.
+
+        return bool(self.counts[index])
+
+
+    def axis_holes(self, axis):
+    # Description: this function obtains the bins of an axis not hit with any bin of the other axes, as the input bytes never driven by a cross of them.
+    # Parameters: axis: index of the axis.
+    # Returns: A list with the uncovered bins of the axis.
+
+        other_axes = tuple(index for index in range(self.counts.ndim) if index != axis)
+        return np.flatnonzero(~self.counts.any(axis=other_axes)).tolist()
+
+
+    def holes(self):
+    # Description: this function obtains the uncovered bins.
+    # Parameters: None.
+    # Returns: A list of tuples with the bin of every axis.
+
+        return [tuple(index) for index in np.argwhere(self.counts == 0).tolist()]
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Coverage database functions
+
+def covergroups_coverage(covergroups):
+# Description: this function obtains the coverage of covergroups, in the form read and merged from the coverage files.
+# Parameters: covergroups: the covergroups.
+# Returns: A dictionary mapping every covergroup name to a tuple with its axes names and its counters.
+
+    return {group.name: (group.axes, group.counts) for group in covergroups}
+
+
+def save_coverage(coverage, path):
+# Description: this function writes the counters of covergroups into a compressed .npz file.
+# Parameters: coverage: dictionary mapping every covergroup name to a tuple with its axes names and its counters; path: path to the file.
+# Returns: None.
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    arrays = {}
+    for name, (axes, counts) in coverage.items():
+        arrays[name] = counts
+        arrays[name + AXES_SUFFIX] = np.array(axes)
+
+    np.savez_compressed(path, **arrays)
+
+
+def load_coverage(path):
+# Description: this function reads the counters written by save_coverage.
+# Parameters: path: path to the file.
+# Returns: A dictionary mapping every covergroup name to a tuple with its axes names and its counters.
+
+    with np.load(path) as arrays:
+        return {name: (arrays[name + AXES_SUFFIX].tolist(), arrays[name]) for name in arrays.files if not name.endswith(AXES_SUFFIX)}
+
+
+def merge_coverage(paths):
+# Description: this function merges coverage files, adding the counters of every covergroup.
+# Parameters: paths: paths to the files.
+# Returns: A dictionary mapping every covergroup name to a tuple with its axes names and its merged counters.
+
+    merged = {}
+
+    for path in paths:
+        for name, (axes, counts) in load_coverage(path).items():
+
+            # The first file of a covergroup initializes it, the next ones are added to it
+            if name not in merged:
+                merged[name] = (axes, counts.astype(np.uint64))
+                continue
+
+            assert merged[name][1].shape == counts.shape, "The covergroup %s of %s has %s bins and should have %s" % (name, path, counts.shape,
+                                                                                                                      merged[name][1].shape)
+            merged[name][1][...] += counts
+
+    return merged
+
+
+def coverage_report(coverage, holes=REPORTED_HOLES):
+# Description: this function builds the report of covergroups, with their covered bins and the first uncovered ones.
+# Parameters: coverage: dictionary mapping every covergroup name to a tuple with its axes names and its counters; holes: number of uncovered bins listed.
+# Returns: A list with the lines of the report.
+
+    lines = []
+
+    for name, (axes, counts) in sorted(coverage.items()):
+
+        covered = int(np.count_nonzero(counts))
+        lines.append("%s: %i/%i bins covered (%.1f%%), %i samples" % (name, covered, counts.size, 100.0 * covered / counts.size, counts.sum()))
+
+        # Lists the first uncovered bins, as the bin of every axis
+        uncovered = np.argwhere(counts == 0)
+        for index in uncovered[:holes].tolist():
+            lines.append("    hole: %s" % ", ".join("%s=%i" % (axis, value) for axis, value in zip(axes, index)))
+        if len(uncovered) > holes:
+            lines.append("    ... %i more hole(s)" % (len(uncovered) - holes))
+
+    return lines
+
+
+def write_coverage(covergroups, test_name, logger=print):
+# Description: this function reports the covergroups of a test and, when COVERAGE_DIR is set, writes them into it, named after the test.
+# Parameters: covergroups: the covergroups; test_name: name of the test; logger: function printing every line of the report.
+# Returns: The path to the coverage file, or None if COVERAGE_DIR is not set.
+
+    coverage = covergroups_coverage(covergroups)
+    for line in coverage_report(coverage):
+        logger("[COVERAGE]: %s" % line)
+
+    if not os.getenv("COVERAGE_DIR"):
+        return None
+
+    path = os.path.join(os.environ["COVERAGE_DIR"], test_name + ".npz")
+    save_coverage(coverage, path)
+
+    return path
+
+
+def find_coverage_files(paths):
+# Description: this function obtains the coverage files of files and directories, searched recursively.
+# Parameters: paths: paths to coverage files or to directories.
+# Returns: A sorted list with the paths to the coverage files.
+
+    files = []
+
+    for path in paths:
+        if os.path.isdir(path):
+            files += [os.path.join(root, name) for root, _, names in os.walk(path) for name in names if name.endswith(".npz")]
+        else:
+            files.append(path)
+
+    return sorted(files)
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Main
+
+def main():
+
+    # Parses the merge arguments
+    parser = argparse.ArgumentParser(description="Merges the functional coverage files of several runs into a single report")
+    parser.add_argument("paths", nargs="+", help="coverage files, or directories searched for them")
+    parser.add_argument("--output", help="merged coverage file")
+    parser.add_argument("--holes", type=int, default=REPORTED_HOLES, help="number of uncovered bins listed for every covergroup")
+    args = parser.parse_args()
+
+    # Merges the files
+    files = find_coverage_files(args.paths)
+    assert files, "No coverage file was found in %s" % ", ".join(args.paths)
+    merged = merge_coverage(files)
+
+    # Prints the report and writes the merged counters
+    print("%i coverage file(s) merged" % len(files))
+    for line in coverage_report(merged, args.holes):
+        print(line)
+
+    if args.output:
+        save_coverage(merged, args.output)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+##########################################################################################################################################################################
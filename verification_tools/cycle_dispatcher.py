@@ -0,0 +1,102 @@
+##########################################################################################################################################################################
+# cycle_dispatcher.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains a cycle-based dispatcher for the testbenches. Instead of every component awaiting the clock edge in its own coroutine, the dispatcher
+# takes a single simulator callback per edge and calls the registered handlers (sample, check and drive) in a fixed order, removing the ordering races
+# between the components and the coroutine switches of every extra component.
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import cocotb
+from cocotb.triggers import RisingEdge
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Cycle dispatcher
+
+# Dispatcher of the per-cycle handlers of the testbench components
+class cycle_dispatcher:
+
+    ## Constants for the handler phases, called in this order every cycle: the DUT signals are sampled before any of them is driven for the next cycle
+    SAMPLE = 0
+    CHECK = 1
+    DRIVE = 2
+
+    # Initialization of the dispatcher
+    def __init__(self, clock, edge=RisingEdge):
+
+        self.clock = clock
+        self.edge = edge
+        self.cycle = 0
+        self.handlers = []
+        self.registrations = 0
+        self.dispatch_order = ()
+        self.task = None
+
+
+    def register(self, phase, handler):
+    # Description: this function registers a handler, called every cycle after the ones of the previous phases and of the same phase registered before it.
+    # Parameters: phase: SAMPLE, CHECK or DRIVE; handler: a non-blocking function receiving the cycle number.
+    # Returns: None
+
+        # Keeps the handlers sorted by phase, in registration order within the phase
+        self.handlers.append((phase, self.registrations, handler))
+        self.registrations += 1
+        self.handlers.sort(key=lambda entry: entry[:2])
+        self.dispatch_order = tuple(entry[2] for entry in self.handlers)
+
+
+    def unregister(self, handler):
+    # Description: this function removes a handler, which may be done by the handler itself.
+    # Parameters: handler: the registered function.
+    # Returns: None
+
+        self.handlers = [entry for entry in self.handlers if entry[2] is not handler]
+        self.dispatch_order = tuple(entry[2] for entry in self.handlers)
+
+
+    def start(self):
+    # Description: this function starts the dispatcher coroutine, if it is not running yet.
+    # Parameters: None
+    # Returns: The dispatcher task.
+
+        if self.task is None:
+            self.task = cocotb.start_soon(self.run())
+
+        return self.task
+
+
+    def stop(self):
+    # Description: this function stops the dispatcher coroutine.
+    # Parameters: None
+    # Returns: None
+
+        if self.task is not None:
+            self.task.kill()
+            self.task = None
+
+
+    async def run(self):
+    # Description: this coroutine waits for every clock edge and dispatches the handlers of the cycle.
+    # Parameters: None
+    # Returns: None
+
+        # The trigger is created once, since it is the only one awaited
+        edge = self.edge(self.clock)
+
+        while True:
+
+            await edge
+            self.cycle += 1
+
+            # The order is an immutable snapshot, so the handlers may (un)register others during the cycle
+            for handler in self.dispatch_order:
+                handler(self.cycle)
+
+##########################################################################################################################################################################
@@ -0,0 +1,450 @@
+##########################################################################################################################################################################
+# fast_mode.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the pure-Python "fast mode" backend. It replaces cocotb's simulator extension (the GPI) with a small event-driven kernel that runs the
+# Python models of fast_models.py, so the cocotb and pyuvm testbenches run unchanged, with the real RisingEdge, FallingEdge, Edge, Timer, ReadWrite, ReadOnly,
+# NextTimeStep and First triggers, without Docker or an HDL simulator. Full-RTL simulations are still needed for sign-off.
+# Usage, from a Testbench directory: python3 -m verification_tools.fast_mode --toplevel TOPLEVEL --module MODULE [--testcase T] [--seed S] [-g NAME=VALUE]
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import argparse
+import heapq
+import logging
+import os
+import sys
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constants for the GPI object types and iteration kinds, as expected by cocotb.handle
+MEMORY, MODULE, NET, NETARRAY, REAL, INTEGER, ENUM, STRUCTURE, REG, STRING, GENARRAY = range(1, 12)
+OBJECTS, DRIVERS, LOADS = range(1, 4)
+
+## Constants for the edge kinds of the value change callbacks, as used by cocotb.triggers
+RISING, FALLING, VALUE_CHANGE = 1, 2, 3
+
+## Constant for the time precision, in powers of ten of a second (1 step = 1 ps)
+TIME_PRECISION = -12
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Kernel objects
+
+# Callback handle returned by every register_*_callback function
+class fast_callback:
+
+    __slots__ = ("function", "args", "active")
+
+    # Initialization of the callback
+    def __init__(self, function, args):
+
+        self.function = function
+        self.args = args
+        self.active = True
+
+    # Removes the callback (called by cocotb when the trigger is unprimed, even after it fired)
+    def deregister(self):
+
+        self.active = False
+
+    # Runs the callback once
+    def run(self):
+
+        if self.active:
+            self.active = False
+            self.function(*self.args)
+
+
+# Signal of a model, exposing the GPI handle interface used by cocotb.handle
+class fast_signal:
+
+    # Initialization of the signal, undefined ('U') unless an initial value is given
+    def __init__(self, kernel, name, width, value=None):
+
+        self.kernel = kernel
+        self.name = name
+        self.width = width
+        self.mask = (1 << width) - 1
+        self.value = value if value is not None else 0
+        self.defined = value is not None
+        self.callbacks = []
+
+    # Returns True if the signal is defined and equal to '1'
+    def is_high(self):
+
+        return self.defined and self.value == 1
+
+    # GPI handle interface
+    def get_name_string(self):
+        return self.name
+
+    def get_type_string(self):
+        return "GPI_NET"
+
+    def get_type(self):
+        return NET
+
+    def get_const(self):
+        return False
+
+    def get_definition_name(self):
+        return ""
+
+    def get_definition_file(self):
+        return ""
+
+    def get_num_elems(self):
+        return self.width
+
+    def get_range(self):
+        return (self.width - 1, 0)
+
+    def get_handle_by_name(self, name):
+        return None
+
+    def get_handle_by_index(self, index):
+        return None
+
+    def iterate(self, mode):
+        return iter(())
+
+    def get_signal_val_binstr(self):
+        return format(self.value, "0%ib" % self.width) if self.defined else "U" * self.width
+
+    def get_signal_val_long(self):
+        return self.value
+
+    def get_signal_val_real(self):
+        return float(self.value)
+
+    def get_signal_val_str(self):
+        return self.get_signal_val_binstr()
+
+    def set_signal_val_int(self, action, value):
+        self.kernel.drive(self, value & self.mask)
+
+    def set_signal_val_binstr(self, action, binstr):
+        self.kernel.drive(self, int("".join("1" if bit in "1Hh" else "0" for bit in binstr), 2), all(bit in "01" for bit in binstr))
+
+    def set_signal_val_real(self, action, value):
+        raise TypeError("Signal %s does not accept real values" % self.name)
+
+    def set_signal_val_str(self, action, value):
+        raise TypeError("Signal %s does not accept string values" % self.name)
+
+
+# Base class for the Python models of the VHDL entities, also the root GPI handle of the design
+class fast_model:
+
+    # Initialization of the model
+    def __init__(self, kernel, name):
+
+        self.kernel = kernel
+        self.name = name
+        self.signals = {}
+        kernel.models.append(self)
+
+    # Creates a port of the model
+    def add_signal(self, name, width, value=None):
+
+        self.signals[name] = fast_signal(self.kernel, name, width, value)
+        return self.signals[name]
+
+    # Returns True if the signal changed from '0' to '1' in the current delta cycle, as VHDL's rising_edge
+    @staticmethod
+    def rising_edge(changed, signal):
+
+        return signal in changed and changed[signal] == (0, True) and signal.is_high()
+
+    # Processes of the model, called with the {signal: (old value, old defined)} dictionary of the current delta cycle
+    def evaluate(self, changed):
+        pass
+
+    # GPI handle interface
+    def get_name_string(self):
+        return self.name
+
+    def get_type_string(self):
+        return "GPI_MODULE"
+
+    def get_type(self):
+        return MODULE
+
+    def get_const(self):
+        return False
+
+    def get_definition_name(self):
+        return self.name
+
+    def get_definition_file(self):
+        return ""
+
+    def get_num_elems(self):
+        return len(self.signals)
+
+    def get_range(self):
+        return None
+
+    def get_handle_by_name(self, name):
+        return self.signals.get(name)
+
+    def get_handle_by_index(self, index):
+        return None
+
+    def iterate(self, mode):
+        return iter(self.signals.values() if mode == OBJECTS else ())
+
+
+# Event-driven simulation kernel, installed as the cocotb.simulator module
+class fast_kernel:
+
+    MEMORY, MODULE, NET, NETARRAY, REAL, INTEGER, ENUM, STRUCTURE, REG, STRING, GENARRAY = MEMORY, MODULE, NET, NETARRAY, REAL, INTEGER, ENUM, STRUCTURE, REG, STRING, GENARRAY
+    OBJECTS, DRIVERS, LOADS = OBJECTS, DRIVERS, LOADS
+
+    # Initialization of the kernel
+    def __init__(self):
+
+        self.time = 0
+        self.sequence = 0
+        self.models = []
+        self.timed_callbacks = []
+        self.readwrite_callbacks = []
+        self.readonly_callbacks = []
+        self.nextstep_callbacks = []
+        self.changed = {}
+        self.scheduled = []
+        self.stopped = False
+
+    # Drives a signal, recording its previous value for the current delta cycle
+    def drive(self, signal, value, defined=True):
+
+        if signal.value == value and signal.defined == defined:
+            return
+
+        if signal not in self.changed:
+            self.changed[signal] = (signal.value, signal.defined)
+
+        signal.value = value
+        signal.defined = defined
+
+    # Schedules a signal assignment of a model's process, applied in the next delta cycle, as a VHDL signal assignment
+    def schedule(self, signal, value, defined=True):
+
+        self.scheduled.append((signal, value, defined))
+
+    # Runs the delta cycles and the ReadWrite callbacks until the time step is stable, then the ReadOnly callbacks
+    def __settle(self):
+
+        while True:
+
+            # Delta cycles: the models' processes first, then the value change callbacks of the changed signals, then the processes' assignments
+            while self.changed or self.scheduled:
+
+                changed, self.changed = self.changed, {}
+
+                for model in self.models:
+                    model.evaluate(changed)
+
+                for signal, (old_value, old_defined) in changed.items():
+
+                    if not signal.callbacks or (signal.value == old_value and signal.defined == old_defined):
+                        continue
+
+                    edge = (RISING if signal.value == 1 else FALLING) if signal.defined and signal.width == 1 else 0
+                    fired = [callback for callback, callback_edge in signal.callbacks if callback_edge == VALUE_CHANGE or callback_edge == edge]
+                    signal.callbacks = [(callback, callback_edge) for callback, callback_edge in signal.callbacks if callback.active and callback not in fired]
+
+                    for callback in fired:
+                        callback.run()
+
+                scheduled, self.scheduled = self.scheduled, []
+                for signal, value, defined in scheduled:
+                    self.drive(signal, value, defined)
+
+            # ReadWrite callbacks, which may drive new values
+            if self.readwrite_callbacks:
+                callbacks, self.readwrite_callbacks = self.readwrite_callbacks, []
+                for callback in callbacks:
+                    callback.run()
+                continue
+
+            # ReadOnly callbacks, at the end of the time step
+            if self.readonly_callbacks:
+                callbacks, self.readonly_callbacks = self.readonly_callbacks, []
+                for callback in callbacks:
+                    callback.run()
+                continue
+
+            break
+
+    # Runs the simulation until there are no more events or the simulator is stopped
+    def run(self):
+
+        # Settles the writes done before the first time step
+        self.__settle()
+
+        while not self.stopped and self.timed_callbacks:
+
+            # Advances the time, running the NextTimeStep callbacks at the beginning of the new time step
+            next_time = self.timed_callbacks[0][0]
+            if next_time > self.time:
+
+                self.time = next_time
+                callbacks, self.nextstep_callbacks = self.nextstep_callbacks, []
+                for callback in callbacks:
+                    callback.run()
+
+            # Runs every timed callback of the time step
+            while self.timed_callbacks and self.timed_callbacks[0][0] == self.time:
+                heapq.heappop(self.timed_callbacks)[2].run()
+
+            self.__settle()
+
+    # cocotb.simulator interface
+    def get_simulator_product(self):
+        return "fast_mode"
+
+    def get_simulator_version(self):
+        return "1.0"
+
+    def get_root_handle(self, name):
+        return next((model for model in self.models if name is None or model.name == name), None)
+
+    def get_sim_time(self):
+        return (self.time >> 32, self.time & 0xFFFFFFFF)
+
+    def get_precision(self):
+        return TIME_PRECISION
+
+    def log_level(self, level):
+        pass
+
+    def stop_simulator(self):
+        self.stopped = True
+
+    def register_timed_callback(self, steps, function, *args):
+        callback = fast_callback(function, args)
+        self.sequence += 1
+        heapq.heappush(self.timed_callbacks, (self.time + steps, self.sequence, callback))
+        return callback
+
+    def register_value_change_callback(self, signal, function, edge, *args):
+        callback = fast_callback(function, args)
+        signal.callbacks.append((callback, edge))
+        return callback
+
+    def register_readwrite_callback(self, function, *args):
+        callback = fast_callback(function, args)
+        self.readwrite_callbacks.append(callback)
+        return callback
+
+    register_rwsynch_callback = register_readwrite_callback
+
+    def register_readonly_callback(self, function, *args):
+        callback = fast_callback(function, args)
+        self.readonly_callbacks.append(callback)
+        return callback
+
+    def register_nextstep_callback(self, function, *args):
+        callback = fast_callback(function, args)
+        self.nextstep_callbacks.append(callback)
+        return callback
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Fast mode runner
+
+def parse_generic(text):
+# Description: this function parses a NAME=VALUE generic, accepting decimal, 0x hexadecimal and VHDL x"..." values.
+# Parameters: text: the generic text.
+# Returns: A (name, int value) tuple.
+
+    name, value = text.split("=", 1)
+    value = value.strip()
+
+    if value.lower().startswith('x"'):
+        return name, int(value[2:-1], 16)
+
+    return name, int(value, 0)
+
+
+def install(toplevel, generics=None):
+# Description: this function creates the kernel and the model of the toplevel, installing the kernel as the cocotb.simulator module. It must run before cocotb
+# is imported.
+# Parameters: toplevel: the TOPLEVEL entity name.
+#             generics: dictionary with the generics of the toplevel, default is None.
+# Returns: The installed kernel.
+
+    from verification_tools.fast_models import FAST_MODELS
+
+    # cocotb binds its simulator module at import time
+    if "cocotb" in sys.modules:
+        raise RuntimeError("The fast mode must be installed before cocotb is imported")
+
+    if toplevel not in FAST_MODELS:
+        raise ValueError("There is no fast mode model for %s, the available ones are: %s" % (toplevel, ", ".join(sorted(FAST_MODELS))))
+
+    # Creates the kernel and the model
+    kernel = fast_kernel()
+    FAST_MODELS[toplevel](kernel, **(generics or {}))
+
+    # Installs the kernel as the simulator module
+    sys.modules["cocotb.simulator"] = kernel
+
+    return kernel
+
+
+def main():
+
+    # Parses the runner arguments, defaulting to the same environment variables as the cocotb Makefiles
+    parser = argparse.ArgumentParser(description="Runs a cocotb testbench on the pure-Python fast mode backend")
+    parser.add_argument("--toplevel", default=os.getenv("TOPLEVEL"), help="TOPLEVEL entity, e.g. crc16citt_module")
+    parser.add_argument("--module", default=os.getenv("MODULE"), help="testbench Python module, e.g. crc16citt_testbench")
+    parser.add_argument("--testcase", default=os.getenv("TESTCASE"), help="comma separated test names, default is every test")
+    parser.add_argument("--seed", default=os.getenv("RANDOM_SEED"), help="random seed")
+    parser.add_argument("-g", "--generic", action="append", default=[], help="toplevel generic, as NAME=VALUE")
+    parser.add_argument("--results", default=os.getenv("COCOTB_RESULTS_FILE", "results.xml"), help="JUnit results file")
+    args = parser.parse_args()
+
+    if not args.toplevel or not args.module:
+        parser.error("--toplevel and --module (or the TOPLEVEL and MODULE variables) are required")
+
+    # Sets the environment read by cocotb's regression manager
+    os.environ["TOPLEVEL"] = args.toplevel
+    os.environ["MODULE"] = args.module
+    os.environ["COCOTB_RESULTS_FILE"] = args.results
+    for name, value in (("TESTCASE", args.testcase), ("RANDOM_SEED", args.seed)):
+        if value:
+            os.environ[name] = str(value)
+
+    # Installs the kernel and starts cocotb on it, as the simulator would do after the elaboration
+    kernel = install(args.toplevel, dict(parse_generic(generic) for generic in args.generic))
+
+    import cocotb
+    cocotb._initialise_testbench([sys.argv[0]])
+
+    # Runs the simulation
+    kernel.run()
+
+    # Returns 1 if any test failed
+    regression_manager = getattr(cocotb, "regression_manager", None)
+    logging.shutdown()
+    return 1 if regression_manager is None or regression_manager.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+##########################################################################################################################################################################
@@ -0,0 +1,191 @@
+##########################################################################################################################################################################
+# fast_models.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the cycle-accurate Python models of the repository's VHDL modules, used by the fast mode backend in place of an HDL simulator. Every
+# model mirrors the ports, generics and processes of its entity.
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+from verification_tools.fast_mode import fast_model
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Models
+
+# Model of the crc16citt_module entity (uvm_examples/crc16_module/crc16citt_module.vhd)
+class crc16citt_module_model(fast_model):
+
+    # Initialization of the model's ports and registers
+    def __init__(self, kernel, g_crc_init=0xFFFF):
+        super().__init__(kernel, "crc16citt_module")
+
+        self.g_crc_init = int(g_crc_init)
+        self.crc = self.g_crc_init
+
+        self.clk_i        = self.add_signal("clk_i", 1)
+        self.rst_sync_i   = self.add_signal("rst_sync_i", 1)
+        self.CRC16_data_i = self.add_signal("CRC16_data_i", 8)
+        self.CRC16_en_i   = self.add_signal("CRC16_en_i", 1)
+        self.CRC16_out_o  = self.add_signal("CRC16_out_o", 16, self.crc)
+
+    # Process p_crc16citt_calculation
+    def evaluate(self, changed):
+
+        if self.rising_edge(changed, self.clk_i):
+
+            if self.rst_sync_i.is_high():
+                self.crc = self.g_crc_init
+
+            elif self.CRC16_en_i.is_high():
+                byte = (self.crc >> 8) ^ self.CRC16_data_i.value
+                byte ^= byte >> 4
+                self.crc = ((self.crc << 8) ^ (byte << 12) ^ (byte << 5) ^ byte) & 0xFFFF
+
+            self.kernel.schedule(self.CRC16_out_o, self.crc)
+
+
+# Model of the generated crc16citt_multilane entity (crc16citt_multilane_wrapper.py), lanes copies of crc16citt_module sharing the clock and the reset, with the
+# ports of the lanes concatenated into vectors. The number of lanes, fixed by the generator, is passed as the lanes generic
+class crc16citt_multilane_model(fast_model):
+
+    # Initialization of the model's ports and registers, g_crc_inits packing the g_crc_init of lane i at its bits 16*i+15 downto 16*i
+    def __init__(self, kernel, lanes=4, g_crc_inits=None):
+        super().__init__(kernel, "crc16citt_multilane")
+
+        self.lanes = int(lanes)
+        self.g_crc_inits = [0xFFFF] * self.lanes if g_crc_inits is None else [(int(g_crc_inits) >> (16 * lane)) & 0xFFFF for lane in range(self.lanes)]
+        self.crcs = list(self.g_crc_inits)
+
+        self.clk_i        = self.add_signal("clk_i", 1)
+        self.rst_sync_i   = self.add_signal("rst_sync_i", 1)
+        self.CRC16_data_i = self.add_signal("CRC16_data_i", 8 * self.lanes)
+        self.CRC16_en_i   = self.add_signal("CRC16_en_i", self.lanes)
+        self.CRC16_out_o  = self.add_signal("CRC16_out_o", 16 * self.lanes, self.packed_crcs())
+
+    # Concatenates the CRC registers of the lanes into the value of CRC16_out_o
+    def packed_crcs(self):
+
+        return sum(crc << (16 * lane) for lane, crc in enumerate(self.crcs))
+
+    # Process p_crc16citt_calculation of every lane
+    def evaluate(self, changed):
+
+        if self.rising_edge(changed, self.clk_i):
+
+            if self.rst_sync_i.is_high():
+                self.crcs = list(self.g_crc_inits)
+
+            elif self.CRC16_en_i.value:
+                enables, data = self.CRC16_en_i.value, self.CRC16_data_i.value
+
+                for lane in range(self.lanes):
+                    if enables >> lane & 1:
+                        crc = self.crcs[lane]
+                        byte = (crc >> 8) ^ ((data >> (8 * lane)) & 0xFF)
+                        byte ^= byte >> 4
+                        self.crcs[lane] = ((crc << 8) ^ (byte << 12) ^ (byte << 5) ^ byte) & 0xFFFF
+
+            self.kernel.schedule(self.CRC16_out_o, self.packed_crcs())
+
+
+# Model of the contador entity (uvm_examples/simple_counter/simple_counter_module.vhd)
+class contador_model(fast_model):
+
+    # Initialization of the model's ports and registers
+    def __init__(self, kernel):
+        super().__init__(kernel, "contador")
+
+        self.count_reg = 0
+
+        self.clk    = self.add_signal("clk", 1)
+        self.reset  = self.add_signal("reset", 1)
+        self.enable = self.add_signal("enable", 1)
+        self.count  = self.add_signal("count", 4, self.count_reg)
+
+    # Counter process
+    def evaluate(self, changed):
+
+        if self.rising_edge(changed, self.clk):
+
+            if self.reset.is_high():
+                self.count_reg = 0
+
+            elif self.enable.is_high():
+                self.count_reg = (self.count_reg + 1) & 0xF
+
+            self.kernel.schedule(self.count, self.count_reg)
+
+
+# Model of the simple_state_machine entity (cocotb_examples/simple_state_machine/FPGA_Development/simple_state_machine.vhd)
+class simple_state_machine_model(fast_model):
+
+    # t_states enumeration, in declaration order, with the next state for inpt = '1' and the output of every state
+    RESET, IDLE, STATE1, STATE2, STATE3 = range(5)
+    NEXT_STATE = (IDLE, STATE1, STATE2, STATE3, IDLE)
+    OUTPUT = (0, 1, 0, 1, 0)
+
+    # Initialization of the model's ports and state
+    def __init__(self, kernel):
+        super().__init__(kernel, "simple_state_machine")
+
+        self.s_state = self.RESET
+
+        self.rst   = self.add_signal("rst", 1)
+        self.clk   = self.add_signal("clk", 1)
+        self.inpt  = self.add_signal("inpt", 1)
+        self.outpt = self.add_signal("outpt", 1, self.OUTPUT[self.s_state])
+
+    # Processes p_state_machine_process, with asynchronous reset, and p_output_assignment
+    def evaluate(self, changed):
+
+        if self.rst.is_high():
+            self.s_state = self.RESET
+
+        elif self.rising_edge(changed, self.clk) and self.inpt.is_high():
+            self.s_state = self.NEXT_STATE[self.s_state]
+
+        self.kernel.schedule(self.outpt, self.OUTPUT[self.s_state])
+
+
+# Model of the mux_8bit entity (cocotb_examples/8bit_MUX/FPGA_Development/8bit_mux.vhd)
+class mux_8bit_model(fast_model):
+
+    # Initialization of the model's ports
+    def __init__(self, kernel):
+        super().__init__(kernel, "mux_8bit")
+
+        self.sel   = self.add_signal("sel", 3)
+        self.inpt  = self.add_signal("inpt", 8)
+        self.rst   = self.add_signal("rst", 1)
+        self.outpt = self.add_signal("outpt", 1, 0)
+
+    # Selected signal assignment of outpt, where any reset or undefined selector falls into "when others"
+    def evaluate(self, changed):
+
+        if self.sel.defined and self.rst.defined and self.rst.value == 0:
+            self.kernel.schedule(self.outpt, (self.inpt.value >> self.sel.value) & 1, self.inpt.defined)
+        else:
+            self.kernel.schedule(self.outpt, 0)
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Model registry
+
+## Constant mapping every TOPLEVEL to its model class
+FAST_MODELS = {
+    "crc16citt_module": crc16citt_module_model,
+    "crc16citt_multilane": crc16citt_multilane_model,
+    "contador": contador_model,
+    "simple_state_machine": simple_state_machine_model,
+    "mux_8bit": mux_8bit_model,
+}
+
+##########################################################################################################################################################################
@@ -0,0 +1,318 @@
+##########################################################################################################################################################################
+# offline_checker.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the offline checker of the repository. It replays the value changes of a waveform file (the simulation.ghw written by nvc, the
+# simulation.vcd written by GHDL or the files of the wave policy), streamed by wave_reader, through the reference model of its toplevel and reports the
+# mismatches, so the simulation can run with its checks turned off and be verified afterwards, on other cores.
+# Every checker is self-synchronizing where the design allows it: the value expected after a rising edge is computed from the values sampled before it, so a
+# file starting in the middle of a run (a wave policy window) is also checked.
+# It runs from the repository root (or a Testbench directory, with make check_waves):
+# python3 -m verification_tools.offline_checker WAVE_FILES... [--toplevel TOPLEVEL] [--jobs N]
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import argparse
+import importlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from verification_tools.regression_runner import REPOSITORY_DIR, TESTBENCHES
+from verification_tools.wave_reader import open_wave
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant for the number of mismatches reported by every checker (every one is counted)
+REPORTED_MISMATCHES = 10
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Functions
+
+def rising_edge(previous, values, name):
+# Description: this function detects a rising edge of a signal in a time step, as the VHDL rising_edge function.
+# Parameters: previous: values before the time step; values: values after it; name: the signal name.
+# Returns: True on a rising edge.
+
+    return previous.get(name) == "0" and values.get(name) == "1"
+
+
+def binary(value):
+# Description: this function checks that a value only has 0 and 1 bits.
+# Parameters: value: the VCD value string, or None before its first change.
+# Returns: True if the value is binary.
+
+    return value is not None and not value.strip("01")
+
+
+def import_reference_model(testbench, module):
+# Description: this function imports the reference model of a testbench, from its Testbench directory.
+# Parameters: testbench: key of TESTBENCHES; module: name of the reference model module.
+# Returns: The module.
+
+    testbench_dir = os.path.join(REPOSITORY_DIR, TESTBENCHES[testbench])
+    if testbench_dir not in sys.path:
+        sys.path.insert(0, testbench_dir)
+
+    return importlib.import_module(module)
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Checker classes
+
+# Base class of the checkers, counting the checked steps and the mismatches
+class offline_checker:
+
+    # Toplevel signals used by the checker
+    SIGNALS = ()
+
+    # Initialization of the counters
+    def __init__(self):
+
+        self.checked = 0
+        self.mismatch_count = 0
+        self.mismatches = []
+
+    # Compares an observed value with the expected one
+    def compare(self, time_ns, name, observed, expected):
+
+        self.checked += 1
+        if observed != expected:
+            self.mismatch_count += 1
+            if len(self.mismatches) < REPORTED_MISMATCHES:
+                self.mismatches.append("%.3f ns: %s is %s and should be %s" % (time_ns, name, observed, expected))
+
+    # Checks a time step, given the values before and after it
+    def step(self, time_ns, previous, values):
+
+        raise NotImplementedError
+
+
+# Checker of the crc16citt_module: after every rising edge, the output is the one before it advanced by the sampled byte (or reset)
+class crc16citt_module_checker(offline_checker):
+
+    SIGNALS = ("clk_i", "rst_sync_i", "crc16_en_i", "crc16_data_i", "crc16_out_o")
+
+    def __init__(self):
+        super().__init__()
+
+        model = import_reference_model("crc16citt", "crc16citt_reference_model")
+        self.crc_init = model.CRC16CITT_INIT
+        self.crc_update = model.crc16citt_update
+
+    def step(self, time_ns, previous, values):
+
+        if not rising_edge(previous, values, "clk_i"):
+            return
+
+        reset, enable, data, crc = previous.get("rst_sync_i"), previous.get("crc16_en_i"), previous.get("crc16_data_i"), previous.get("crc16_out_o")
+
+        # Computes the expected CRC from the values sampled by the edge, following the "= '1'" branches of the design (an undefined control is not '1'),
+        # and skipping the edges whose data is undefined
+        if reset == "1":
+            expected = self.crc_init
+        elif enable != "1" and binary(crc):
+            expected = int(crc, 2)
+        elif enable == "1" and binary(crc) and binary(data):
+            expected = self.crc_update(int(data, 2), int(crc, 2))
+        else:
+            return
+
+        self.compare(time_ns, "crc16_out_o", values["crc16_out_o"], format(expected, "016b"))
+
+
+# Checker of the contador: after every rising edge, the count is the one before it incremented when enabled (or reset)
+class contador_checker(offline_checker):
+
+    SIGNALS = ("clk", "reset", "enable", "count")
+
+    def step(self, time_ns, previous, values):
+
+        if not rising_edge(previous, values, "clk"):
+            return
+
+        reset, enable, count = previous.get("reset"), previous.get("enable"), previous.get("count")
+
+        # Computes the expected count from the values sampled by the edge, following the "= '1'" branches of the design (an undefined control is not '1'),
+        # and skipping the edges whose count is undefined
+        if reset == "1":
+            expected = 0
+        elif enable != "1" and binary(count):
+            expected = int(count, 2)
+        elif enable == "1" and binary(count):
+            expected = (int(count, 2) + 1) & 0xF
+        else:
+            return
+
+        self.compare(time_ns, "count", values["count"], format(expected, "04b"))
+
+
+# Checker of the simple_state_machine: tracks the state with the reference model tables and checks the output after every time step. The state is only known
+# from the start of the simulation or from a reset
+class simple_state_machine_checker(offline_checker):
+
+    SIGNALS = ("clk", "rst", "inpt", "outpt")
+
+    def __init__(self):
+        super().__init__()
+
+        model = import_reference_model("simple_state_machine", "simple_state_machine_reference_model")
+        self.reset_state = model.RESET
+        self.transitions = model.TRANSITIONS.tolist()
+        self.outputs = model.OUTPUTS.tolist()
+        self.state = None
+
+    def step(self, time_ns, previous, values):
+
+        # The machine starts in RESET, and is reset asynchronously
+        if values.get("rst") == "1" or (time_ns == 0 and self.state is None):
+            self.state = self.reset_state
+
+        # Transitions on the rising edges, with inpt = '1'
+        elif self.state is not None and rising_edge(previous, values, "clk") and previous.get("inpt") == "1":
+            self.state = self.transitions[self.state * 2 + 1]
+
+        if self.state is not None and "outpt" in values:
+            self.compare(time_ns, "outpt", values["outpt"], str(self.outputs[self.state]))
+
+
+# Checker of the mux_8bit: combinational, so the output is checked after every time step
+class mux_8bit_checker(offline_checker):
+
+    SIGNALS = ("sel", "inpt", "rst", "outpt")
+
+    def __init__(self):
+        super().__init__()
+
+        self.expected_output = import_reference_model("mux_8bit", "mux_reference_model").mux_expected_output
+
+    def step(self, time_ns, previous, values):
+
+        selector, inpt, reset = values.get("sel"), values.get("inpt"), values.get("rst")
+        if "outpt" not in values or inpt is None:
+            return
+
+        # An undefined selector or reset falls into "when others", and an undefined input bit is passed through
+        if reset != "0" or not binary(selector):
+            expected = "0"
+        elif binary(inpt):
+            expected = str(self.expected_output(int(inpt, 2), int(selector, 2), 0))
+        else:
+            expected = inpt[len(inpt) - 1 - int(selector, 2)]
+
+        self.compare(time_ns, "outpt", values["outpt"], expected)
+
+
+## Constant mapping every TOPLEVEL to its checker class
+OFFLINE_CHECKERS = {
+    "crc16citt_module": crc16citt_module_checker,
+    "contador": contador_checker,
+    "simple_state_machine": simple_state_machine_checker,
+    "mux_8bit": mux_8bit_checker,
+}
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Replay functions
+
+def check_wave(path, toplevel=None):
+# Description: this function replays a waveform file through the checker of its toplevel. It runs inside the process pool.
+# Parameters: path: path to the waveform file; toplevel: toplevel name, default is the top scope of the file.
+# Returns: A dictionary with the file, the toplevel, the number of time steps and checks, the mismatches and the wall-clock time.
+
+    start_time = time.perf_counter()
+
+    # Opens the file and the checker, decoding only the signals of the checker
+    reader = open_wave(path)
+    toplevel = toplevel or reader.scope
+    assert toplevel in OFFLINE_CHECKERS, "There is no offline checker for the toplevel %s of %s" % (toplevel, path)
+
+    checker = OFFLINE_CHECKERS[toplevel]()
+    reader.select(checker.SIGNALS)
+    missing = set(checker.SIGNALS) - set(reader.signals)
+    assert not missing, "%s does not have the signals %s" % (path, ", ".join(sorted(missing)))
+
+    # Replays every time step, with the values before and after it
+    time_ns = reader.time_unit * 1e9
+    values = {}
+    steps = 0
+
+    for step_time, changes in reader.steps():
+
+        previous = values.copy()
+        values.update(changes)
+        checker.step(step_time * time_ns, previous, values)
+        steps += 1
+
+    reader.close()
+
+    # Returns the result of the file
+    return {"file": path, "toplevel": toplevel, "steps": steps, "checked": checker.checked, "mismatch_count": checker.mismatch_count,
+            "mismatches": checker.mismatches, "wall_time": time.perf_counter() - start_time}
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Main
+
+def main():
+
+    # Parses the checker arguments
+    parser = argparse.ArgumentParser(description="Replays waveform files through the reference models of their toplevels")
+    parser.add_argument("files", nargs="+", help="waveform files (FST, as the simulation.ghw of nvc, or VCD)")
+    parser.add_argument("--toplevel", choices=sorted(OFFLINE_CHECKERS), help="toplevel of the files, default is their top scope")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="number of files checked at once, default is every core")
+    args = parser.parse_args()
+
+    # Rejects the missing or unreadable files before starting the pool, whose workers would only raise them back
+    unreadable = [path for path in args.files if not os.path.isfile(path) or not os.access(path, os.R_OK)]
+    if unreadable:
+        parser.error("cannot read the waveform file(s) %s" % ", ".join(unreadable))
+
+    # Checks the files on the process pool
+    failed_files = 0
+    with ProcessPoolExecutor(max_workers=min(args.jobs, len(args.files))) as pool:
+
+        futures = [pool.submit(check_wave, path, args.toplevel) for path in args.files]
+        for path, future in zip(args.files, futures):
+
+            # Reports a file which cannot be parsed or checked as failed, without stopping the other ones
+            try:
+                result = future.result()
+            except Exception as exception:
+                failed_files += 1
+                print("%s: ERROR: %s" % (path, exception))
+                continue
+
+            passed = result["mismatch_count"] == 0 and result["checked"] > 0
+            failed_files += not passed
+
+            print("%s: %s, %i time steps, %i checks, %i mismatch(es) in %.2f s: %s" % (result["file"], result["toplevel"], result["steps"], result["checked"],
+                                                                                      result["mismatch_count"], result["wall_time"],
+                                                                                      "PASS" if passed else "FAIL"))
+            for mismatch in result["mismatches"]:
+                print("    %s" % mismatch)
+
+    # Returns 1 if any file has mismatches, nothing to check or an error
+    return 1 if failed_files else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+##########################################################################################################################################################################
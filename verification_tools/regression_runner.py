@@ -0,0 +1,360 @@
+##########################################################################################################################################################################
+# regression_runner.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the regression runner of the repository. It fans the testbenches out over several seeds and simulators on a local process pool,
+# every job with its own SIM_BUILD directory, COCOTB_RESULTS_FILE and COVERAGE_DIR, and merges the results.xml files and the functional coverage files into a
+# single report.
+# It runs from the repository root: python3 -m verification_tools.regression_runner --seeds 8 [--simulators ghdl nvc] [--testbenches ...] [--jobs N]
+# [--waves | --waves-on-failure] [--profile] [--ledger FILE | --no-ledger]
+# Every test run is recorded into the run ledger (run_ledger.py), and the throughput regressions it flags are printed.
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import argparse
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from verification_tools.coverage import coverage_report, find_coverage_files, merge_coverage, save_coverage
+from verification_tools.run_ledger import DEFAULT_LEDGER, record_runs, regression_report, testcase_runs, throughput_regressions
+from verification_tools.wave_policy import FAILURE_WINDOW_AFTER, FAILURE_WINDOW_BEFORE, failure_window_environment, first_failure
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant for the repository root, containing the verification_tools package
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+## Constant mapping every testbench to its Makefile directory, relative to the repository root
+TESTBENCHES = {
+    "mux_8bit": os.path.join("cocotb_examples", "8bit_MUX", "Testbench"),
+    "simple_state_machine": os.path.join("cocotb_examples", "simple_state_machine", "Testbench"),
+    "simple_counter": os.path.join("uvm_examples", "simple_counter", "cocotb_docker_container", "ext_files", "Testbench"),
+    "crc16citt": os.path.join("uvm_examples", "crc16_module", "cocotb_docker_container", "ext_files", "Testbench"),
+    "crc16citt_multilane": os.path.join("uvm_examples", "crc16_module", "cocotb_docker_container", "ext_files", "Testbench"),
+}
+
+## Constant mapping the testbenches sharing a Makefile directory with another one to the Makefile variables selecting them
+TESTBENCH_VARIABLES = {
+    "crc16citt_multilane": {"TOPLEVEL": "crc16citt_multilane", "MODULE": "crc16citt_multilane_testbench"},
+}
+
+## Constant mapping every testbench to its clock period, in ns (the period of its stimulus, for the combinational ones), converting its simulated time into cycles
+CLOCK_PERIODS = {
+    "mux_8bit": 10,
+    "simple_state_machine": 10,
+    "simple_counter": 10,
+    "crc16citt": 10,
+    "crc16citt_multilane": 10,
+}
+
+## Constants for the supported simulators ("fast" runs the make fast target, without an HDL simulator) and the default ones
+SIMULATORS = ("ghdl", "nvc", "fast")
+DEFAULT_SIMULATORS = ("ghdl", "nvc")
+
+## Constant for the number of log lines copied into the report of a job without a results file
+LOG_TAIL_LINES = 20
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Job functions
+
+def run_job(testbench, simulator, seed, work_dir, waves=False, testcase=None, testbench_dir=None, job_dir=None, sim_build=None, environment=None, profile=False,
+            make_variables=None):
+# Description: this function runs a testbench with a simulator and a seed, isolated in its own job directory. It runs inside the process pool, and in the
+# simulation worker, which passes its own directories.
+# Parameters: testbench: key of TESTBENCHES; simulator: one of SIMULATORS; seed: random seed; work_dir: root of the job directories; waves: dumps waveforms;
+# testcase: comma separated tests to run, default is every test; testbench_dir: Makefile directory, default is the one in TESTBENCHES; job_dir: job directory,
+# default is one per testbench, simulator and seed in work_dir; sim_build: SIM_BUILD directory, default is one inside the job directory; environment: additional
+# environment variables, overriding the ones of the job (as WAVES); profile: profiles the components of the pyuvm testbenches into the job directory;
+# make_variables: dictionary of variables overriding the Makefile ones (and the TESTBENCH_VARIABLES of the testbench), as MODULE.
+# Returns: A dictionary with the job parameters, its directories, results file, make return code and wall-clock time.
+
+    # Initializes the job directory and the files of the job
+    job_dir = os.path.abspath(job_dir or os.path.join(work_dir, testbench, simulator, "seed_%i" % seed))
+    os.makedirs(job_dir, exist_ok=True)
+    results_file = os.path.join(job_dir, "results.xml")
+    log_file = os.path.join(job_dir, "make.log")
+    coverage_dir = os.path.join(job_dir, "coverage")
+    profile_dir = os.path.join(job_dir, "profile")
+
+    if os.path.exists(results_file):
+        os.remove(results_file)
+    shutil.rmtree(coverage_dir, ignore_errors=True)
+    shutil.rmtree(profile_dir, ignore_errors=True)
+
+    # Builds the make command: every job has its own SIM_BUILD, the SIM_ARGS of the Makefile (as the coverage flags of nvc) being kept
+    testbench_dir = testbench_dir or os.path.join(REPOSITORY_DIR, TESTBENCHES[testbench])
+    sim_build = sim_build or os.path.join(job_dir, "sim_build")
+    command = ["make", "-C", testbench_dir]
+
+    if simulator == "fast":
+        command.append("fast")
+    else:
+        command += ["SIM=%s" % simulator, "SIM_BUILD=%s" % sim_build]
+
+    command += ["%s=%s" % (name, value) for name, value in dict(TESTBENCH_VARIABLES.get(testbench, {}), **(make_variables or {})).items()]
+
+    # The seed, the tests, the results file, the coverage directory and the waveform mode are passed through the environment, which is read by cocotb, by the
+    # fast mode, by the Makefiles and by the testbenches. The waveforms are written into the job directory, never into the shared testbench directory
+    job_environment = dict(os.environ, RANDOM_SEED=str(seed), COCOTB_RESULTS_FILE=results_file, COVERAGE_DIR=coverage_dir, VERIFICATION_TOOLS_DIR=REPOSITORY_DIR,
+                           WAVES="full" if waves else "off", WAVE_DIR=job_dir)
+    job_environment.update(environment or {})
+    if testcase:
+        job_environment["TESTCASE"] = testcase
+    if profile:
+        job_environment["PROFILE_DIR"] = profile_dir
+
+    # Runs the job, logging its output
+    start_time = time.perf_counter()
+    with open(log_file, "w") as log:
+        returncode = subprocess.call(command, stdout=log, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL, env=job_environment)
+    wall_time = time.perf_counter() - start_time
+
+    # Returns the job result
+    return {"testbench": testbench, "simulator": simulator, "seed": seed, "job_dir": job_dir, "results_file": results_file, "log_file": log_file,
+            "coverage_dir": coverage_dir, "profile_dir": profile_dir if profile else None, "returncode": returncode, "wall_time": wall_time, "testbench_dir": testbench_dir, "sim_build": sim_build}
+
+
+def run_failure_window(job, before=FAILURE_WINDOW_BEFORE, after=FAILURE_WINDOW_AFTER):
+# Description: this function reruns the first failed test of a job with its seed and build, tracing the signals of its wave policy only around the failure.
+# Parameters: job: the dictionary returned by run_job; before, after: window around the failure, in ns.
+# Returns: The dictionary returned by run_job for the rerun, whose job directory has the waveform files, with an "error" message if the rerun did not fail the
+# test again (it exited without results of the test, or the test passed), or None if no test failed.
+
+    failure = first_failure(job["results_file"])
+    if failure is None:
+        return None
+
+    # Reruns only the failed test, in a folder of the job directory
+    testcase, failure_time = failure
+    window_dir = os.path.join(job["job_dir"], "failure_window")
+
+    window = run_job(job["testbench"], job["simulator"], job["seed"], None, testcase=testcase, testbench_dir=job["testbench_dir"], job_dir=window_dir,
+                     sim_build=job["sim_build"], environment=failure_window_environment(failure_time, window_dir, before, after))
+
+    # The rerun must fail the same test again, otherwise its waveforms do not show the failure
+    rerun_failure = first_failure(window["results_file"])
+    if rerun_failure is None or rerun_failure[0] != testcase:
+        window["error"] = "The rerun of %s exited with code %i without failing it again, see %s" % (testcase, window["returncode"], window["log_file"])
+
+    return window
+
+
+def run_job_with_failure_window(testbench, simulator, seed, work_dir, waves=False, profile=False):
+# Description: this function runs a job without waveforms and, if it fails, reruns its first failed test tracing only the window around the failure.
+# Parameters: the same as run_job.
+# Returns: The dictionary returned by run_job, with the one of the rerun in "failure_window" (None if no test failed).
+
+    job = run_job(testbench, simulator, seed, work_dir, waves, environment={"WAVES": "off"}, profile=profile)
+    job["failure_window"] = run_failure_window(job)
+
+    return job
+
+
+def read_log_tail(log_file, lines=LOG_TAIL_LINES):
+# Description: this function reads the last lines of a job log.
+# Parameters: log_file: path to the log; lines: number of lines.
+# Returns: The last lines, as a string.
+
+    try:
+        with open(log_file, errors="replace") as log:
+            return "".join(log.readlines()[-lines:])
+    except OSError:
+        return ""
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Report functions
+
+def job_testsuite(job):
+# Description: this function builds the testsuite of a job from its results file, or an error testcase if the job produced none.
+# Parameters: job: the dictionary returned by run_job.
+# Returns: A tuple with the testsuite element, the number of tests and the number of failed tests.
+
+    # Initializes the testsuite, named and tagged after the job
+    testsuite = ET.Element("testsuite", name="%s.%s.seed_%i" % (job["testbench"], job["simulator"], job["seed"]), package=job["testbench"])
+    properties = ET.SubElement(testsuite, "properties")
+    for name in ("testbench", "simulator", "seed", "returncode", "job_dir"):
+        ET.SubElement(properties, "property", name=name, value=str(job[name]))
+    ET.SubElement(properties, "property", name="wall_time", value="%.3f" % job["wall_time"])
+
+    # Copies the testcases of the results file
+    try:
+        testcases = ET.parse(job["results_file"]).getroot().iter("testcase")
+        testcases = list(testcases)
+    except (OSError, ET.ParseError):
+        testcases = []
+
+    for testcase in testcases:
+        testsuite.append(testcase)
+
+    # A job without testcases did not build or crashed the simulator
+    if not testcases:
+        testcase = ET.SubElement(testsuite, "testcase", name="make", classname=job["testbench"], time="%.3f" % job["wall_time"])
+        error = ET.SubElement(testcase, "error", message="make exited with code %i and wrote no results" % job["returncode"])
+        error.text = read_log_tail(job["log_file"])
+        testcases = [testcase]
+
+    # Counts the failed tests
+    failures = sum(1 for testcase in testcases if testcase.find("failure") is not None or testcase.find("error") is not None)
+    testsuite.set("tests", str(len(testcases)))
+    testsuite.set("failures", str(failures))
+    testsuite.set("time", "%.3f" % job["wall_time"])
+
+    return testsuite, len(testcases), failures
+
+
+def merge_results(jobs, output_file):
+# Description: this function merges the results of every job into a single JUnit report and prints the per-seed summary.
+# Parameters: jobs: list of dictionaries returned by run_job; output_file: path to the merged report.
+# Returns: The number of failed jobs.
+
+    # Initializes the merged report
+    testsuites = ET.Element("testsuites", name="regression")
+    failed_jobs = 0
+
+    print("\n%-22s %-6s %12s %-6s %7s %9s" % ("TESTBENCH", "SIM", "SEED", "STATUS", "TESTS", "WALL (s)"))
+
+    # Adds the testsuite of every job, in a stable order
+    for job in sorted(jobs, key=lambda job: (job["testbench"], job["simulator"], job["seed"])):
+
+        testsuite, tests, failures = job_testsuite(job)
+        testsuites.append(testsuite)
+
+        passed = failures == 0 and job["returncode"] == 0
+        failed_jobs += not passed
+
+        print("%-22s %-6s %12i %-6s %3i/%-3i %9.2f" % (job["testbench"], job["simulator"], job["seed"], "PASS" if passed else "FAIL", tests - failures, tests,
+                                                      job["wall_time"]))
+
+    # Writes the merged report
+    ET.indent(testsuites)
+    ET.ElementTree(testsuites).write(output_file, encoding="unicode", xml_declaration=True)
+
+    return failed_jobs
+
+
+def merge_job_coverage(jobs, output_file):
+# Description: this function merges the functional coverage files of every job into a single file and prints its report.
+# Parameters: jobs: list of dictionaries returned by run_job; output_file: path to the merged coverage file.
+# Returns: The number of merged files.
+
+    # Obtains the coverage files written by the tests of every job
+    files = find_coverage_files([job["coverage_dir"] for job in jobs if os.path.isdir(job["coverage_dir"])])
+    if not files:
+        return 0
+
+    # Merges them, adding the counters of every covergroup, and prints the report
+    merged = merge_coverage(files)
+    save_coverage(merged, output_file)
+
+    print("\nFunctional coverage of %i file(s):" % len(files))
+    for line in coverage_report(merged):
+        print(line)
+
+    return len(files)
+
+
+def record_job_runs(jobs, ledger):
+# Description: this function records the tests of every job into the run ledger and prints the throughput regressions it flags.
+# Parameters: jobs: list of dictionaries returned by run_job; ledger: path to the SQLite ledger file.
+# Returns: The number of throughput regressions.
+
+    # Records the testcases of every job, the jobs without results as a failed make testcase
+    runs = []
+    for job in jobs:
+        testsuite, _, _ = job_testsuite(job)
+        runs += testcase_runs(testsuite.iter("testcase"), job["testbench"], job["simulator"], job["seed"], CLOCK_PERIODS[job["testbench"]])
+
+    record_runs(ledger, runs, "regression")
+
+    # Prints the regressions against the previous runs
+    regressions = throughput_regressions(ledger)
+    print("\n%i run(s) recorded into %s, %i throughput regression(s)%s" % (len(runs), ledger, len(regressions), ":" if regressions else ""))
+    for line in regression_report(regressions):
+        print("    " + line)
+
+    return len(regressions)
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Main
+
+def main():
+
+    # Parses the runner arguments
+    parser = argparse.ArgumentParser(description="Runs the testbenches over several seeds and simulators on a local process pool")
+    parser.add_argument("--seeds", type=int, default=4, help="number of seeds per testbench and simulator")
+    parser.add_argument("--seed-list", type=int, nargs="+", help="explicit seeds, instead of --seeds random ones")
+    parser.add_argument("--simulators", nargs="+", choices=SIMULATORS, default=list(DEFAULT_SIMULATORS), help="simulators to run")
+    parser.add_argument("--testbenches", nargs="+", choices=sorted(TESTBENCHES), default=sorted(TESTBENCHES), help="testbenches to run")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="number of parallel jobs, default is every core")
+    parser.add_argument("--work-dir", default="regression_build", help="root of the job directories")
+    parser.add_argument("--output", default="regression_results.xml", help="merged JUnit report")
+    parser.add_argument("--coverage-output", default="regression_coverage.npz", help="merged functional coverage file")
+    parser.add_argument("--waves", action="store_true", help="dumps the waveforms of every job into its directory")
+    parser.add_argument("--waves-on-failure", action="store_true", help="reruns the first failed test of every failed job, dumping its wave policy signals only "
+                                                                         "around the failure")
+    parser.add_argument("--profile", action="store_true", help="profiles the components of the pyuvm testbenches into the profile directory of every job")
+    parser.add_argument("--ledger", default=DEFAULT_LEDGER, help="SQLite run ledger recording every test run")
+    parser.add_argument("--no-ledger", action="store_true", help="does not record the runs into the ledger")
+    args = parser.parse_args()
+
+    # Obtains the seeds
+    seeds = args.seed_list or [random.randrange(1 << 31) for _ in range(args.seeds)]
+    print("Seeds: %s" % " ".join(str(seed) for seed in seeds))
+
+    # Fans the jobs out over the process pool
+    jobs = []
+    start_time = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+
+        job_function = run_job_with_failure_window if args.waves_on_failure else run_job
+        futures = [pool.submit(job_function, testbench, simulator, seed, args.work_dir, args.waves, profile=args.profile)
+                   for testbench in args.testbenches for simulator in args.simulators for seed in seeds]
+
+        # Prints every job as it finishes
+        for future in as_completed(futures):
+            job = future.result()
+            jobs.append(job)
+            print("[%i/%i] %s %s seed %i: make returned %i in %.2f s" % (len(jobs), len(futures), job["testbench"], job["simulator"], job["seed"],
+                                                                          job["returncode"], job["wall_time"]))
+            if job.get("failure_window") and "error" in job["failure_window"]:
+                print("    ERROR: %s" % job["failure_window"]["error"])
+            elif job.get("failure_window"):
+                print("    Waveforms around the failure: %s" % job["failure_window"]["job_dir"])
+
+    # Merges the results and the functional coverage
+    failed_jobs = merge_results(jobs, args.output)
+    merge_job_coverage(jobs, args.coverage_output)
+    if not args.no_ledger:
+        record_job_runs(jobs, args.ledger)
+    print("\n%i job(s) in %.2f s on %i worker(s), %i failed. Report: %s" % (len(jobs), time.perf_counter() - start_time, args.jobs, failed_jobs, args.output))
+
+    # Returns 1 if any job failed
+    return 1 if failed_jobs else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+##########################################################################################################################################################################
@@ -0,0 +1,301 @@
+##########################################################################################################################################################################
+# run_ledger.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the run ledger of the repository, a local SQLite database with a row for every test run: the testbench, the simulator, the seed, the
+# test, the git revision, the wall time, the simulated time, the simulated cycles per wall-clock second and the pass/fail status. The regression runner and the
+# benchmark record their runs into it, and the results.xml files of the other runs (as the docker containers) are recorded with the record command.
+# The check command flags the throughput regressions of every (testbench, simulator, test): a last run slower than the lower bound of the prediction interval
+# of the N runs before it (a sudden slowdown), or a significantly negative slope over the last N runs (a gradual one), both beyond a minimum slowdown.
+# python3 -m verification_tools.run_ledger record RESULTS_FILE --testbench NAME --simulator SIM [--seed S] [--ledger FILE]
+# python3 -m verification_tools.run_ledger history [--testbench NAME] [--simulator SIM] [--test TEST] [--last N] [--ledger FILE]
+# python3 -m verification_tools.run_ledger check [--window N] [--significance P] [--min-slowdown F] [--ledger FILE]
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import argparse
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant for the default ledger file, overridden by the RUN_LEDGER environment variable
+DEFAULT_LEDGER = os.getenv("RUN_LEDGER", "run_ledger.sqlite")
+
+## Constant for the default clock period of the recorded results files, in ns
+DEFAULT_CLOCK_PERIOD = 10
+
+## Constants for the regression check: number of previous runs compared with the last one, minimum number of them, one-sided significance level and minimum
+## relative slowdown flagged
+CHECK_WINDOW = 10
+CHECK_MIN_RUNS = 5
+CHECK_SIGNIFICANCE = 0.01
+CHECK_MIN_SLOWDOWN = 0.05
+
+## Constant for the schema of the ledger
+LEDGER_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recorded_at TEXT NOT NULL,
+    revision TEXT,
+    source TEXT,
+    testbench TEXT NOT NULL,
+    simulator TEXT NOT NULL,
+    seed INTEGER,
+    test TEXT NOT NULL,
+    wall_time REAL,
+    sim_time_ns REAL,
+    cycles_per_second REAL,
+    passed INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_test ON runs (testbench, simulator, test, id);
+"""
+
+## Constant for the recorded columns of every run
+RUN_COLUMNS = ("testbench", "simulator", "seed", "test", "wall_time", "sim_time_ns", "cycles_per_second", "passed")
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Ledger functions
+
+@contextmanager
+def open_ledger(path):
+# Description: this function opens the ledger, creating its table if needed, for a with block.
+# Parameters: path: path to the SQLite file.
+# Returns: A context manager yielding the SQLite connection, which commits the changes of the block (or rolls them back on an exception) and closes it.
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    connection = sqlite3.connect(path, timeout=30)
+
+    try:
+        connection.row_factory = sqlite3.Row
+        connection.executescript(LEDGER_SCHEMA)
+
+        # The connection as a context manager only commits, so it is closed explicitly
+        with connection:
+            yield connection
+    finally:
+        connection.close()
+
+
+def git_revision(directory=None):
+# Description: this function obtains the git revision of the repository, marked as dirty if it has uncommitted changes.
+# Parameters: directory: a directory inside the repository, default is the one of this file.
+# Returns: The short revision, or None outside a git repository.
+
+    directory = directory or os.path.dirname(os.path.abspath(__file__))
+
+    try:
+        revision = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=directory, capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=directory, capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return revision + ("-dirty" if dirty else "")
+
+
+def testcase_runs(testcases, testbench, simulator, seed, clock_period=DEFAULT_CLOCK_PERIOD):
+# Description: this function builds the runs of the testcases of a JUnit results file, as written by cocotb.
+# Parameters: testcases: the testcase elements; testbench, simulator, seed: the run parameters; clock_period: clock period of the testbench, in ns.
+# Returns: A list of dictionaries with the RUN_COLUMNS of every run.
+
+    runs = []
+
+    for testcase in testcases:
+
+        # The skipped tests were not run
+        if testcase.find("skipped") is not None:
+            continue
+
+        wall_time = float(testcase.get("time", 0))
+        sim_time = float(testcase.get("sim_time_ns", 0))
+        passed = testcase.find("failure") is None and testcase.find("error") is None
+
+        runs.append({"testbench": testbench, "simulator": simulator, "seed": seed, "test": testcase.get("name"), "wall_time": wall_time,
+                     "sim_time_ns": sim_time, "cycles_per_second": sim_time / clock_period / wall_time if wall_time else None, "passed": passed})
+
+    return runs
+
+
+def results_file_runs(results_file, testbench, simulator, seed, clock_period=DEFAULT_CLOCK_PERIOD):
+# Description: this function builds the runs of a JUnit results file.
+# Parameters: results_file: path to the results file; the others: as in testcase_runs.
+# Returns: A list of dictionaries with the RUN_COLUMNS of every run.
+
+    return testcase_runs(ET.parse(results_file).getroot().iter("testcase"), testbench, simulator, seed, clock_period)
+
+
+def record_runs(path, runs, source=None, revision=None):
+# Description: this function records runs into the ledger.
+# Parameters: path: path to the SQLite file; runs: list of dictionaries with the RUN_COLUMNS; source: origin of the runs, as "regression"; revision: git
+# revision, default is the current one.
+# Returns: The number of recorded runs.
+
+    recorded_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+    revision = revision or git_revision()
+
+    with open_ledger(path) as connection:
+        connection.executemany("INSERT INTO runs (recorded_at, revision, source, %s) VALUES (?, ?, ?, %s)" % (", ".join(RUN_COLUMNS), ", ".join("?" * len(RUN_COLUMNS))),
+                               [(recorded_at, revision, source) + tuple(run[column] for column in RUN_COLUMNS) for run in runs])
+
+    return len(runs)
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Regression check functions
+
+def throughput_regressions(path, window=CHECK_WINDOW, significance=CHECK_SIGNIFICANCE, min_slowdown=CHECK_MIN_SLOWDOWN, min_runs=CHECK_MIN_RUNS):
+# Description: this function checks the throughput of the last passed run of every (testbench, simulator, test) against the window of passed runs before it,
+# flagging a last run below the one-sided prediction interval of the window and a significantly negative slope over the window and the last run.
+# Parameters: path: path to the SQLite file; window: number of previous runs; significance: one-sided significance level; min_slowdown: minimum relative
+# slowdown flagged; min_runs: minimum number of previous runs to check a test.
+# Returns: A list of dictionaries describing every regression.
+
+    regressions = []
+    quantile = statistics.NormalDist().inv_cdf(1 - significance)
+
+    with open_ledger(path) as connection:
+
+        keys = connection.execute("SELECT DISTINCT testbench, simulator, test FROM runs WHERE passed AND cycles_per_second > 0").fetchall()
+
+        for key in keys:
+
+            # Obtains the last runs, oldest first
+            rows = connection.execute("SELECT revision, cycles_per_second FROM runs WHERE testbench = ? AND simulator = ? AND test = ? AND passed AND "
+                                      "cycles_per_second > 0 ORDER BY id DESC LIMIT ?", tuple(key) + (window + 1,)).fetchall()[::-1]
+            if len(rows) < min_runs + 1:
+                continue
+
+            previous = [row["cycles_per_second"] for row in rows[:-1]]
+            last = rows[-1]["cycles_per_second"]
+            mean = statistics.fmean(previous)
+            deviation = statistics.stdev(previous)
+
+            regression = {"testbench": key["testbench"], "simulator": key["simulator"], "test": key["test"], "revision": rows[-1]["revision"], "runs": len(previous),
+                          "mean": mean, "last": last}
+
+            # A sudden slowdown: the last run is below the prediction interval of the previous ones
+            bound = mean - quantile * deviation * (1 + 1 / len(previous)) ** 0.5
+            if last < bound and (mean - last) / mean >= min_slowdown:
+                regressions.append(dict(regression, kind="drop", slowdown=(mean - last) / mean))
+                continue
+
+            # A gradual slowdown: the least squares slope over the runs is significantly negative
+            values = previous + [last]
+            slope, error = least_squares_slope(values)
+            if error and slope / error < -quantile and -slope * (len(values) - 1) / mean >= min_slowdown:
+                regressions.append(dict(regression, kind="trend", slowdown=-slope * (len(values) - 1) / mean))
+
+    return regressions
+
+
+def least_squares_slope(values):
+# Description: this function fits a line to values taken at consecutive runs.
+# Parameters: values: the values, oldest first.
+# Returns: A tuple with the slope, per run, and its standard error (0 if the fit is exact).
+
+    count = len(values)
+    x_mean = (count - 1) / 2
+    y_mean = statistics.fmean(values)
+    x_squares = sum((x - x_mean) ** 2 for x in range(count))
+
+    slope = sum((x - x_mean) * (y - y_mean) for x, y in enumerate(values)) / x_squares
+    residuals = sum((y - y_mean - slope * (x - x_mean)) ** 2 for x, y in enumerate(values))
+
+    return slope, (residuals / (count - 2) / x_squares) ** 0.5
+
+
+def regression_report(regressions):
+# Description: this function builds the report of the throughput regressions.
+# Parameters: regressions: the list returned by throughput_regressions.
+# Returns: A list with the lines of the report.
+
+    return ["%s %s %s: %s slowdown of %.1f%% (%.0f cycles/s, mean of the %i previous runs %.0f cycles/s) at revision %s" % (
+                regression["testbench"], regression["simulator"], regression["test"], "sudden" if regression["kind"] == "drop" else "gradual",
+                100 * regression["slowdown"], regression["last"], regression["runs"], regression["mean"], regression["revision"])
+            for regression in regressions]
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Main
+
+def main():
+
+    # Parses the ledger arguments
+    parser = argparse.ArgumentParser(description="Records the test runs into a SQLite ledger and checks their throughput for regressions")
+    parser.add_argument("--ledger", default=DEFAULT_LEDGER, help="SQLite ledger file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="records the tests of a results.xml file")
+    record.add_argument("results_file", help="JUnit results file written by cocotb")
+    record.add_argument("--testbench", required=True, help="testbench name")
+    record.add_argument("--simulator", required=True, help="simulator name")
+    record.add_argument("--seed", type=int, help="random seed of the run")
+    record.add_argument("--clock-period", type=float, default=DEFAULT_CLOCK_PERIOD, help="clock period of the testbench, in ns")
+    record.add_argument("--source", default="manual", help="origin of the run")
+
+    history = commands.add_parser("history", help="prints the last runs")
+    history.add_argument("--testbench", help="testbench name")
+    history.add_argument("--simulator", help="simulator name")
+    history.add_argument("--test", help="test name")
+    history.add_argument("--last", type=int, default=20, help="number of runs")
+
+    check = commands.add_parser("check", help="flags the throughput regressions, returning 1 if any")
+    check.add_argument("--window", type=int, default=CHECK_WINDOW, help="number of previous runs compared with the last one")
+    check.add_argument("--significance", type=float, default=CHECK_SIGNIFICANCE, help="one-sided significance level")
+    check.add_argument("--min-slowdown", type=float, default=CHECK_MIN_SLOWDOWN, help="minimum relative slowdown flagged")
+    args = parser.parse_args()
+
+    # Records a results file
+    if args.command == "record":
+        count = record_runs(args.ledger, results_file_runs(args.results_file, args.testbench, args.simulator, args.seed, args.clock_period), args.source)
+        print("%i run(s) recorded into %s" % (count, args.ledger))
+        return 0
+
+    # Prints the last runs, matching the filters
+    if args.command == "history":
+        filters = [(column, getattr(args, column)) for column in ("testbench", "simulator", "test") if getattr(args, column)]
+        where = " AND ".join("%s = ?" % column for column, _ in filters) or "1"
+
+        with open_ledger(args.ledger) as connection:
+            rows = connection.execute("SELECT * FROM runs WHERE %s ORDER BY id DESC LIMIT ?" % where, [value for _, value in filters] + [args.last]).fetchall()
+
+        print("%-19s %-14s %-22s %-6s %-32s %12s %9s %12s %-6s" % ("RECORDED", "REVISION", "TESTBENCH", "SIM", "TEST", "SEED", "WALL (s)", "CYCLES/s", "STATUS"))
+        for row in rows[::-1]:
+            print("%-19s %-14s %-22s %-6s %-32s %12s %9.2f %12s %-6s" % (row["recorded_at"], row["revision"], row["testbench"], row["simulator"], row["test"],
+                                                                      row["seed"], row["wall_time"], "%.0f" % row["cycles_per_second"] if row["cycles_per_second"]
+                                                                      else "-", "PASS" if row["passed"] else "FAIL"))
+        return 0
+
+    # Checks the throughput regressions
+    regressions = throughput_regressions(args.ledger, args.window, args.significance, args.min_slowdown)
+    for line in regression_report(regressions):
+        print(line)
+    print("%i throughput regression(s) found in %s" % (len(regressions), args.ledger))
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+##########################################################################################################################################################################
@@ -0,0 +1,411 @@
+##########################################################################################################################################################################
+# sim_worker.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the simulation worker of the repository. The worker is a long-lived process (the worker_service of the docker containers) which
+# builds the design once into a shared SIM_BUILD and then takes test jobs (testbench, seed, testcase) from a job directory, so every test only runs the
+# simulation, without rebuilding the image, the container or the design. The results, the log, the waveforms and the functional coverage of every job are
+# written into the job directory.
+# The job directory has three folders: queue/, where the jobs are submitted as JSON files; running/, where the worker moves the job it claims; and results/,
+# with a folder of outputs and a JSON summary for every finished job. A single serving process must use a job directory, with any number of worker threads.
+# It runs from the repository root (or /cocotb, in the containers):
+# python3 -m verification_tools.sim_worker serve --job-dir jobs [--simulator nvc] [--workers N] [--testbench NAME=DIR ...]
+# python3 -m verification_tools.sim_worker submit --job-dir jobs --testbench NAME [--seed S] [--testcase T] [--waves | --waves-on-failure] [--job-id ID] [--no-wait]
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import argparse
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from verification_tools.coverage import find_coverage_files
+from verification_tools.regression_runner import REPOSITORY_DIR, SIMULATORS, TESTBENCH_VARIABLES, TESTBENCHES, job_testsuite, run_failure_window, run_job
+from verification_tools.testcase_names import unknown_tests
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constants for the folders of the job directory
+QUEUE_DIR = "queue"
+RUNNING_DIR = "running"
+RESULTS_DIR = "results"
+BUILD_DIR = "sim_build"
+
+## Constant for the interval between two scans of the queue, and between two checks of a submitted job
+POLL_INTERVAL = 0.2 # s
+
+## Constant for the waveform files listed in the summary of a job
+WAVE_EXTENSIONS = (".ghw", ".vcd", ".fst")
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Job directory functions
+
+def write_json(path, data):
+# Description: this function writes a JSON file atomically, through a hidden temporary file, so a reader never sees it half written.
+# Parameters: path: path to the file; data: the JSON data.
+# Returns: None.
+
+    temporary_path = os.path.join(os.path.dirname(path), "." + os.path.basename(path) + ".tmp")
+    with open(temporary_path, "w") as json_file:
+        json.dump(data, json_file, indent=2)
+    os.replace(temporary_path, path)
+
+
+def job_paths(job_dir, job_id):
+# Description: this function obtains the paths of a job in the job directory.
+# Parameters: job_dir: the job directory; job_id: the job identifier.
+# Returns: A tuple with the queued file, the running file, the results folder and the summary file of the job.
+
+    return (os.path.join(job_dir, QUEUE_DIR, job_id + ".json"), os.path.join(job_dir, RUNNING_DIR, job_id + ".json"),
+            os.path.join(job_dir, RESULTS_DIR, job_id), os.path.join(job_dir, RESULTS_DIR, job_id + ".json"))
+
+
+def submit_job(job_dir, testbench, seed=None, testcase=None, waves=False, job_id=None, waves_on_failure=False):
+# Description: this function submits a job to the worker serving a job directory. A finished job with the same identifier is replaced.
+# Parameters: job_dir: the job directory; testbench: testbench name; seed: random seed, default is a random one; testcase: comma separated tests to run, default
+# is every test; waves: dumps the waveforms into the job results; job_id: the job identifier, default is a unique one; waves_on_failure: reruns the first failed
+# test, dumping its wave policy signals only around the failure.
+# Returns: The job identifier.
+
+    # Obtains the identifier and the seed, which is chosen here so it is logged by the submitter
+    job_id = job_id or "%s_%s_%06x" % (testbench, time.strftime("%Y%m%d_%H%M%S"), random.getrandbits(24))
+    seed = random.randrange(1 << 31) if seed is None else seed
+    queued_file, running_file, _, summary_file = job_paths(job_dir, job_id)
+
+    # A job is not resubmitted while it is pending
+    assert not os.path.exists(queued_file) and not os.path.exists(running_file), "The job %s is still pending" % job_id
+
+    # Rejects the names which are not tests of the testbench, which the simulation would only reject after the job is claimed
+    if testcase and testbench in TESTBENCHES:
+        unknown = unknown_tests(testcase, os.path.join(REPOSITORY_DIR, TESTBENCHES[testbench]), TESTBENCH_VARIABLES.get(testbench, {}).get("MODULE"))
+        assert not unknown, "The testbench %s has no test named %s" % (testbench, ", ".join(unknown))
+
+    # Removes the summary of a previous job with the same identifier, so the new one is waited for
+    if os.path.exists(summary_file):
+        os.remove(summary_file)
+
+    # Queues the job
+    os.makedirs(os.path.dirname(queued_file), exist_ok=True)
+    write_json(queued_file, {"id": job_id, "testbench": testbench, "seed": seed, "testcase": testcase, "waves": waves, "waves_on_failure": waves_on_failure,
+                             "submitted": time.time()})
+
+    return job_id
+
+
+def wait_job(job_dir, job_id, timeout=None):
+# Description: this function waits for a submitted job to finish.
+# Parameters: job_dir: the job directory; job_id: the job identifier; timeout: maximum waiting time, in seconds, default is no limit.
+# Returns: The summary of the job, or None on timeout.
+
+    summary_file = job_paths(job_dir, job_id)[3]
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    # Polls the summary file of the job
+    while not os.path.exists(summary_file):
+        if deadline is not None and time.monotonic() > deadline:
+            return None
+        time.sleep(POLL_INTERVAL)
+
+    with open(summary_file) as json_file:
+        return json.load(json_file)
+
+
+def claim_job(job_dir):
+# Description: this function claims the oldest queued job, moving it into the running folder. The move is atomic, so every job is claimed by a single thread.
+# Parameters: job_dir: the job directory.
+# Returns: The job, or None if the queue is empty.
+
+    queue_dir = os.path.join(job_dir, QUEUE_DIR)
+
+    # Tries the queued jobs in submission order, skipping the files still being written
+    queued_files = []
+    for name in os.listdir(queue_dir):
+        if name.endswith(".json") and not name.startswith("."):
+            try:
+                queued_files.append((os.path.getmtime(os.path.join(queue_dir, name)), name))
+            except FileNotFoundError:
+                continue
+
+    for _, name in sorted(queued_files):
+
+        running_file = os.path.join(job_dir, RUNNING_DIR, name)
+        try:
+            os.replace(os.path.join(queue_dir, name), running_file)
+        except FileNotFoundError:
+            continue
+
+        with open(running_file) as json_file:
+            return json.load(json_file)
+
+    return None
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Worker class
+
+class sim_worker:
+# Description: this class contains the simulation worker, which builds the testbenches once and runs the jobs of a job directory on a pool of threads. The make
+# processes do the work, so threads are enough to run several simulations at once.
+
+    def __init__(self, job_dir, testbenches, simulator="nvc", workers=1):
+    # Description: this function initializes the worker.
+    # Parameters: job_dir: the job directory; testbenches: dictionary mapping every served testbench to its Makefile directory; simulator: one of SIMULATORS;
+    # workers: number of jobs run at once.
+    # Returns: None.
+
+        self.job_dir = os.path.abspath(job_dir)
+        self.testbenches = testbenches
+        self.simulator = simulator
+        self.workers = workers
+
+        # Event set to stop the worker, and locks serializing the build of every testbench
+        self.stopping = threading.Event()
+        self.build_locks = {testbench: threading.Lock() for testbench in testbenches}
+
+        # Creates the folders of the job directory
+        for folder in (QUEUE_DIR, RUNNING_DIR, RESULTS_DIR, BUILD_DIR):
+            os.makedirs(os.path.join(self.job_dir, folder), exist_ok=True)
+
+
+    def build(self, testbench):
+    # Description: this function builds a testbench into its shared SIM_BUILD. Thanks to the build cache, it only hashes the sources when the design is unchanged,
+    # and it rebuilds it when a mounted source was edited. The fast mode has nothing to build.
+    # Parameters: testbench: testbench name.
+    # Returns: The make return code.
+
+        if self.simulator == "fast":
+            return 0
+
+        command = ["make", "-C", self.testbenches[testbench], "build", "SIM=%s" % self.simulator, "SIM_BUILD=%s" % self.sim_build(testbench), "WAVES=off"]
+        log_file = os.path.join(self.job_dir, BUILD_DIR, testbench + ".log")
+
+        # Builds the testbench, once at a time
+        with self.build_locks[testbench], open(log_file, "w") as log:
+            return subprocess.call(command, stdout=log, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+                                   env=dict(os.environ, VERIFICATION_TOOLS_DIR=REPOSITORY_DIR))
+
+
+    def sim_build(self, testbench):
+    # Description: this function obtains the SIM_BUILD shared by the jobs of a testbench.
+    # Parameters: testbench: testbench name.
+    # Returns: The SIM_BUILD path.
+
+        return os.path.join(self.job_dir, BUILD_DIR, testbench, self.simulator)
+
+
+    def unknown_tests(self, job):
+    # Description: this function finds the tests requested by a job which are not tests of its served testbench.
+    # Parameters: job: the claimed job.
+    # Returns: A list with the unknown names, empty if the job runs every test.
+
+        if not job["testcase"]:
+            return []
+
+        return unknown_tests(job["testcase"], self.testbenches[job["testbench"]], TESTBENCH_VARIABLES.get(job["testbench"], {}).get("MODULE"))
+
+
+    def run(self, job):
+    # Description: this function runs a claimed job and writes its summary.
+    # Parameters: job: the claimed job.
+    # Returns: The summary of the job.
+
+        _, running_file, results_dir, summary_file = job_paths(self.job_dir, job["id"])
+        summary = dict(job, simulator=self.simulator, started=time.time())
+
+        # Runs the job, failing it instead of the thread if the worker raises, so the job is still released and its submitter does not wait forever
+        try:
+
+            # Rejects the testbenches not served by the worker
+            if job["testbench"] not in self.testbenches:
+                summary.update(returncode=-1, error="The testbench %s is not served by this worker" % job["testbench"], tests=0, failures=0)
+
+            # Rejects the names which are not tests of the served testbench
+            elif self.unknown_tests(job):
+                summary.update(returncode=-1, error="The testbench %s has no test named %s" % (job["testbench"], ", ".join(self.unknown_tests(job))), tests=0, failures=0)
+
+            # Builds the testbench, failing the job if the design does not build
+            elif self.build(job["testbench"]) != 0:
+                summary.update(returncode=-1, error="The build failed, see %s" % os.path.join(self.job_dir, BUILD_DIR, job["testbench"] + ".log"), tests=0, failures=0)
+
+            # Runs the simulation on the built design
+            else:
+                result = run_job(job["testbench"], self.simulator, job["seed"], self.job_dir, job["waves"], job["testcase"],
+                                 testbench_dir=self.testbenches[job["testbench"]], job_dir=results_dir, sim_build=self.sim_build(job["testbench"]),
+                                 environment={"WAVES": "off"} if job.get("waves_on_failure") else None)
+                _, tests, failures = job_testsuite(result)
+
+                summary.update(returncode=result["returncode"], wall_time=result["wall_time"], tests=tests, failures=failures,
+                               results_file=result["results_file"], log_file=result["log_file"], wave_files=self.wave_files(results_dir),
+                               coverage_files=find_coverage_files([result["coverage_dir"]]) if os.path.isdir(result["coverage_dir"]) else [])
+
+                # Reruns the first failed test, tracing only the window around the failure
+                if job.get("waves_on_failure") and failures:
+                    window = run_failure_window(result)
+                    if window is not None and "error" in window:
+                        summary["error"] = window["error"]
+                    elif window is not None:
+                        summary["wave_files"] += self.wave_files(window["job_dir"])
+
+        except Exception as error:
+            traceback.print_exc()
+            summary.update(returncode=-1, error="The worker raised %s: %s" % (type(error).__name__, error))
+            summary.setdefault("tests", 0)
+            summary.setdefault("failures", 0)
+
+        # Writes the summary and releases the job
+        summary["passed"] = summary["returncode"] == 0 and summary["failures"] == 0
+        write_json(summary_file, summary)
+        os.remove(running_file)
+
+        return summary
+
+
+    def wave_files(self, directory):
+    # Description: this function lists the waveform files of a directory.
+    # Parameters: directory: the directory.
+    # Returns: The sorted list of paths.
+
+        return sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(WAVE_EXTENSIONS))
+
+
+    def serve_thread(self):
+    # Description: this function runs the jobs of the queue until the worker is stopped.
+    # Parameters: None.
+    # Returns: None.
+
+        while not self.stopping.is_set():
+
+            job = claim_job(self.job_dir)
+            if job is None:
+                self.stopping.wait(POLL_INTERVAL)
+                continue
+
+            # Keeps serving if the summary of a job cannot be written, leaving the job in the running folder to be requeued by the next worker
+            try:
+                summary = self.run(job)
+            except Exception:
+                traceback.print_exc()
+                continue
+
+            print("Job %s: %s seed %i %s, %i/%i tests passed" % (job["id"], job["testbench"], job["seed"], "PASS" if summary["passed"] else "FAIL",
+                                                                  summary["tests"] - summary["failures"], summary["tests"]), flush=True)
+
+
+    def serve(self):
+    # Description: this function requeues the jobs interrupted by a previous worker, builds every testbench and serves the queue until the worker is stopped.
+    # Parameters: None.
+    # Returns: None.
+
+        # Requeues the interrupted jobs
+        running_dir = os.path.join(self.job_dir, RUNNING_DIR)
+        for name in os.listdir(running_dir):
+            os.replace(os.path.join(running_dir, name), os.path.join(self.job_dir, QUEUE_DIR, name))
+
+        # Warms the worker up, building every testbench before taking jobs
+        for testbench in self.testbenches:
+            start_time = time.perf_counter()
+            returncode = self.build(testbench)
+            print("Built %s for %s in %.2f s (make returned %i)" % (testbench, self.simulator, time.perf_counter() - start_time, returncode), flush=True)
+
+        print("Serving %s with %i worker(s)" % (os.path.join(self.job_dir, QUEUE_DIR), self.workers), flush=True)
+
+        # Serves the queue, until the worker is stopped
+        threads = [threading.Thread(target=self.serve_thread, daemon=True) for _ in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            while thread.is_alive():
+                thread.join(POLL_INTERVAL)
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Main
+
+def main():
+
+    # Parses the worker arguments
+    parser = argparse.ArgumentParser(description="Runs test jobs on a long-lived simulation worker")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="builds the testbenches and runs the jobs of the job directory")
+    serve_parser.add_argument("--job-dir", default="jobs", help="job directory")
+    serve_parser.add_argument("--simulator", choices=SIMULATORS, default="nvc", help="simulator of the jobs")
+    serve_parser.add_argument("--workers", type=int, default=1, help="number of jobs run at once")
+    serve_parser.add_argument("--testbench", action="append", metavar="NAME=DIR", help="served testbench and its Makefile directory, default is every one")
+
+    submit_parser = subparsers.add_parser("submit", help="submits a job and waits for its result")
+    submit_parser.add_argument("--job-dir", default="jobs", help="job directory")
+    submit_parser.add_argument("--testbench", required=True, help="testbench name")
+    submit_parser.add_argument("--seed", type=int, help="random seed, default is a random one")
+    submit_parser.add_argument("--testcase", help="comma separated tests to run, default is every test")
+    submit_parser.add_argument("--waves", action="store_true", help="dumps the waveforms into the job results")
+    submit_parser.add_argument("--waves-on-failure", action="store_true", help="reruns the first failed test, dumping its wave policy signals only around "
+                                                                                "the failure")
+    submit_parser.add_argument("--job-id", help="job identifier, default is a unique one")
+    submit_parser.add_argument("--no-wait", action="store_true", help="returns right after submitting the job")
+    submit_parser.add_argument("--timeout", type=float, help="maximum waiting time, in seconds")
+
+    args = parser.parse_args()
+
+    # Serves the job directory, stopping after the running jobs on SIGINT or SIGTERM (docker stop)
+    if args.command == "serve":
+
+        if args.testbench:
+            testbenches = dict(testbench.split("=", 1) for testbench in args.testbench)
+            testbenches = {name: os.path.abspath(directory) for name, directory in testbenches.items()}
+        else:
+            testbenches = {name: os.path.join(REPOSITORY_DIR, directory) for name, directory in TESTBENCHES.items()}
+
+        worker = sim_worker(args.job_dir, testbenches, args.simulator, args.workers)
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signal_number, lambda *_: worker.stopping.set())
+
+        worker.serve()
+        return 0
+
+    # Submits the job and prints its result
+    job_id = submit_job(args.job_dir, args.testbench, args.seed, args.testcase, args.waves, args.job_id, args.waves_on_failure)
+    print("Submitted job %s" % job_id)
+
+    if args.no_wait:
+        return 0
+
+    summary = wait_job(args.job_dir, job_id, args.timeout)
+    if summary is None:
+        print("Job %s did not finish in %.0f s" % (job_id, args.timeout))
+        return 1
+
+    print("Job %s: %s seed %i %s, %i/%i tests passed%s" % (job_id, summary["testbench"], summary["seed"], "PASS" if summary["passed"] else "FAIL",
+                                                           summary["tests"] - summary["failures"], summary["tests"],
+                                                           "" if "error" not in summary else " (%s)" % summary["error"]))
+    for path in [summary.get("log_file")] + summary.get("wave_files", []):
+        if path:
+            print("  %s" % path)
+
+    # Returns 1 if the job failed
+    return 0 if summary["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+##########################################################################################################################################################################
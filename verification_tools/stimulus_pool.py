@@ -0,0 +1,201 @@
+##########################################################################################################################################################################
+# stimulus_pool.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the stimulus pools of the testbenches. A pool draws blocks of values from a NumPy Generator in one vectorized call, from a ranged,
+# weighted or weighted-range distribution, and hands them out one by one (next) or as arrays (take), so the random number generation is out of the loops of the
+# sequences and stimulus functions.
+# Every pool is seeded from the cocotb RANDOM_SEED (or the RANDOM_SEED environment variable, outside cocotb) and from its name, so the pools of a testbench are
+# independent streams, the same seed reproduces all of them, and the seed is logged when the first pool is created.
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import logging
+import os
+import random
+import zlib
+import numpy as np
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant for the default number of values drawn in every block
+STIMULUS_BLOCK_SIZE = 65536
+
+## Constant for the logger of the seed, under the cocotb logger so it is printed with the simulation time during the simulations
+STIMULUS_LOGGER = logging.getLogger("cocotb.stimulus_pool")
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Important global variables
+
+stimulus_seed_value = None
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Seed functions
+
+def stimulus_seed(logger=STIMULUS_LOGGER.info):
+# Description: this function obtains the seed shared by the stimulus pools: the cocotb RANDOM_SEED, the RANDOM_SEED environment variable outside cocotb, or a
+# random one. It is logged on the first call.
+# Parameters: logger: function logging the seed, default is the info of the stimulus pool logger.
+# Returns: The seed, as an integer.
+
+    global stimulus_seed_value
+
+    if stimulus_seed_value is None:
+
+        # Obtains the seed of the simulation, if any
+        try:
+            import cocotb
+            seed = getattr(cocotb, "RANDOM_SEED", None)
+        except ImportError:
+            seed = None
+
+        if seed is None:
+            seed = int(os.environ["RANDOM_SEED"]) if os.getenv("RANDOM_SEED") else random.SystemRandom().getrandbits(32)
+
+        stimulus_seed_value = int(seed)
+        logger("The stimulus pools are seeded with RANDOM_SEED=%i" % stimulus_seed_value)
+
+    return stimulus_seed_value
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Stimulus pool class
+
+class stimulus_pool:
+# Description: this class contains a stimulus pool: a block of values drawn at once from a distribution, handed out in order and redrawn when it runs out.
+# The distribution is given by exactly one of: low and high, for uniform integers in [low, high]; values and weights, for weighted values; ranges, a list of
+# ((minimum, maximum), weight) ranges, for a weighted range and a uniform integer inside it.
+
+    def __init__(self, name, low=None, high=None, values=None, weights=None, ranges=None, dtype=np.int64, block_size=STIMULUS_BLOCK_SIZE, seed=None):
+    # Description: this function initializes the generator of the pool and draws its first block.
+    # Parameters: name: pool name, unique in the testbench, which selects its stream; low, high, values, weights, ranges: the distribution; dtype: type of the
+    # values; block_size: number of values drawn in every block; seed: seed of the pool, default is stimulus_seed().
+    # Returns: None.
+
+        self.name = name
+        self.dtype = dtype
+        self.block_size = block_size
+        self.seed = stimulus_seed() if seed is None else seed
+        self.generator = np.random.default_rng([self.seed, zlib.crc32(name.encode())])
+
+        # Obtains the draw function of the distribution
+        if ranges is not None:
+            self.minimums = np.array([minimum for (minimum, _), _ in ranges])
+            self.maximums = np.array([maximum for (_, maximum), _ in ranges])
+            self.probabilities = self.__probabilities([weight for _, weight in ranges])
+            self.draw = self.__draw_ranges
+        elif values is not None:
+            self.values = np.asarray(values, dtype=dtype)
+            self.probabilities = self.__probabilities(weights if weights is not None else [1] * len(self.values))
+            self.draw = self.__draw_values
+        else:
+            assert low is not None and high is not None and low <= high, "The stimulus pool %s needs low <= high, values or ranges" % name
+            self.low, self.high = low, high
+            self.draw = self.__draw_uniform
+
+        # Draws the first block
+        self.__refill()
+
+
+    def next(self):
+    # Description: this function hands out the next value of the pool.
+    # Parameters: None.
+    # Returns: The value, as a Python integer.
+
+        if self.index == len(self.block):
+            self.__refill()
+
+        # Converts the block into Python integers on the first value handed out one by one
+        if self.buffer is None:
+            self.buffer = self.block.tolist()
+
+        value = self.buffer[self.index]
+        self.index += 1
+
+        return value
+
+
+    def take(self, count):
+    # Description: this function hands out the next values of the pool at once.
+    # Parameters: count: number of values.
+    # Returns: A NumPy array with the values.
+
+        values = np.empty(count, dtype=self.dtype)
+        filled = 0
+
+        # Copies the remaining values of the block, redrawing it while more are needed
+        while filled < count:
+
+            if self.index == len(self.block):
+                self.__refill()
+
+            length = min(count - filled, len(self.block) - self.index)
+            values[filled:filled + length] = self.block[self.index:self.index + length]
+            self.index += length
+            filled += length
+
+        return values
+
+
+    def __refill(self):
+    # Description: this function draws a new block of values.
+    # Parameters: None.
+    # Returns: None.
+
+        self.block = self.draw(self.block_size)
+        self.buffer = None
+        self.index = 0
+
+
+    @staticmethod
+    def __probabilities(weights):
+    # Description: this function normalizes the weights of a distribution.
+    # Parameters: weights: the weights.
+    # Returns: A NumPy array with the probabilities.
+
+        weights = np.asarray(weights, dtype=np.float64)
+        assert len(weights) and (weights >= 0).all() and weights.sum() > 0, "The weights of a stimulus pool must be non-negative, with a positive sum"
+
+        return weights / weights.sum()
+
+
+    def __draw_uniform(self, size):
+    # Description: this function draws uniform integers in [low, high].
+    # Parameters: size: number of values.
+    # Returns: A NumPy array with the values.
+
+        return self.generator.integers(self.low, self.high, size, dtype=self.dtype, endpoint=True)
+
+
+    def __draw_values(self, size):
+    # Description: this function draws weighted values.
+    # Parameters: size: number of values.
+    # Returns: A NumPy array with the values.
+
+        return self.values[self.generator.choice(len(self.values), size, p=self.probabilities)]
+
+
+    def __draw_ranges(self, size):
+    # Description: this function draws a weighted range and a uniform integer inside it, for every value.
+    # Parameters: size: number of values.
+    # Returns: A NumPy array with the values.
+
+        indexes = self.generator.choice(len(self.probabilities), size, p=self.probabilities)
+        return self.generator.integers(self.minimums[indexes], self.maximums[indexes], endpoint=True).astype(self.dtype)
+
+##########################################################################################################################################################################
@@ -0,0 +1,71 @@
+##########################################################################################################################################################################
+# test_build_cache.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the unit tests of the build cache key: an unchanged design hits its build, and any change of the sources, of their order, of the
+# simulator version or of the flags misses it.
+# python3 -m pytest verification_tools
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import pytest
+from verification_tools.build_cache import KEY_LENGTH, build_cache_key
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Fixtures
+
+@pytest.fixture
+def sources(tmp_path):
+# Description: this function writes the VHDL sources of the tests.
+# Parameters: tmp_path: the pytest temporary directory.
+# Returns: A list with the paths to the sources, in analysis order.
+
+    paths = []
+    for name in ("package.vhd", "design.vhd"):
+        path = tmp_path / name
+        path.write_text("-- %s\n" % name)
+        paths.append(str(path))
+
+    return paths
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Tests
+
+def test_cache_hit(sources):
+# Description: this function tests that the key of an unchanged design is stable, whatever the whitespace of the flags.
+# Parameters: sources: the sources fixture.
+# Returns: None.
+
+    key = build_cache_key(sources, "nvc 1.13", "--std=08  -L lib")
+
+    assert len(key) == KEY_LENGTH and int(key, 16) >= 0, "The key should have %i hexadecimal digits, and is %s" % (KEY_LENGTH, key)
+    assert key == build_cache_key(sources, "nvc 1.13", " --std=08 -L lib "), "An unchanged design should have the same key"
+
+
+def test_cache_miss(sources):
+# Description: this function tests that changing the contents or the order of the sources, the simulator version or the flags changes the key.
+# Parameters: sources: the sources fixture.
+# Returns: None.
+
+    key = build_cache_key(sources, "nvc 1.13", "--std=08")
+
+    assert key != build_cache_key(sources[::-1], "nvc 1.13", "--std=08"), "Reordering the sources should change the key"
+    assert key != build_cache_key(sources, "nvc 1.14", "--std=08"), "Another simulator version should change the key"
+    assert key != build_cache_key(sources, "nvc 1.13", "--std=93"), "Other flags should change the key"
+
+    # Edits a source
+    with open(sources[1], "a") as source_file:
+        source_file.write("-- edited\n")
+
+    assert key != build_cache_key(sources, "nvc 1.13", "--std=08"), "Editing a source should change the key"
+
+##########################################################################################################################################################################
@@ -0,0 +1,94 @@
+##########################################################################################################################################################################
+# test_coverage.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the unit tests of the functional coverage: the sampling of a covergroup, the round trip of its counters through a coverage file and
+# the merge of the files of several runs.
+# python3 -m pytest verification_tools
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import numpy as np
+import pytest
+from verification_tools.coverage import covergroup, covergroups_coverage, find_coverage_files, load_coverage, merge_coverage, save_coverage
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant for the axes of the covergroup of the tests
+TEST_AXES = [("data", 4), ("reset", 2)]
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Tests
+
+def test_sample():
+# Description: this function tests that sampling a bin counts it, and that the covered bins are kept by sample and sample_array.
+# Parameters: None.
+# Returns: None.
+
+    group = covergroup("test", TEST_AXES)
+    group.sample(1, 0)
+    group.sample(1, 0)
+    group.sample(3, 1)
+
+    assert group.counts[1, 0] == 2 and group.counts[3, 1] == 1, "The counters should be 2 and 1, and are %i and %i" % (group.counts[1, 0], group.counts[3, 1])
+    assert group.covered == 2 and not group.closed, "2 of the 8 bins should be covered, and %i are" % group.covered
+    assert group.hit(3, 1) and not group.hit(0, 0), "Only the sampled bins should be hit"
+    assert group.axis_holes(0) == [0, 2], "The data bins 0 and 2 should be the holes of its axis, and %s are" % group.axis_holes(0)
+
+    # Samples every bin at once
+    group.sample_array(np.repeat(np.arange(4), 2), np.tile(np.arange(2), 4))
+
+    assert group.closed and not group.holes(), "Every bin should be covered, and %s are not" % group.holes()
+
+
+def test_save_load(tmp_path):
+# Description: this function tests that the counters and the axes names of covergroups are read back as written.
+# Parameters: tmp_path: the pytest temporary directory.
+# Returns: None.
+
+    group = covergroup("test", TEST_AXES)
+    group.sample(2, 1)
+    path = str(tmp_path / "coverage" / "test.npz")
+
+    save_coverage(covergroups_coverage([group]), path)
+    axes, counts = load_coverage(path)["test"]
+
+    assert axes == ["data", "reset"], "The axes should be read back as data and reset, and are %s" % axes
+    assert np.array_equal(counts, group.counts), "The counters should be read back as written"
+
+
+def test_merge(tmp_path):
+# Description: this function tests that merging coverage files adds their counters, and rejects a covergroup with other bins.
+# Parameters: tmp_path: the pytest temporary directory.
+# Returns: None.
+
+    # Writes the coverage of two runs, with a common bin
+    paths = []
+    for run, bins in enumerate([[(0, 0), (1, 1)], [(1, 1), (3, 0)]]):
+        group = covergroup("test", TEST_AXES)
+        for index in bins:
+            group.sample(*index)
+        paths.append(str(tmp_path / ("run_%i" % run) / "test.npz"))
+        save_coverage(covergroups_coverage([group]), paths[-1])
+
+    axes, counts = merge_coverage(find_coverage_files([str(tmp_path)]))["test"]
+
+    assert counts.dtype == np.uint64, "The merged counters should be uint64, and are %s" % counts.dtype
+    assert counts[0, 0] == 1 and counts[1, 1] == 2 and counts[3, 0] == 1 and counts.sum() == 4, "The merged counters should add the ones of the runs"
+
+    # A covergroup with other bins cannot be merged
+    save_coverage(covergroups_coverage([covergroup("test", [("data", 8)])]), str(tmp_path / "other.npz"))
+    with pytest.raises(AssertionError):
+        merge_coverage(paths + [str(tmp_path / "other.npz")])
+
+##########################################################################################################################################################################
@@ -0,0 +1,115 @@
+##########################################################################################################################################################################
+# test_run_ledger.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the unit tests of the run ledger: the runs of a results file, their recording, and the detection of sudden and gradual throughput
+# regressions.
+# python3 -m pytest verification_tools
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+from verification_tools.run_ledger import least_squares_slope, open_ledger, record_runs, regression_report, results_file_runs, throughput_regressions
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant for the results file of the tests, as written by cocotb
+TEST_RESULTS = """<testsuites name="results">
+  <testsuite name="all" package="all">
+    <testcase name="passed_test" classname="testbench" file="testbench.py" lineno="1" time="2.0" sim_time_ns="20000.0" ratio_time="10000.0" />
+    <testcase name="failed_test" classname="testbench" file="testbench.py" lineno="2" time="1.0" sim_time_ns="500.0" ratio_time="500.0">
+      <failure />
+    </testcase>
+    <testcase name="skipped_test" classname="testbench" file="testbench.py" lineno="3" time="0.0" sim_time_ns="0.0" ratio_time="0.0">
+      <skipped />
+    </testcase>
+  </testsuite>
+</testsuites>
+"""
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Functions
+
+def throughput_runs(values):
+# Description: this function builds passed runs of a single test with given throughputs.
+# Parameters: values: the cycles per second of every run, oldest first.
+# Returns: A list of dictionaries with the RUN_COLUMNS of every run.
+
+    return [{"testbench": "crc16citt", "simulator": "nvc", "seed": seed, "test": "test", "wall_time": 1.0, "sim_time_ns": value * 10.0,
+             "cycles_per_second": value, "passed": True} for seed, value in enumerate(values)]
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Tests
+
+def test_record(tmp_path):
+# Description: this function tests that the runs of a results file are recorded, without the skipped tests.
+# Parameters: tmp_path: the pytest temporary directory.
+# Returns: None.
+
+    results_file = tmp_path / "results.xml"
+    results_file.write_text(TEST_RESULTS)
+    ledger = str(tmp_path / "ledger" / "runs.sqlite")
+
+    runs = results_file_runs(str(results_file), "crc16citt", "nvc", 5)
+    assert record_runs(ledger, runs, source="test", revision="abc1234") == 2, "The skipped test should not be recorded"
+
+    with open_ledger(ledger) as connection:
+        rows = {row["test"]: row for row in connection.execute("SELECT * FROM runs")}
+
+    assert set(rows) == {"passed_test", "failed_test"}, "The passed and failed tests should be recorded, and %s are" % sorted(rows)
+    assert rows["passed_test"]["passed"] and not rows["failed_test"]["passed"], "The status of the tests should be recorded"
+    assert rows["passed_test"]["cycles_per_second"] == 1000.0, "20000 ns at 10 ns in 2 s should be 1000 cycles/s, and is %s" % rows["passed_test"]["cycles_per_second"]
+    assert rows["passed_test"]["revision"] == "abc1234" and rows["passed_test"]["seed"] == 5, "The revision and the seed should be recorded"
+
+
+def test_stable_throughput(tmp_path):
+# Description: this function tests that a noisy but stable throughput is not flagged.
+# Parameters: tmp_path: the pytest temporary directory.
+# Returns: None.
+
+    ledger = str(tmp_path / "runs.sqlite")
+    record_runs(ledger, throughput_runs([1000, 1010, 990, 1005, 995, 1000, 1010, 990, 1000, 1005, 995]), revision="abc1234")
+
+    assert not throughput_regressions(ledger), "A stable throughput should not be flagged"
+
+
+def test_sudden_slowdown(tmp_path):
+# Description: this function tests that a last run far below the previous ones is flagged as a sudden slowdown.
+# Parameters: tmp_path: the pytest temporary directory.
+# Returns: None.
+
+    ledger = str(tmp_path / "runs.sqlite")
+    record_runs(ledger, throughput_runs([1000, 1010, 990, 1005, 995, 1000, 1010, 990, 1000, 1005, 700]), revision="abc1234")
+    regressions = throughput_regressions(ledger)
+
+    assert [regression["kind"] for regression in regressions] == ["drop"], "The last run should be flagged as a sudden slowdown"
+    assert "sudden slowdown of 30.0%" in regression_report(regressions)[0], "The report should give the slowdown: %s" % regression_report(regressions)[0]
+
+
+def test_gradual_slowdown(tmp_path):
+# Description: this function tests that a steady decrease of the throughput, each run within the noise of the previous ones, is flagged as a gradual slowdown.
+# Parameters: tmp_path: the pytest temporary directory.
+# Returns: None.
+
+    ledger = str(tmp_path / "runs.sqlite")
+    record_runs(ledger, throughput_runs([1000, 985, 975, 955, 945, 925, 915, 895, 885, 865, 855]), revision="abc1234")
+    regressions = throughput_regressions(ledger)
+
+    assert [regression["kind"] for regression in regressions] == ["trend"], "The decreasing runs should be flagged as a gradual slowdown"
+
+    slope, error = least_squares_slope([1.0, 2.0, 3.0])
+    assert slope == 1.0 and error == 0.0, "An exact line should have its slope and no error, and has %s and %s" % (slope, error)
+
+##########################################################################################################################################################################
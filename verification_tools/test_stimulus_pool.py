@@ -0,0 +1,73 @@
+##########################################################################################################################################################################
+# test_stimulus_pool.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the unit tests of the stimulus pools: the same seed and name reproduce the same values, handed out one by one or as arrays, another
+# name draws another stream, and every distribution stays inside its bounds.
+# python3 -m pytest verification_tools
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import numpy as np
+from verification_tools.stimulus_pool import stimulus_pool
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constants for the seed, the block size (small, so the tests redraw blocks) and the number of values of the tests
+TEST_SEED = 1234
+TEST_BLOCK_SIZE = 16
+TEST_COUNT = 100
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Tests
+
+def test_repeatability():
+# Description: this function tests that two pools with the same seed and name hand out the same values, across several blocks, whether they are taken one by
+# one or as an array.
+# Parameters: None.
+# Returns: None.
+
+    first = stimulus_pool("data", 0, 255, block_size=TEST_BLOCK_SIZE, seed=TEST_SEED)
+    second = stimulus_pool("data", 0, 255, block_size=TEST_BLOCK_SIZE, seed=TEST_SEED)
+
+    values = [first.next() for _ in range(TEST_COUNT)]
+
+    assert all(isinstance(value, int) for value in values), "next should hand out Python integers"
+    assert values == second.take(TEST_COUNT).tolist(), "The same seed and name should reproduce the same values"
+
+
+def test_independent_streams():
+# Description: this function tests that the name and the seed select the stream of a pool.
+# Parameters: None.
+# Returns: None.
+
+    values = stimulus_pool("data", 0, 255, seed=TEST_SEED).take(TEST_COUNT)
+
+    assert not np.array_equal(values, stimulus_pool("enable", 0, 255, seed=TEST_SEED).take(TEST_COUNT)), "Another name should draw another stream"
+    assert not np.array_equal(values, stimulus_pool("data", 0, 255, seed=TEST_SEED + 1).take(TEST_COUNT)), "Another seed should draw another stream"
+
+
+def test_distributions():
+# Description: this function tests that the uniform, weighted and weighted-range distributions only draw their values.
+# Parameters: None.
+# Returns: None.
+
+    uniform = stimulus_pool("uniform", 3, 5, block_size=TEST_BLOCK_SIZE, seed=TEST_SEED).take(TEST_COUNT)
+    weighted = stimulus_pool("weighted", values=[7, 9], weights=[1, 0], block_size=TEST_BLOCK_SIZE, seed=TEST_SEED).take(TEST_COUNT)
+    ranged = stimulus_pool("ranged", ranges=[((0, 1), 1), ((100, 101), 1)], block_size=TEST_BLOCK_SIZE, seed=TEST_SEED).take(TEST_COUNT)
+
+    assert set(uniform.tolist()) == {3, 4, 5}, "The uniform pool should draw every value of [3, 5], and draws %s" % set(uniform.tolist())
+    assert set(weighted.tolist()) == {7}, "The weighted pool should never draw a value of weight 0, and draws %s" % set(weighted.tolist())
+    assert set(ranged.tolist()) == {0, 1, 100, 101}, "The ranged pool should draw every value of its ranges, and draws %s" % set(ranged.tolist())
+
+##########################################################################################################################################################################
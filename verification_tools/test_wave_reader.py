@@ -0,0 +1,258 @@
+##########################################################################################################################################################################
+# test_wave_reader.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the unit tests of the waveform readers, which parse a short VCD file and a short FST file (plain and gzip-wrapped) written by the
+# tests. The FST file is built block by block as the FST writer lays it out (header, value changes, geometry, hierarchy), with a zlib compressed chain and
+# geometry, a raw chain, a handle without changes and an alias, so no simulator is needed.
+# python3 -m pytest verification_tools
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import gzip
+import struct
+import zlib
+import pytest
+from verification_tools.wave_reader import FST_BL_GEOM, FST_BL_HDR, FST_BL_HIER, FST_BL_VCDATA_DYN_ALIAS2, FST_BL_ZWRAPPER, FST_ST_GEN_ATTRBEGIN, \
+    FST_ST_GEN_ATTREND, FST_ST_VCD_SCOPE, FST_ST_VCD_UPSCOPE, fst_reader, open_wave, read_svarint, read_varint, signal_name, vcd_reader
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant for the VCD file of the tests, as written by GHDL: a clock, a vector and a signal of a nested scope
+TEST_VCD = """$date
+  Sat Oct 18 12:00:00 2026
+$end
+$timescale
+  1 ns
+$end
+$scope module contador $end
+$var reg 1 ! clk $end
+$var reg 4 " count[3:0] $end
+$scope module inner $end
+$var reg 1 # Flag $end
+$upscope $end
+$upscope $end
+$enddefinitions $end
+#0
+$dumpvars
+0!
+b0000 "
+U#
+$end
+#5
+1!
+b0001 "
+#10
+0!
+bXXXX "
+1#
+"""
+
+## Constant for the steps of the VCD file
+TEST_VCD_STEPS = [(0, [("clk", "0"), ("count", "0000"), ("inner.flag", "x")]), (5, [("clk", "1"), ("count", "0001")]),
+                  (10, [("clk", "0"), ("count", "xxxx"), ("inner.flag", "1")])]
+
+## Constant for the steps of the FST file, whose count_alias shares the handle of count and whose enable never changes
+TEST_FST_STEPS = [(0, [("clk", "0"), ("count", "0000"), ("count_alias", "0000"), ("enable", "1")]), (5, [("clk", "1"), ("count", "0001"), ("count_alias", "0001")]),
+                  (10, [("clk", "0"), ("count", "xxxx"), ("count_alias", "xxxx")])]
+
+## Constant for the FST variable type of the signals (a VCD wire)
+FST_VT_VCD_WIRE = 16
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Functions
+
+def fst_varint(value):
+# Description: this function writes an unsigned LEB128 integer.
+# Parameters: value: the integer.
+# Returns: The bytes of the integer.
+
+    data = bytearray()
+    while value >= 0x80:
+        data.append(value & 0x7F | 0x80)
+        value >>= 7
+
+    return bytes(data + bytes([value]))
+
+
+def fst_svarint(value):
+# Description: this function writes a signed LEB128 integer.
+# Parameters: value: the integer.
+# Returns: The bytes of the integer.
+
+    data = bytearray()
+    while not (-0x40 <= value < 0x40):
+        data.append(value & 0x7F | 0x80)
+        value >>= 7
+
+    return bytes(data + bytes([value & 0x7F]))
+
+
+def fst_block(block_type, section):
+# Description: this function writes an FST block, whose section starts with its length.
+# Parameters: block_type: the block type; section: the section, without its length.
+# Returns: The bytes of the block.
+
+    return bytes([block_type]) + struct.pack(">Q", 8 + len(section)) + section
+
+
+def fst_file():
+# Description: this function builds the FST file of the tests, with the TEST_FST_STEPS at times 0, 5 and 10 ns.
+# Parameters: None.
+# Returns: The bytes of the file.
+
+    # Header: start and end times, endianness, memory, scope, variable, handle and value change block counts, time scale, version, date, file type and time zero
+    header = struct.pack(">QQdQQQQQb", 0, 10, 2.718281828459045, 0, 1, 4, 3, 1, -9) + bytes(128) + bytes(119) + struct.pack(">Bq", 0, 0)
+
+    # Value changes: the frame of the handles 1 (clk), 2 (count) and 3 (enable), a raw chain for clk and a zlib compressed chain for count
+    frame = b"0" + b"0000" + b"1"
+    clk_chain = fst_varint(0) + fst_varint(1 << 2 | 1 << 1) + fst_varint(1 << 2)
+    count_changes = fst_varint(1 << 1) + bytes([0b00010000]) + fst_varint(1 << 1 | 1) + b"XXXX"
+    count_chain = fst_varint(len(count_changes)) + zlib.compress(count_changes)
+    chains = b"Z" + clk_chain + count_chain
+
+    # Position table: the chains of the handles 1 and 2, relative to the pack type, then a run of one handle without changes
+    table = fst_svarint(1 << 1 | 1) + fst_svarint(len(clk_chain) << 1 | 1) + fst_varint(1 << 1)
+    times = fst_varint(0) + fst_varint(5) + fst_varint(5)
+
+    value_changes = (struct.pack(">QQQ", 0, 10, 0) + fst_varint(len(frame)) + fst_varint(len(frame)) + fst_varint(3) + frame + fst_varint(3) + chains + table
+                     + struct.pack(">Q", len(table)) + times + struct.pack(">QQQ", len(times), len(times), 3))
+
+    # Geometry: the lengths of the handles, zlib compressed
+    lengths = fst_varint(1) + fst_varint(4) + fst_varint(1)
+    geometry = struct.pack(">QQ", len(lengths), 3) + zlib.compress(lengths)
+
+    # Hierarchy: the toplevel scope, an attribute and the variables (direction, name, length and alias), count_alias being an alias of count
+    hierarchy = bytes([FST_ST_VCD_SCOPE, 0]) + b"contador\0\0" + bytes([FST_ST_GEN_ATTRBEGIN, 0, 0]) + b"comment\0" + fst_varint(0) + bytes([FST_ST_GEN_ATTREND])
+    for name, length, alias in (("clk", 1, 0), ("count[3:0]", 4, 0), ("count_alias[3:0]", 4, 2), ("Enable", 1, 0)):
+        hierarchy += bytes([FST_VT_VCD_WIRE, 0]) + name.encode() + b"\0" + fst_varint(length) + fst_varint(alias)
+    hierarchy += bytes([FST_ST_VCD_UPSCOPE])
+
+    return (fst_block(FST_BL_HDR, header) + fst_block(FST_BL_VCDATA_DYN_ALIAS2, value_changes) + fst_block(FST_BL_GEOM, geometry)
+            + fst_block(FST_BL_HIER, struct.pack(">Q", len(hierarchy)) + gzip.compress(hierarchy)))
+
+
+def read_steps(reader):
+# Description: this function reads every step of a reader, with the changes of every step sorted by signal name.
+# Parameters: reader: the reader.
+# Returns: A list of (time, changes) tuples.
+
+    steps = [(time, sorted(changes)) for time, changes in reader.steps()]
+    reader.close()
+
+    return steps
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Fixtures
+
+@pytest.fixture
+def vcd_path(tmp_path):
+# Description: this function writes the VCD file of the tests.
+# Parameters: tmp_path: the pytest temporary directory.
+# Returns: The path to the file.
+
+    path = tmp_path / "simulation.vcd"
+    path.write_text(TEST_VCD)
+
+    return str(path)
+
+
+@pytest.fixture(params=["plain", "gzip"])
+def fst_path(request, tmp_path):
+# Description: this function writes the FST file of the tests, as is or wrapped in gzip as nvc may write it.
+# Parameters: request: the pytest request, whose param selects the wrapping; tmp_path: the pytest temporary directory.
+# Returns: The path to the file.
+
+    data = fst_file()
+    if request.param == "gzip":
+        data = fst_block(FST_BL_ZWRAPPER, struct.pack(">Q", len(data)) + gzip.compress(data))
+
+    path = tmp_path / "simulation.ghw"
+    path.write_bytes(data)
+
+    return str(path)
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Tests
+
+def test_helpers():
+# Description: this function tests the signal names and the LEB128 integers.
+# Parameters: None.
+# Returns: None.
+
+    assert signal_name("Count[3:0]") == "count", "The range of a vector should be removed from its name, in lower case"
+
+    for value in (0, 1, 63, 64, 127, 128, 300, 1 << 40):
+        assert read_varint(fst_varint(value), 0) == (value, len(fst_varint(value))), "The unsigned integer %i should be read back" % value
+    for value in (0, 1, -1, 63, -64, 64, -65, 1000, -1000):
+        assert read_svarint(fst_svarint(value), 0) == (value, len(fst_svarint(value))), "The signed integer %i should be read back" % value
+
+
+def test_vcd(vcd_path):
+# Description: this function tests the parsing of the VCD file: its scope, signals, time unit and value changes.
+# Parameters: vcd_path: the VCD file fixture.
+# Returns: None.
+
+    reader = open_wave(vcd_path)
+
+    assert isinstance(reader, vcd_reader), "A VCD file should be opened by the VCD reader"
+    assert reader.scope == "contador", "The scope should be contador, and is %s" % reader.scope
+    assert reader.signals == ["clk", "count", "inner.flag"], "The signals should be relative to the toplevel, and are %s" % reader.signals
+    assert reader.time_unit == pytest.approx(1e-9), "The time unit should be 1 ns, and is %s" % reader.time_unit
+    assert read_steps(reader) == TEST_VCD_STEPS, "The steps of the VCD file should be decoded"
+
+
+def test_vcd_selection(vcd_path):
+# Description: this function tests that only the requested signals of the VCD file are decoded, given when it is opened or selected afterwards.
+# Parameters: vcd_path: the VCD file fixture.
+# Returns: None.
+
+    reader = open_wave(vcd_path, ["clk", "count"])
+    reader.select(["count"])
+
+    assert reader.signals == ["count"], "Only count should be selected, and %s are" % reader.signals
+    assert read_steps(reader) == [(time, [(name, value) for name, value in changes if name == "count"]) for time, changes in TEST_VCD_STEPS]
+
+
+def test_fst(fst_path):
+# Description: this function tests the parsing of the FST file: its scope, signals, time unit and value changes.
+# Parameters: fst_path: the FST file fixture.
+# Returns: None.
+
+    reader = open_wave(fst_path)
+
+    assert isinstance(reader, fst_reader), "An FST file should be opened by the FST reader, whatever its extension"
+    assert reader.scope == "contador", "The scope should be contador, and is %s" % reader.scope
+    assert reader.signals == ["clk", "count", "count_alias", "enable"], "The signals should be relative to the toplevel, and are %s" % reader.signals
+    assert reader.time_unit == pytest.approx(1e-9), "The time unit should be 1 ns, and is %s" % reader.time_unit
+    assert read_steps(reader) == TEST_FST_STEPS, "The steps of the FST file should be decoded"
+
+
+def test_fst_selection(fst_path):
+# Description: this function tests that only the requested signals of the FST file are decoded.
+# Parameters: fst_path: the FST file fixture.
+# Returns: None.
+
+    reader = open_wave(fst_path)
+    reader.select(["clk", "enable"])
+
+    assert reader.signals == ["clk", "enable"], "Only clk and enable should be selected, and %s are" % reader.signals
+    assert read_steps(reader) == [(time, [(name, value) for name, value in changes if name in ("clk", "enable")]) for time, changes in TEST_FST_STEPS]
+
+##########################################################################################################################################################################
@@ -0,0 +1,107 @@
+##########################################################################################################################################################################
+# testcase_names.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the resolution of the test names given in TESTCASE. cocotb looks every name up as an attribute of the testbench module, but pyuvm
+# binds its tests under test_<id>, leaving the class under its own name, while results.xml names them after the class: bind_test_classes, called at the end of
+# the pyuvm testbench modules, binds the tests requested by TESTCASE under their class names, so the names of results.xml can be rerun. module_tests lists the
+# tests of a testbench without the simulator, so the runners reject an unknown name before running it.
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import ast
+import inspect
+import os
+import re
+import cocotb
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant for the name of the decorators declaring a test (cocotb.test and pyuvm.test)
+TEST_DECORATOR = "test"
+
+## Constant for the pattern of the MODULE assignment of the testbench Makefiles
+MAKEFILE_MODULE = re.compile(r"^MODULE\s*[:?]?=\s*(\S+)", re.MULTILINE)
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Test name functions
+
+def requested_tests():
+# Description: this function obtains the tests requested by TESTCASE.
+# Parameters: None.
+# Returns: A list with the test names, empty if every test runs.
+
+    return [name.strip() for name in os.getenv("TESTCASE", "").split(",") if name.strip()]
+
+
+def bind_test_classes(namespace):
+# Description: this function binds the pyuvm tests requested by TESTCASE under their class names in a testbench module, replacing the classes. It must be called
+# after the last test class of the module, so the subclasses of the tests are already defined.
+# Parameters: namespace: the globals() of the testbench module.
+# Returns: None.
+
+    requested = requested_tests()
+
+    # pyuvm wraps every test class into a cocotb test, with the class as the wrapped function
+    for value in list(namespace.values()):
+        if isinstance(value, cocotb.test):
+            test_class = getattr(value._func, "__wrapped__", None)
+            if inspect.isclass(test_class) and test_class.__name__ in requested and namespace.get(test_class.__name__) is test_class:
+                namespace[test_class.__name__] = value
+
+
+def module_tests(testbench_dir, modules):
+# Description: this function lists the tests of testbench modules by parsing their sources, the functions and classes decorated by cocotb.test or pyuvm.test.
+# Parameters: testbench_dir: the Makefile directory; modules: comma separated testbench modules, as MODULE.
+# Returns: A list with the test names, in definition order.
+
+    tests = []
+
+    for module in modules.split(","):
+
+        with open(os.path.join(testbench_dir, module.strip().replace(".", os.sep) + ".py")) as module_file:
+            tree = ast.parse(module_file.read())
+
+        # Keeps the top level definitions with a test decorator, called or not
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                for decorator in node.decorator_list:
+                    decorator = decorator.func if isinstance(decorator, ast.Call) else decorator
+                    if getattr(decorator, "attr", getattr(decorator, "id", None)) == TEST_DECORATOR:
+                        tests.append(node.name)
+
+    return tests
+
+
+def makefile_module(testbench_dir):
+# Description: this function obtains the MODULE of a testbench Makefile.
+# Parameters: testbench_dir: the Makefile directory.
+# Returns: The MODULE value, or None if the Makefile does not assign it.
+
+    with open(os.path.join(testbench_dir, "Makefile")) as makefile:
+        match = MAKEFILE_MODULE.search(makefile.read())
+
+    return match.group(1) if match else None
+
+
+def unknown_tests(testcase, testbench_dir, modules=None):
+# Description: this function finds the names of a TESTCASE value which are not tests of a testbench.
+# Parameters: testcase: comma separated test names; testbench_dir: the Makefile directory; modules: comma separated testbench modules, default is the MODULE of
+# the Makefile.
+# Returns: A list with the unknown names, empty if every one is a test.
+
+    tests = module_tests(testbench_dir, modules or makefile_module(testbench_dir))
+
+    return [name.strip() for name in testcase.split(",") if name.strip() and name.strip() not in tests]
+
+##########################################################################################################################################################################
@@ -0,0 +1,245 @@
+##########################################################################################################################################################################
+# wave_policy.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the waveform policy of the testbenches. Instead of the simulator dumping every signal for the whole run, the testbench declares an
+# allow-list of signals (glob patterns of the toplevel signals) and a time window, and the policy writes only their value changes inside the window into a VCD
+# file, in any simulator and in the fast mode. It is enabled by WAVES=policy (the testbench Makefiles export it and drop the simulator waveform arguments).
+# The "dump only around the first failure" mode runs the test without waveforms and, when it fails, reruns the failed test with the same seed and a window
+# ending right after the failure: first_failure reads the failure time from the results file, and failure_window_environment builds the environment of the
+# rerun (see the --waves-on-failure option of the regression runner and of the simulation worker).
+# The window is relative to the start of every test, as the simulation time of the results file, so every test of a module dumps the same part of its run.
+# The allow-list and the window of the testbench are overridden by the WAVE_SIGNALS (comma separated), WAVE_START and WAVE_STOP (ns) environment variables,
+# and the files are written into WAVE_DIR.
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import atexit
+import fnmatch
+import os
+import time
+import xml.etree.ElementTree as ET
+import cocotb
+from cocotb.triggers import Edge, Timer
+from cocotb.utils import get_sim_time
+from verification_tools.wave_reader import VCD_VALUES
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant for the WAVES value enabling the policy (the Makefiles also accept "full", the simulator dump, and "off")
+POLICY_MODE = "policy"
+
+## Constants for the default window of the failure rerun, before and after the failure time
+FAILURE_WINDOW_BEFORE = 1000 # ns
+FAILURE_WINDOW_AFTER = 10 # ns
+
+## Constant for the first character of the VCD identifiers
+VCD_FIRST_IDENTIFIER = 33
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Failure window functions
+
+def first_failure(results_file):
+# Description: this function finds the first failed test of a results file.
+# Parameters: results_file: path to the JUnit results file written by cocotb.
+# Returns: A tuple with the test name and its simulation time, in ns since its start, at the failure, or None if no test failed.
+
+    try:
+        testcases = ET.parse(results_file).getroot().iter("testcase")
+        testcases = list(testcases)
+    except (OSError, ET.ParseError):
+        return None
+
+    # cocotb ends a test on its first failure, so its simulation time is the failure time
+    for testcase in testcases:
+        if testcase.find("failure") is not None or testcase.find("error") is not None:
+            return testcase.get("name"), float(testcase.get("sim_time_ns", 0))
+
+    return None
+
+
+def failure_window_environment(failure_time, wave_dir, before=FAILURE_WINDOW_BEFORE, after=FAILURE_WINDOW_AFTER):
+# Description: this function builds the environment of the rerun of a failed test, tracing only the window around the failure.
+# Parameters: failure_time: simulation time of the failure, in ns since the start of the test; wave_dir: directory of the waveform files; before, after: window around the failure, in ns.
+# Returns: A dictionary with the environment variables of the rerun.
+
+    return {"WAVES": POLICY_MODE, "WAVE_DIR": wave_dir, "WAVE_START": "%g" % max(0, failure_time - before), "WAVE_STOP": "%g" % (failure_time + after)}
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Wave policy class
+
+class wave_policy:
+# Description: this class contains the waveform policy of a test. It watches the allow-listed signals with a value change trigger each, only inside the window,
+# and writes their changes into a VCD file, buffered and closed at the end of the window or of the simulation.
+
+    def __init__(self, dut, signals, name, start=0, stop=None):
+    # Description: this function initializes the policy of a test.
+    # Parameters: dut: the toplevel handle; signals: glob patterns of the allow-listed toplevel signals; name: name of the VCD file, usually the test name;
+    # start, stop: window of the dump, in ns since the start of the test (the creation of the policy), stop None being the end of the simulation.
+    # Returns: None.
+
+        self.dut = dut
+        self.enabled = os.getenv("WAVES") == POLICY_MODE
+
+        # Obtains the allow-list and the window, overridden by the environment, and moves the window to the start of the test
+        test_start = get_sim_time("ns")
+        stop = float(os.environ["WAVE_STOP"]) if os.getenv("WAVE_STOP") else stop
+
+        self.signals = os.getenv("WAVE_SIGNALS").split(",") if os.getenv("WAVE_SIGNALS") else list(signals)
+        self.start_time = test_start + float(os.getenv("WAVE_START", start))
+        self.stop_time = None if stop is None else test_start + stop
+        self.file_name = os.path.join(os.getenv("WAVE_DIR", "."), name + ".vcd")
+
+        self.file = None
+        self.time = None
+        self.watchers = []
+
+
+    def handles(self):
+    # Description: this function obtains the toplevel signals matching the allow-list, skipping the ones without a logic value (such as enumerations).
+    # Parameters: None.
+    # Returns: A list of tuples with the name and the handle of every signal, in allow-list order.
+
+        handles = {handle._name: handle for handle in self.dut}
+        selected = []
+
+        for pattern in self.signals:
+            for name in sorted(fnmatch.filter(handles, pattern.strip())):
+                if name not in dict(selected) and hasattr(handles[name].value, "binstr"):
+                    selected.append((name, handles[name]))
+
+        return selected
+
+
+    def start(self):
+    # Description: this function starts the policy, if it is enabled.
+    # Parameters: None.
+    # Returns: None.
+
+        if self.enabled:
+            cocotb.start_soon(self.__run())
+
+
+    async def __run(self):
+    # Description: this function waits for the window, dumps the allow-listed signals inside it and closes the file at its end.
+    # Parameters: None.
+    # Returns: None.
+
+        # Waits for the start of the window
+        delay = self.start_time - get_sim_time("ns")
+        if delay > 0:
+            await Timer(delay, units="ns", round_mode="round")
+
+        # Writes the header and the values at the start of the window
+        self.__open()
+
+        # Watches every signal, until the end of the window
+        self.watchers = [cocotb.start_soon(self.__watch(handle, code)) for code, (_, handle) in zip(self.codes, self.selected)]
+
+        if self.stop_time is not None:
+
+            delay = self.stop_time - get_sim_time("ns")
+            if delay > 0:
+                await Timer(delay, units="ns", round_mode="round")
+
+            # Writes the end of the window and closes the file
+            self.file.write("#%i\n" % round(get_sim_time("ps")))
+            self.close()
+
+
+    def __open(self):
+    # Description: this function opens the VCD file and writes its header and the initial values of the signals.
+    # Parameters: None.
+    # Returns: None.
+
+        self.selected = self.handles()
+        self.codes = [self.__code(index) for index in range(len(self.selected))]
+
+        os.makedirs(os.path.dirname(self.file_name) or ".", exist_ok=True)
+        self.file = open(self.file_name, "w", buffering=1 << 20)
+        atexit.register(self.close)
+
+        # Writes the header, with a wire for every signal
+        self.file.write("$date %s $end\n$version cocotb wave_policy $end\n$timescale 1ps $end\n" % time.ctime())
+        self.file.write("$scope module %s $end\n" % self.dut._name)
+        for code, (name, handle) in zip(self.codes, self.selected):
+            self.file.write("$var wire %i %s %s $end\n" % (len(handle.value.binstr), code, name))
+        self.file.write("$upscope $end\n$enddefinitions $end\n")
+
+        # Writes the values at the start of the window
+        self.file.write("#%i\n$dumpvars\n" % round(get_sim_time("ps")))
+        self.time = round(get_sim_time("ps"))
+        for code, (_, handle) in zip(self.codes, self.selected):
+            self.file.write(self.__change(code, handle))
+        self.file.write("$end\n")
+
+
+    async def __watch(self, handle, code):
+    # Description: this function writes every value change of a signal.
+    # Parameters: handle: the signal handle; code: its VCD identifier.
+    # Returns: None.
+
+        edge = Edge(handle)
+        while True:
+
+            await edge
+
+            # Writes the time of the first change of every time step
+            now = round(get_sim_time("ps"))
+            if now != self.time:
+                self.file.write("#%i\n" % now)
+                self.time = now
+
+            self.file.write(self.__change(code, handle))
+
+
+    def close(self):
+    # Description: this function stops watching the signals and closes the VCD file. It is also called at exit, when the window lasts until the end of the simulation.
+    # Parameters: None.
+    # Returns: None.
+
+        for watcher in self.watchers:
+            watcher.kill()
+        self.watchers = []
+
+        if self.file is not None and not self.file.closed:
+            self.file.close()
+
+
+    @staticmethod
+    def __code(index):
+    # Description: this function obtains the VCD identifier of a signal, in base 94 of the printable characters.
+    # Parameters: index: index of the signal.
+    # Returns: The identifier.
+
+        code = ""
+        while True:
+            code += chr(VCD_FIRST_IDENTIFIER + index % 94)
+            index //= 94
+            if not index:
+                return code
+
+
+    @staticmethod
+    def __change(code, handle):
+    # Description: this function formats the value change of a signal.
+    # Parameters: code: the VCD identifier of the signal; handle: the signal handle.
+    # Returns: The VCD value change line.
+
+        value = handle.value.binstr.translate(VCD_VALUES)
+        return "%s%s\n" % (value, code) if len(value) == 1 else "b%s %s\n" % (value, code)
+
+##########################################################################################################################################################################
@@ -0,0 +1,566 @@
+##########################################################################################################################################################################
+# wave_reader.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the streaming waveform readers used by the offline checker. The files are memory-mapped and decoded incrementally, one time step
+# (VCD) or one value change block (FST) at a time, so a long run is never loaded whole into memory. Only the requested signals are decoded.
+# The simulation.ghw files written by nvc (--wave) are FST files, whatever their extension, optionally wrapped in gzip, which is decompressed into a temporary
+# file before being mapped. GHDL's own GHW format is not supported: the GHDL flows write VCD (--vcd).
+# Every reader yields (time, changes) tuples, time in units of time_unit seconds and changes a list of (signal name, value) pairs, the names being in lower case
+# and relative to the toplevel, and the values being VCD strings (MSB first, with 0, 1, x and z).
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import gzip
+import mmap
+import re
+import shutil
+import struct
+import tempfile
+import zlib
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant mapping the std_logic values to the VCD ones
+VCD_VALUES = str.maketrans("UXWLH-Zuxwlhz", "xxx01xzxxx01z")
+
+## Constants for the VCD time units
+VCD_TIME_UNITS = {"s": 1, "ms": 1e-3, "us": 1e-6, "ns": 1e-9, "ps": 1e-12, "fs": 1e-15}
+
+## Constant for the signal names, without the range of the vectors
+SIGNAL_NAME_PATTERN = re.compile(r"^([^\[\s]+)")
+
+## Constants for the FST block types
+FST_BL_HDR, FST_BL_VCDATA, FST_BL_BLACKOUT, FST_BL_GEOM, FST_BL_HIER, FST_BL_VCDATA_DYN_ALIAS = 0, 1, 2, 3, 4, 5
+FST_BL_HIER_LZ4, FST_BL_HIER_LZ4DUO, FST_BL_VCDATA_DYN_ALIAS2, FST_BL_ZWRAPPER, FST_BL_SKIP = 6, 7, 8, 254, 255
+
+## Constants for the FST hierarchy tags
+FST_ST_GEN_ATTRBEGIN, FST_ST_GEN_ATTREND, FST_ST_VCD_SCOPE, FST_ST_VCD_UPSCOPE = 252, 253, 254, 255
+
+## Constant for the FST values of the non-binary single bit changes
+FST_NON_BINARY_VALUES = "xzhuwl-?"
+
+## Constant for the size of the blocks decompressed from a gzip-wrapped FST file
+DECOMPRESS_BLOCK_SIZE = 1 << 20
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Functions
+
+def signal_name(name):
+# Description: this function obtains the name of a signal without the range of a vector (count[3:0] is count), in lower case as VHDL names are case-insensitive
+# (nvc writes them in lower case).
+# Parameters: name: the name in the waveform file.
+# Returns: The signal name.
+
+    return SIGNAL_NAME_PATTERN.match(name).group(1).lower()
+
+
+def read_varint(data, position):
+# Description: this function reads an unsigned LEB128 integer, as written by the FST writer.
+# Parameters: data: the buffer; position: the position of the integer.
+# Returns: A tuple with the integer and the position after it.
+
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            return value, position
+
+
+def read_svarint(data, position):
+# Description: this function reads a signed LEB128 integer, as written by the FST writer.
+# Parameters: data: the buffer; position: the position of the integer.
+# Returns: A tuple with the integer and the position after it.
+
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            if byte & 0x40:
+                value -= 1 << shift
+            return value, position
+
+
+def read_cstring(data, position):
+# Description: this function reads a null-terminated string.
+# Parameters: data: the buffer; position: the position of the string.
+# Returns: A tuple with the string and the position after its terminator.
+
+    end = data.index(b"\0", position)
+    return bytes(data[position:end]).decode(errors="replace"), end + 1
+
+
+def open_wave(path, signals=None):
+# Description: this function opens a waveform file with the reader of its format.
+# Parameters: path: path to the file; signals: names of the toplevel signals to be decoded, default is every one.
+# Returns: The reader.
+
+    with open(path, "rb") as wave_file:
+        magic = wave_file.read(8)
+
+    assert not magic.startswith(b"GHDLwav"), "%s is a GHDL GHW file, which is not supported: run GHDL with --vcd" % path
+
+    if magic[:1] in (bytes([FST_BL_HDR]), bytes([FST_BL_ZWRAPPER])):
+        return fst_reader(path, signals)
+
+    return vcd_reader(path, signals)
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# VCD reader
+
+class vcd_reader:
+# Description: this class contains the VCD reader. The file is mapped and read line by line, the value changes of every time step being yielded at the next
+# timestamp.
+
+    def __init__(self, path, signals=None):
+    # Description: this function maps the file and parses its header.
+    # Parameters: path: path to the file; signals: names of the toplevel signals to be decoded, default is every one.
+    # Returns: None.
+
+        self.path = path
+        self.scope = None
+        self.time_unit = 1e-12
+
+        with open(path, "rb") as wave_file:
+            self.map = mmap.mmap(wave_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Parses the declarations, mapping the identifier of every wanted signal to its names
+        self.codes = {}
+        scopes = []
+        tokens = []
+
+        for line in iter(self.map.readline, b""):
+
+            tokens += line.decode(errors="replace").split()
+            if not tokens or tokens[-1] != "$end":
+                continue
+
+            keyword, arguments, tokens = tokens[0], tokens[1:-1], []
+
+            if keyword == "$enddefinitions":
+                break
+            elif keyword == "$scope":
+                scopes.append(arguments[1])
+                self.scope = self.scope or arguments[1].lower()
+            elif keyword == "$upscope":
+                scopes.pop()
+            elif keyword == "$timescale":
+                timescale = "".join(arguments)
+                self.time_unit = float(timescale.rstrip("munpfs") or 1) * VCD_TIME_UNITS[timescale.lstrip("0123456789.")]
+            elif keyword == "$var":
+                name = ".".join(scopes[1:] + [signal_name(arguments[3])]).lower()
+                if signals is None or name in signals:
+                    self.codes.setdefault(arguments[2], []).append(name)
+
+        self.signals = sorted(name for names in self.codes.values() for name in names)
+        self.start = self.map.tell()
+
+
+    def select(self, signals):
+    # Description: this function restricts the decoded signals.
+    # Parameters: signals: names of the signals to be decoded.
+    # Returns: None.
+
+        self.codes = {code: [name for name in names if name in signals] for code, names in self.codes.items()}
+        self.codes = {code: names for code, names in self.codes.items() if names}
+        self.signals = sorted(name for names in self.codes.values() for name in names)
+
+
+    def steps(self):
+    # Description: this function decodes the value changes, one time step at a time.
+    # Parameters: None.
+    # Returns: A generator of (time, changes) tuples.
+
+        codes = self.codes
+        time = 0
+        changes = []
+        vector = None
+
+        self.map.seek(self.start)
+        for line in iter(self.map.readline, b""):
+            for token in line.split():
+
+                # Completes the change of a vector or real, whose identifier is the next token
+                if vector is not None:
+                    for name in codes.get(token.decode(), ()):
+                        changes.append((name, vector))
+                    vector = None
+
+                # Yields the changes of the previous time step at every timestamp
+                elif token[:1] == b"#":
+                    if changes:
+                        yield time, changes
+                        changes = []
+                    time = int(token[1:])
+
+                elif token[:1] in b"bBrR":
+                    vector = token[1:].decode().translate(VCD_VALUES)
+
+                elif token[:1] != b"$":
+                    for name in codes.get(token[1:].decode(), ()):
+                        changes.append((name, token[:1].decode().translate(VCD_VALUES)))
+
+        if changes:
+            yield time, changes
+
+
+    def close(self):
+    # Description: this function unmaps the file.
+    # Parameters: None.
+    # Returns: None.
+
+        self.map.close()
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# FST reader
+
+class fst_reader:
+# Description: this class contains the FST reader. The file is mapped and its blocks are indexed, then the value change blocks are decoded one at a time: the
+# frame with the values at the start of the block, the chain of changes of every wanted signal and the time table.
+
+    def __init__(self, path, signals=None):
+    # Description: this function maps the file, indexes its blocks and parses its header, geometry and hierarchy.
+    # Parameters: path: path to the file; signals: names of the toplevel signals to be decoded, default is every one.
+    # Returns: None.
+
+        self.path = path
+        self.temporary_file = None
+
+        # Maps the file, decompressing a gzip-wrapped file into a temporary file first
+        with open(path, "rb") as wave_file:
+
+            if wave_file.read(1) == bytes([FST_BL_ZWRAPPER]):
+                wave_file.seek(1 + 16)
+                self.temporary_file = tempfile.TemporaryFile()
+                with gzip.GzipFile(fileobj=wave_file) as gzip_file:
+                    shutil.copyfileobj(gzip_file, self.temporary_file, DECOMPRESS_BLOCK_SIZE)
+                self.temporary_file.flush()
+                self.map = mmap.mmap(self.temporary_file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self.map = mmap.mmap(wave_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Indexes the blocks, by their type and the position of their section (after the type)
+        self.blocks = []
+        position = 0
+        while position < len(self.map):
+            block_type = self.map[position]
+            section_length = struct.unpack_from(">Q", self.map, position + 1)[0]
+            self.blocks.append((block_type, position + 1, section_length))
+            position += 1 + section_length
+
+        # Parses the header, the geometry and the hierarchy
+        for block_type, position, section_length in self.blocks:
+            if block_type == FST_BL_HDR:
+                self.__parse_header(position)
+            elif block_type == FST_BL_GEOM:
+                self.__parse_geometry(position)
+            elif block_type in (FST_BL_HIER, FST_BL_HIER_LZ4, FST_BL_HIER_LZ4DUO):
+                assert block_type == FST_BL_HIER, "%s has an LZ4 compressed hierarchy, which is not supported" % path
+                self.__parse_hierarchy(position, signals)
+
+        self.signals = sorted(name for names in self.handles.values() for name in names)
+
+
+    def select(self, signals):
+    # Description: this function restricts the decoded signals, so the chains of the other ones are not decompressed.
+    # Parameters: signals: names of the signals to be decoded.
+    # Returns: None.
+
+        self.handles = {handle: [name for name in names if name in signals] for handle, names in self.handles.items()}
+        self.handles = {handle: names for handle, names in self.handles.items() if names}
+        self.signals = sorted(name for names in self.handles.values() for name in names)
+
+
+    def __parse_header(self, position):
+    # Description: this function parses the header block, obtaining the time unit.
+    # Parameters: position: position of the section.
+    # Returns: None.
+
+        self.time_unit = 10.0 ** struct.unpack_from(">b", self.map, position + 8 + 8 * 8)[0]
+
+
+    def __parse_geometry(self, position):
+    # Description: this function parses the geometry block, obtaining the length of every handle (0 for reals).
+    # Parameters: position: position of the section.
+    # Returns: None.
+
+        # The section holds its length, the uncompressed length and the maximum handle, followed by the lengths, stored as is when compression does not shrink them
+        section_length, uncompressed_length, _ = struct.unpack_from(">QQQ", self.map, position)
+        data = self.map[position + 24:position + section_length]
+        if section_length - 24 != uncompressed_length:
+            data = zlib.decompress(data)
+
+        self.lengths = [0]
+        position = 0
+        while position < len(data):
+            length, position = read_varint(data, position)
+            self.lengths.append(length)
+
+
+    def __parse_hierarchy(self, position, signals):
+    # Description: this function parses the gzip compressed hierarchy block, mapping the handle of every wanted signal to its names. Aliases (several variables
+    # with the same values, as a port and the register driving it) share a handle.
+    # Parameters: position: position of the section; signals: names of the toplevel signals to be decoded, default is every one.
+    # Returns: None.
+
+        section_length = struct.unpack_from(">Q", self.map, position)[0]
+        data = gzip.decompress(self.map[position + 16:position + section_length])
+
+        self.scope = None
+        self.handles = {}
+        scopes = []
+        handle_count = 0
+        position = 0
+
+        while position < len(data):
+
+            tag = data[position]
+            position += 1
+
+            if tag == FST_ST_VCD_SCOPE:
+                name, position = read_cstring(data, position + 1)
+                _, position = read_cstring(data, position)
+                scopes.append(name)
+                self.scope = self.scope or name.lower()
+
+            elif tag == FST_ST_VCD_UPSCOPE:
+                scopes.pop()
+
+            elif tag == FST_ST_GEN_ATTRBEGIN:
+                _, position = read_cstring(data, position + 2)
+                _, position = read_varint(data, position)
+
+            elif tag == FST_ST_GEN_ATTREND:
+                pass
+
+            # Variable: direction, name, length and alias
+            else:
+                name, position = read_cstring(data, position + 1)
+                _, position = read_varint(data, position)
+                alias, position = read_varint(data, position)
+
+                if not alias:
+                    handle_count += 1
+                    alias = handle_count
+
+                name = ".".join(scopes[1:] + [signal_name(name)]).lower()
+                if signals is None or name in signals:
+                    self.handles.setdefault(alias, []).append(name)
+
+
+    def steps(self):
+    # Description: this function decodes the value changes, one value change block at a time.
+    # Parameters: None.
+    # Returns: A generator of (time, changes) tuples.
+
+        first_block = True
+        for block_type, position, section_length in self.blocks:
+
+            if block_type in (FST_BL_VCDATA, FST_BL_VCDATA_DYN_ALIAS, FST_BL_VCDATA_DYN_ALIAS2):
+                assert block_type != FST_BL_VCDATA_DYN_ALIAS, "%s has dynamic alias value change blocks, which are not supported" % self.path
+                yield from self.__block_steps(block_type, position, section_length, first_block)
+                first_block = False
+
+
+    def __block_steps(self, block_type, position, section_length, first_block):
+    # Description: this function decodes a value change block.
+    # Parameters: block_type: the block type; position, section_length: position and length of the section; first_block: yields the frame of the first block.
+    # Returns: A generator of (time, changes) tuples.
+
+        data = self.map
+        end = position + section_length
+        start_time = struct.unpack_from(">Q", data, position + 8)[0]
+
+        # Decodes the frame, with the values at the start of the block
+        frame_uncompressed_length, cursor = read_varint(data, position + 32)
+        frame_compressed_length, cursor = read_varint(data, cursor)
+        _, cursor = read_varint(data, cursor)
+        frame = data[cursor:cursor + frame_compressed_length]
+        if frame_compressed_length != frame_uncompressed_length:
+            frame = zlib.decompress(frame)
+        cursor += frame_compressed_length
+
+        # Obtains the pack type of the chains, whose positions are relative to it
+        _, cursor = read_varint(data, cursor)
+        chains_start = cursor
+        pack_type = chr(data[cursor])
+        assert pack_type == "Z" or pack_type == "!", "%s has %s compressed value changes, only zlib is supported" % (self.path, pack_type)
+
+        # Decodes the time table, at the end of the block
+        time_uncompressed_length, time_compressed_length, time_count = struct.unpack_from(">QQQ", data, end - 24)
+        time_data = data[end - 24 - time_compressed_length:end - 24]
+        if time_compressed_length != time_uncompressed_length:
+            time_data = zlib.decompress(time_data)
+
+        times = []
+        time = cursor = 0
+        for _ in range(time_count):
+            delta, cursor = read_varint(time_data, cursor)
+            time += delta
+            times.append(time)
+
+        # Decodes the positions of the chains, before the time table
+        table_end = end - 24 - time_compressed_length - 8
+        table_length = struct.unpack_from(">Q", data, table_end)[0]
+        chains = self.__chain_table(block_type, table_end - table_length, table_end, chains_start)
+
+        # Decodes the chain of every wanted signal, grouping its changes by time index
+        steps = {}
+        if first_block:
+            offsets = [0]
+            for length in self.lengths[1:]:
+                offsets.append(offsets[-1] + (length or 8))
+            steps[-1] = [(name, bytes(frame[offsets[handle - 1]:offsets[handle - 1] + self.lengths[handle]]).decode().translate(VCD_VALUES))
+                         for handle, names in self.handles.items() for name in names]
+
+        for handle, names in self.handles.items():
+
+            if handle - 1 >= len(chains) or not chains[handle - 1][1]:
+                continue
+
+            chain_position, chain_length = chains[handle - 1]
+            for time_index, value in self.__chain_changes(chain_position, chain_length, self.lengths[handle]):
+                steps.setdefault(time_index, []).extend((name, value) for name in names)
+
+        # Yields the steps in time order, the frame being merged into the changes at the start time
+        if -1 in steps and times and times[0] == start_time and 0 in steps:
+            steps[0] = steps.pop(-1) + steps[0]
+
+        for time_index in sorted(steps):
+            yield (start_time if time_index < 0 else times[time_index]), steps[time_index]
+
+
+    def __chain_table(self, block_type, table_start, table_end, chains_start):
+    # Description: this function decodes the position table of a value change block, with the position and length of the chain of every handle (0 when the
+    # handle has no changes in the block).
+    # Parameters: block_type: the block type; table_start, table_end: position of the table; chains_start: position the chain positions are relative to.
+    # Returns: A list with the (position, length) tuple of every handle, the position being absolute.
+
+        data = self.map
+        positions, lengths = [], []
+        value = previous_index = previous_alias = 0
+        cursor = table_start
+
+        while cursor < table_end:
+
+            # Alias table: odd entries are signed position deltas (negative ones alias a previous handle), even ones are runs of handles without changes
+            if block_type == FST_BL_VCDATA_DYN_ALIAS2 and data[cursor] & 1:
+
+                shifted, cursor = read_svarint(data, cursor)
+                shifted >>= 1
+
+                if shifted > 0:
+                    value += shifted
+                    if positions:
+                        lengths[previous_index] = value - positions[previous_index]
+                    previous_index = len(positions)
+                    positions.append(value)
+                    lengths.append(0)
+                else:
+                    previous_alias = shifted or previous_alias
+                    positions.append(0)
+                    lengths.append(previous_alias)
+
+            else:
+
+                entry, cursor = read_varint(data, cursor)
+
+                if block_type != FST_BL_VCDATA_DYN_ALIAS2 and entry & 1:
+                    value += entry >> 1
+                    if positions:
+                        lengths[previous_index] = value - positions[previous_index]
+                    previous_index = len(positions)
+                    positions.append(value)
+                    lengths.append(0)
+                else:
+                    positions += [0] * (entry >> 1)
+                    lengths += [0] * (entry >> 1)
+
+        # The last chain ends at the position table
+        if positions:
+            lengths[previous_index] = (table_start - chains_start) - positions[previous_index]
+
+        # Resolves the aliases, which point to the handle they repeat
+        chains = []
+        for position, length in zip(positions, lengths):
+            if length < 0:
+                position, length = chains[-length - 1]
+            elif length:
+                position += chains_start
+            chains.append((position, length))
+
+        return chains
+
+
+    def __chain_changes(self, position, length, signal_length):
+    # Description: this function decodes the chain of changes of a handle.
+    # Parameters: position, length: position and length of the chain; signal_length: number of bits of the handle.
+    # Returns: A generator of (time index, value) tuples.
+
+        # Decompresses the chain, whose uncompressed length is 0 when it is stored as is
+        uncompressed_length, cursor = read_varint(self.map, position)
+        chain = self.map[cursor:position + length]
+        if uncompressed_length:
+            chain = zlib.decompress(chain)
+
+        time_index = cursor = 0
+        byte_count = (signal_length + 7) // 8
+
+        while cursor < len(chain):
+
+            entry, cursor = read_varint(chain, cursor)
+
+            # Single bits: binary values in 2 bits, the other ones in 4
+            if signal_length == 1:
+                if entry & 1:
+                    time_index += entry >> 4
+                    value = FST_NON_BINARY_VALUES[(entry >> 1) & 7].translate(VCD_VALUES)
+                else:
+                    time_index += entry >> 2
+                    value = "1" if entry & 2 else "0"
+
+            # Vectors: one character per bit, or the bits packed MSB first
+            else:
+                time_index += entry >> 1
+                if entry & 1:
+                    value = bytes(chain[cursor:cursor + signal_length]).decode().translate(VCD_VALUES)
+                    cursor += signal_length
+                else:
+                    value = format(int.from_bytes(chain[cursor:cursor + byte_count], "big") >> (8 * byte_count - signal_length), "0%ib" % signal_length)
+                    cursor += byte_count
+
+            yield time_index, value
+
+
+    def close(self):
+    # Description: this function unmaps the file and removes the temporary file.
+    # Parameters: None.
+    # Returns: None.
+
+        self.map.close()
+        if self.temporary_file is not None:
+            self.temporary_file.close()
+
+##########################################################################################################################################################################
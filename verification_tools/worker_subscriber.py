@@ -0,0 +1,124 @@
+##########################################################################################################################################################################
+# worker_subscriber.py
+# Authors: Luiz H. A. Santos.
+# Date: 18/10/2026.
+# Desc: this file contains the worker subscriber of the pyuvm testbenches. Its write only pushes the transaction into a queue, and the reference model and the
+# comparison (check) run on a worker thread, overlapping with the simulation instead of stalling it on every transaction. The check phase waits for the worker to
+# drain the queue and fails the test on the first mismatch it reported; in the fail fast mode, the mismatch also fails the test from the next write, during the
+# simulation.
+# The check runs outside the simulator thread, so it must not access the DUT nor log through the cocotb loggers, which read the simulation time: it returns the
+# mismatch message instead, logged by the check phase.
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Libraries
+
+import queue
+import threading
+from pyuvm import error_classes, uvm_subscriber
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Constants
+
+## Constant for the default fail fast mode: when True, a mismatch reported by the worker fails the test from the next transaction written
+WORKER_FAIL_FAST = True
+
+## Constant marking the end of the transactions in the queue
+WORKER_STOP = object()
+
+##########################################################################################################################################################################
+
+
+##########################################################################################################################################################################
+# Worker subscriber class
+
+class worker_subscriber(uvm_subscriber):
+# Description: this class contains a subscriber whose transactions are checked by a worker thread. The check of every transaction must be overridden.
+
+    def __init__(self, name, parent, fail_fast=WORKER_FAIL_FAST):
+    # Description: this function initializes the subscriber, its queue and its results.
+    # Parameters: name, parent: as in uvm_subscriber; fail_fast: when True, a mismatch fails the test from the next write.
+    # Returns: None.
+
+        super().__init__(name, parent)
+
+        self.fail_fast = fail_fast
+        self.channel = queue.SimpleQueue()
+        self.worker = None
+        self.item_num = 0
+        self.checked_num = 0
+        self.failure = None
+
+
+    def write(self, item):
+    # Description: this function pushes a transaction into the queue of the worker, started on the first one.
+    # Parameters: item: the transaction.
+    # Returns: None.
+
+        # Fails the test as soon as the worker reported a mismatch, in the fail fast mode
+        if self.fail_fast and self.failure is not None:
+            assert False, self.failure
+
+        if self.worker is None:
+            self.worker = threading.Thread(target=self.__work, name=self.get_full_name(), daemon=True)
+            self.worker.start()
+
+        self.channel.put(item)
+        self.item_num += 1
+
+
+    def check(self, item):
+    # Description: this function checks a transaction, on the worker thread. It must be overridden, as the write of uvm_subscriber.
+    # Parameters: item: the transaction.
+    # Returns: None if the transaction matches the reference model, or the mismatch message.
+
+        raise error_classes.UVMFatalError("You must override the check() method in worker_subscriber %s" % self.get_full_name())
+
+
+    def __work(self):
+    # Description: this function checks the transactions of the queue, in order, until the end mark. The transactions after the first mismatch are not checked.
+    # Parameters: None.
+    # Returns: None.
+
+        while True:
+
+            item = self.channel.get()
+            if item is WORKER_STOP:
+                return
+
+            if self.failure is not None:
+                continue
+
+            # Checks the transaction, an exception of the reference model being reported as a mismatch, and a missing check as itself
+            try:
+                message = self.check(item)
+            except error_classes.UVMFatalError as exception:
+                self.failure = str(exception)
+                continue
+            except Exception as exception:
+                message = "The reference model raised %r" % exception
+
+            if message is not None:
+                self.failure = "Mismatch at item %i: %s" % (self.checked_num, message)
+            else:
+                self.checked_num += 1
+
+
+    def check_phase(self):
+    # Description: this function waits for the worker to check every transaction and fails the test on the first mismatch.
+    # Parameters: None.
+    # Returns: None.
+
+        if self.worker is not None:
+            self.channel.put(WORKER_STOP)
+            self.worker.join()
+
+        assert self.failure is None, self.failure
+
+        self.logger.info("[WORKER]: %i items checked, no mismatches found" % self.checked_num)
+
+##########################################################################################################################################################################